@@ -8,7 +8,7 @@ load_dotenv()
 
 from flask import Flask
 from config import Config
-from routes import main_bp, api_bp
+from routes import main_bp, api_bp, feeds_bp
 
 
 def create_app():
@@ -21,9 +21,31 @@ def create_app():
     os.makedirs(Config.DATA_DIR, exist_ok=True)
     os.makedirs(Config.LOG_DIR, exist_ok=True)
 
+    # 로깅 (큐 + 백그라운드 리스너, LOG_DIR/app.jsonl) 과 요청 ID / access 로그
+    from utils.logging_setup import init_logging
+    init_logging(app)
+
     # Blueprint 등록
     app.register_blueprint(main_bp)
     app.register_blueprint(api_bp)
+    app.register_blueprint(feeds_bp)
+
+    # 저장소 연결 + 과정 캐시 예열 (백그라운드, /api/ready 로 완료 확인)
+    from services import warmup
+    warmup.start()
+
+    # 업로드 임시 파일 정리 (TTL + 크기 quota, 백그라운드)
+    from services import upload_reaper
+    upload_reaper.start()
+
+    # 종료된 과정 자동 보관 (ARCHIVE_AFTER_DAYS, 백그라운드)
+    from services import archive_service
+    archive_service.start()
+
+    # 요청 프로파일링 (옵트인)
+    if Config.PROFILING_ENABLED:
+        from utils.profiling import init_profiling
+        init_profiling(app)
 
     # 보안 헤더
     @app.after_request
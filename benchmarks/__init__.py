@@ -0,0 +1,6 @@
+"""
+Timetable Dashboard - 성능 벤치마크
+
+저장소 루트에서 실행합니다:
+    python -m benchmarks.run --help
+"""
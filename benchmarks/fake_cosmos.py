@@ -0,0 +1,279 @@
+"""
+벤치마크용 인메모리 Cosmos DB 컨테이너 대체 구현
+
+CosmosStorage 가 사용하는 ContainerProxy 메서드와 아래 SQL 부분집합만 지원합니다.
+  SELECT * | SELECT c.a, c.b | SELECT VALUE c.a | SELECT DISTINCT VALUE c.a | SELECT VALUE COUNT(1)
+  FROM c [WHERE 조건 AND 조건 ...] [ORDER BY c.a [ASC|DESC]] [OFFSET n LIMIT m]
+  조건: c.field (=, !=, <, <=, >, >=) (@param | 'literal' | 숫자 | true | false)
+        ARRAY_CONTAINS(@param, c.field)
+
+`latency` 를 지정하면 호출마다 네트워크 왕복 지연을 흉내 내고,
+`calls` 카운터로 연산별 왕복 횟수를 집계합니다.
+AsyncFakeContainer 는 azure.cosmos.aio ContainerProxy 대체로, 지연을 asyncio.sleep 으로 기다립니다.
+"""
+import asyncio
+import re
+import time
+import uuid
+import threading
+from collections import Counter
+
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosResourceExistsError,
+    CosmosResourceNotFoundError,
+)
+
+_SELECT_RE = re.compile(
+    r'^SELECT\s+(?P<proj>.+?)\s+FROM\s+c'
+    r'(?:\s+WHERE\s+(?P<where>.+?))?'
+    r'(?:\s+ORDER\s+BY\s+(?P<order>.+?))?'
+    r'(?:\s+OFFSET\s+(?P<offset>\d+)\s+LIMIT\s+(?P<limit>\d+))?\s*$',
+    re.IGNORECASE | re.DOTALL,
+)
+_COND_RE = re.compile(r'^c\.(\w+)\s*(=|!=|<=|>=|<|>)\s*(.+)$')
+_ARRAY_CONTAINS_RE = re.compile(r'^ARRAY_CONTAINS\(\s*(@\w+)\s*,\s*c\.(\w+)\s*\)$', re.IGNORECASE)
+_AND_RE = re.compile(r'\s+AND\s+', re.IGNORECASE)
+
+_OPERATORS = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a is not None and a < b,
+    '<=': lambda a, b: a is not None and a <= b,
+    '>': lambda a, b: a is not None and a > b,
+    '>=': lambda a, b: a is not None and a >= b,
+}
+
+
+def _parse_value(token, params):
+    token = token.strip()
+    if token.startswith('@'):
+        return params[token]
+    if token.startswith("'") and token.endswith("'"):
+        return token[1:-1]
+    if token.lower() in ('true', 'false'):
+        return token.lower() == 'true'
+    return int(token)
+
+
+def _compile_where(where, params):
+    """WHERE 절 → 문서 판별 함수 리스트"""
+    predicates = []
+    if not where:
+        return predicates
+    for cond in _AND_RE.split(where.strip()):
+        cond = cond.strip()
+        m = _ARRAY_CONTAINS_RE.match(cond)
+        if m:
+            values, field = set(params[m.group(1)]), m.group(2)
+            predicates.append(lambda d, f=field, v=values: d.get(f) in v)
+            continue
+        m = _COND_RE.match(cond)
+        if not m:
+            raise ValueError(f"지원하지 않는 조건식: {cond}")
+        field, op, value = m.group(1), _OPERATORS[m.group(2)], _parse_value(m.group(3), params)
+        predicates.append(lambda d, f=field, o=op, v=value: o(d.get(f), v))
+    return predicates
+
+
+def _project(proj, docs):
+    proj = proj.strip()
+    upper = proj.upper()
+    if proj == '*':
+        return [dict(d) for d in docs]
+    if upper == 'VALUE COUNT(1)':
+        return [len(docs)]
+    if upper.startswith('DISTINCT VALUE C.'):
+        field = proj.split('.', 1)[1]
+        seen = []
+        for d in docs:
+            if field in d and d[field] not in seen:
+                seen.append(d[field])
+        return seen
+    if upper.startswith('VALUE C.'):
+        field = proj.split('.', 1)[1]
+        return [d[field] for d in docs if field in d]
+    fields = [p.strip().split('.', 1)[1] for p in proj.split(',')]
+    return [{f: d[f] for f in fields if f in d} for d in docs]
+
+
+class FakeContainer:
+    """azure.cosmos.ContainerProxy 의 인메모리 대체 (파티션 키: /type)"""
+
+    def __init__(self, latency=0.0, partition_key_field='type'):
+        self.latency = latency
+        self.calls = Counter()
+        self._pk_field = partition_key_field
+        self._items = {}  # (partition_key, id) -> doc
+        self._lock = threading.Lock()
+
+    # ---- 내부 유틸 ----
+
+    def _roundtrip(self, op):
+        self.calls[op] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    @staticmethod
+    def _item_id(item):
+        return item['id'] if isinstance(item, dict) else item
+
+    @staticmethod
+    def _stamp(doc):
+        doc['_etag'] = f'"{uuid.uuid4().hex}"'
+        doc['_ts'] = int(time.time())
+
+    @staticmethod
+    def _check_condition(doc, kwargs):
+        etag = kwargs.get('etag')
+        if etag and kwargs.get('match_condition') == MatchConditions.IfNotModified:
+            if doc.get('_etag') != etag:
+                raise CosmosAccessConditionFailedError(status_code=412, message="ETag 불일치")
+
+    def _get(self, item_id, partition_key):
+        doc = self._items.get((partition_key, item_id))
+        if doc is None:
+            raise CosmosResourceNotFoundError(status_code=404, message=f"{item_id} 없음")
+        return doc
+
+    # ---- ContainerProxy API ----
+
+    def create_item(self, body, **kwargs):
+        self._roundtrip('create_item')
+        key = (body.get(self._pk_field), body['id'])
+        with self._lock:
+            if key in self._items:
+                raise CosmosResourceExistsError(status_code=409, message=f"{body['id']} 중복")
+            doc = dict(body)
+            self._stamp(doc)
+            self._items[key] = doc
+            return dict(doc)
+
+    def upsert_item(self, body, **kwargs):
+        self._roundtrip('upsert_item')
+        with self._lock:
+            doc = dict(body)
+            self._stamp(doc)
+            self._items[(body.get(self._pk_field), body['id'])] = doc
+            return dict(doc)
+
+    def read_item(self, item, partition_key, **kwargs):
+        self._roundtrip('read_item')
+        with self._lock:
+            return dict(self._get(self._item_id(item), partition_key))
+
+    def replace_item(self, item, body, **kwargs):
+        self._roundtrip('replace_item')
+        key = (body.get(self._pk_field), self._item_id(item))
+        with self._lock:
+            current = self._get(key[1], key[0])
+            self._check_condition(current, kwargs)
+            doc = dict(body)
+            self._stamp(doc)
+            self._items[key] = doc
+            return dict(doc)
+
+    def patch_item(self, item, partition_key, patch_operations, **kwargs):
+        self._roundtrip('patch_item')
+        with self._lock:
+            current = self._get(self._item_id(item), partition_key)
+            self._check_condition(current, kwargs)
+            doc = dict(current)
+            for op in patch_operations:
+                field = op['path'].lstrip('/')
+                if op['op'] == 'incr':
+                    doc[field] = doc.get(field, 0) + op['value']
+                elif op['op'] == 'remove':
+                    doc.pop(field, None)
+                else:  # add / set / replace
+                    doc[field] = op['value']
+            self._stamp(doc)
+            self._items[(partition_key, doc['id'])] = doc
+            return dict(doc)
+
+    def delete_item(self, item, partition_key, **kwargs):
+        self._roundtrip('delete_item')
+        with self._lock:
+            current = self._get(self._item_id(item), partition_key)
+            self._check_condition(current, kwargs)
+            del self._items[(partition_key, current['id'])]
+
+    def query_items(self, query, parameters=None, partition_key=None,
+                    enable_cross_partition_query=None, max_item_count=None, **kwargs):
+        self._roundtrip('query_items')
+        m = _SELECT_RE.match(' '.join(query.split()))
+        if not m:
+            raise ValueError(f"지원하지 않는 쿼리: {query}")
+        params = {p['name']: p['value'] for p in (parameters or [])}
+        predicates = _compile_where(m.group('where'), params)
+
+        with self._lock:
+            docs = [
+                d for (pk, _), d in self._items.items()
+                if (partition_key is None or pk == partition_key)
+                and all(pred(d) for pred in predicates)
+            ]
+
+        if m.group('order'):
+            parts = m.group('order').split()
+            field = parts[0].split('.', 1)[1]
+            reverse = len(parts) > 1 and parts[1].upper() == 'DESC'
+            docs.sort(key=lambda d: (d.get(field) is not None, d.get(field)), reverse=reverse)
+        if m.group('limit') is not None:
+            offset = int(m.group('offset'))
+            docs = docs[offset:offset + int(m.group('limit'))]
+
+        return iter(_project(m.group('proj'), docs))
+
+    # ---- 벤치마크 보조 ----
+
+    def __len__(self):
+        return len(self._items)
+
+
+class AsyncFakeContainer:
+    """azure.cosmos.aio.ContainerProxy 의 인메모리 대체 (저장/쿼리는 FakeContainer 에 위임)"""
+
+    def __init__(self, latency=0.0, partition_key_field='type'):
+        self.latency = latency
+        self.sync = FakeContainer(partition_key_field=partition_key_field)
+        self.calls = self.sync.calls
+
+    async def _roundtrip(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def create_item(self, body, **kwargs):
+        await self._roundtrip()
+        return self.sync.create_item(body, **kwargs)
+
+    async def upsert_item(self, body, **kwargs):
+        await self._roundtrip()
+        return self.sync.upsert_item(body, **kwargs)
+
+    async def read_item(self, item, partition_key, **kwargs):
+        await self._roundtrip()
+        return self.sync.read_item(item, partition_key, **kwargs)
+
+    async def replace_item(self, item, body, **kwargs):
+        await self._roundtrip()
+        return self.sync.replace_item(item, body, **kwargs)
+
+    async def patch_item(self, item, partition_key, patch_operations, **kwargs):
+        await self._roundtrip()
+        return self.sync.patch_item(item, partition_key, patch_operations, **kwargs)
+
+    async def delete_item(self, item, partition_key, **kwargs):
+        await self._roundtrip()
+        return self.sync.delete_item(item, partition_key, **kwargs)
+
+    def query_items(self, query, parameters=None, partition_key=None, **kwargs):
+        async def results():
+            await self._roundtrip()
+            for doc in self.sync.query_items(query, parameters=parameters, partition_key=partition_key, **kwargs):
+                yield doc
+        return results()
+
+    def __len__(self):
+        return len(self.sync)
@@ -0,0 +1,368 @@
+"""
+HTTP 부하 테스트 하네스
+
+app.py 의 실제 `app` 을 waitress 또는 gunicorn 으로 띄우고(시드된 임시 로컬 저장소 사용),
+대시보드 사용 패턴을 재현하는 요청을 동시성 단계별로 보냅니다.
+
+시나리오 (가중치는 --mix 로 조정):
+  page   : GET /api/events + /api/courses + /api/stats (대시보드 로드)
+  edit   : PUT /api/courses/:id/entries/:entryId (일정 수정)
+  upload : POST /api/sheets → POST /api/upload → DELETE /api/courses/:id (엑셀 업로드, 정리 포함)
+
+사용법:
+    python -m benchmarks.loadtest --server waitress --threads 8 --concurrency 1,8,32 --duration 20
+    python -m benchmarks.loadtest --server gunicorn --workers 4 --threads 4 --output load.json
+    python -m benchmarks.loadtest --url http://localhost:5000 --concurrency 16   # 이미 떠 있는 서버
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import shutil
+import socket
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import http.client
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlparse
+
+from benchmarks.synthetic import generate_courses, generate_entries, write_vertex42_workbook
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MIX = 'page=80,edit=15,upload=5'
+
+
+# ===== 서버 기동 =====
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def seed_data_dir(data_dir, n_courses, n_entries, seed):
+    """임시 DATA_DIR 에 합성 과정 저장 (앱과 같은 저장소 구현 사용)"""
+    os.environ['DATA_DIR'] = data_dir
+    os.environ['COSMOS_DB_ENDPOINT'] = ''
+    os.environ['COSMOS_DB_KEY'] = ''
+    from services.cosmos_service import get_storage
+    storage = get_storage()
+    for course, entries in generate_courses(n_courses, n_entries, seed=seed):
+        storage.save_course(course, entries)
+
+
+def start_server(kind, port, data_dir, threads, workers):
+    env = dict(
+        os.environ,
+        DATA_DIR=data_dir,
+        LOG_DIR=os.path.join(data_dir, 'logs'),
+        COSMOS_DB_ENDPOINT='',
+        COSMOS_DB_KEY='',
+        FLASK_ENV='production',
+    )
+    if kind == 'waitress':
+        cmd = [sys.executable, '-m', 'waitress', '--host=127.0.0.1', f'--port={port}',
+               f'--threads={threads}', 'app:app']
+    elif kind == 'gunicorn':
+        cmd = [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+               '--workers', str(workers), '--threads', str(threads), '--timeout', '600', 'app:app']
+    else:
+        raise ValueError(f"알 수 없는 서버 종류: {kind}")
+    # stderr 는 파일로: 요청마다 access 로그가 찍히므로 파이프로 받으면 버퍼가 차서 서버 로깅이 멈춤
+    stderr_path = os.path.join(data_dir, 'server.stderr.log')
+    with open(stderr_path, 'wb') as stderr:
+        proc = subprocess.Popen(cmd, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=stderr)
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            with open(stderr_path, 'rb') as f:
+                raise RuntimeError(f"서버 기동 실패:\n{f.read().decode(errors='replace')}")
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/api/courses')
+            if conn.getresponse().status == 200:
+                conn.close()
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("서버가 30초 안에 응답하지 않았습니다.")
+
+
+# ===== 클라이언트 =====
+
+class Recorder:
+    """연산별 지연시간/오류 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.scenarios = defaultdict(list)
+
+    def record(self, op, elapsed, ok):
+        with self._lock:
+            self.latencies[op].append(elapsed)
+            if not ok:
+                self.errors[op] += 1
+
+    def record_scenario(self, name, elapsed):
+        with self._lock:
+            self.scenarios[name].append(elapsed)
+
+
+class Client:
+    """워커 스레드당 하나의 keep-alive 연결"""
+
+    def __init__(self, base_url, recorder):
+        parsed = urlparse(base_url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.recorder = recorder
+        self.conn = None
+
+    def request(self, op, method, path, body=None, headers=None):
+        start = time.perf_counter()
+        status, data = 0, b''
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            self.conn.request(method, path, body=body, headers=headers or {})
+            resp = self.conn.getresponse()
+            status, data = resp.status, resp.read()
+        except (OSError, http.client.HTTPException):
+            if self.conn:
+                self.conn.close()
+            self.conn = None
+        self.recorder.record(op, time.perf_counter() - start, 200 <= status < 400)
+        return status, data
+
+    def json(self, op, method, path, payload):
+        return self.request(op, method, path, json.dumps(payload).encode('utf-8'),
+                            {'Content-Type': 'application/json'})
+
+
+def _multipart(field, filename, content):
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        'Content-Type: application/vnd.openxmlformats-officedocument.spreadsheetml.sheet\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return body, {'Content-Type': f'multipart/form-data; boundary={boundary}'}
+
+
+class Scenarios:
+    def __init__(self, targets, workbook_bytes):
+        self.targets = targets  # [(course_id, entry_id, entry)]
+        self.workbook_bytes = workbook_bytes
+
+    def page(self, client, rng):
+        client.request('GET /api/events', 'GET', '/api/events')
+        client.request('GET /api/courses', 'GET', '/api/courses')
+        client.request('GET /api/stats', 'GET', '/api/stats')
+
+    def edit(self, client, rng):
+        course_id, entry_id, entry = rng.choice(self.targets)
+        payload = dict(entry, hours=rng.choice([4, 8, 9, 10]))
+        client.json('PUT entry', 'PUT', f'/api/courses/{course_id}/entries/{entry_id}', payload)
+
+    def upload(self, client, rng):
+        body, headers = _multipart('file', 'loadtest.xlsx', self.workbook_bytes)
+        status, data = client.request('POST /api/sheets', 'POST', '/api/sheets', body, headers)
+        if status != 200:
+            return
+        sheets = json.loads(data)
+        status, data = client.json('POST /api/upload', 'POST', '/api/upload', {
+            "filepath": sheets["filepath"],
+            "sheets": sheets["sheets"],
+            "course_name": f"부하테스트 {rng.randrange(10 ** 6)}",
+            "color": "#4A90D9",
+            "start_time": "09:00",
+        })
+        if status == 200:
+            course_id = json.loads(data)["course_id"]
+            client.request('DELETE course', 'DELETE', f'/api/courses/{course_id}')
+
+
+def _parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in ('page', 'edit', 'upload'):
+            raise ValueError(f"알 수 없는 시나리오: {name}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def _load_targets(base_url, limit=500):
+    recorder = Recorder()
+    status, data = Client(base_url, recorder).request('setup', 'GET', '/api/events')
+    if status != 200:
+        raise RuntimeError("/api/events 조회 실패")
+    targets = []
+    for event in json.loads(data):
+        props = event.get('extendedProps', {})
+        if props.get('is_holiday') or not props.get('entry_id'):
+            continue
+        date, start = event['start'].split('T')
+        targets.append((props['course_id'], props['entry_id'], {
+            "date": date,
+            "class_name": event['title'].split(') ', 1)[-1],
+            "instructor": props.get('instructor', ''),
+            "hours": props.get('hours', 8),
+            "start_time": start[:5],
+            "is_holiday": False,
+        }))
+        if len(targets) >= limit:
+            break
+    return targets
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return round(sorted_values[idx] * 1000, 2)
+
+
+def _summarize(values, errors=0):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "error_rate": round(errors / len(values), 4) if values else 0.0,
+        "p50_ms": _percentile(values, 50),
+        "p95_ms": _percentile(values, 95),
+        "p99_ms": _percentile(values, 99),
+        "max_ms": round(values[-1] * 1000, 2) if values else None,
+    }
+
+
+def run_level(base_url, scenarios, mix, concurrency, duration, seed):
+    recorder = Recorder()
+    names, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    def worker(idx):
+        rng = random.Random(seed * 1000 + idx)
+        client = Client(base_url, recorder)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            getattr(scenarios, name)(client, rng)
+            recorder.record_scenario(name, time.perf_counter() - start)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [v for values in recorder.latencies.values() for v in values]
+    total_errors = sum(recorder.errors.values())
+    return {
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "requests": len(all_latencies),
+        "throughput_rps": round(len(all_latencies) / elapsed, 2),
+        "overall": _summarize(all_latencies, total_errors),
+        "operations": {op: _summarize(v, recorder.errors[op]) for op, v in sorted(recorder.latencies.items())},
+        "scenarios": {
+            name: dict(_summarize(v), per_second=round(len(v) / elapsed, 2))
+            for name, v in sorted(recorder.scenarios.items())
+        },
+    }
+
+
+def _print_level(result):
+    o = result["overall"]
+    print(f"\n동시성 {result['concurrency']:>3} | {result['throughput_rps']:>8.1f} req/s | "
+          f"p50 {o['p50_ms']} / p95 {o['p95_ms']} / p99 {o['p99_ms']} ms | 오류율 {o['error_rate']:.2%}")
+    for op, s in result["operations"].items():
+        print(f"    {op:<20} n={s['count']:<6} p50 {s['p50_ms']:>8} p95 {s['p95_ms']:>8} "
+              f"p99 {s['p99_ms']:>8} ms  오류 {s['errors']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Timetable API 부하 테스트')
+    parser.add_argument('--server', choices=['waitress', 'gunicorn'], default='waitress')
+    parser.add_argument('--url', help='이미 실행 중인 서버 URL (지정 시 서버를 띄우지 않음)')
+    parser.add_argument('--threads', type=int, default=4, help='서버 스레드 수 (waitress/gunicorn)')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn 워커 프로세스 수')
+    parser.add_argument('--concurrency', default='1,4,16', help='동시 사용자 수 단계 (쉼표 구분)')
+    parser.add_argument('--duration', type=float, default=15, help='단계별 측정 시간(초)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'시나리오 가중치 (기본 {DEFAULT_MIX})')
+    parser.add_argument('--courses', type=int, default=20)
+    parser.add_argument('--entries', type=int, default=250)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    mix = _parse_mix(args.mix)
+    levels = [int(c) for c in args.concurrency.split(',')]
+    workdir = tempfile.mkdtemp(prefix='timetable_load_')
+    proc = None
+    try:
+        workbook_path = os.path.join(workdir, 'upload.xlsx')
+        write_vertex42_workbook(workbook_path, generate_entries(120))
+        with open(workbook_path, 'rb') as f:
+            workbook_bytes = f.read()
+
+        if args.url:
+            base_url = args.url.rstrip('/')
+        else:
+            data_dir = os.path.join(workdir, 'data')
+            print(f"시드 데이터 생성: {args.courses}과정 × {args.entries}일정")
+            seed_data_dir(data_dir, args.courses, args.entries, args.seed)
+            port = _free_port()
+            proc = start_server(args.server, port, data_dir, args.threads, args.workers)
+            base_url = f'http://127.0.0.1:{port}'
+            print(f"{args.server} 기동: {base_url} (threads={args.threads}"
+                  f"{f', workers={args.workers}' if args.server == 'gunicorn' else ''})")
+
+        scenarios = Scenarios(_load_targets(base_url), workbook_bytes)
+        results = []
+        for concurrency in levels:
+            result = run_level(base_url, scenarios, mix, concurrency, args.duration, args.seed)
+            _print_level(result)
+            results.append(result)
+    finally:
+        if proc:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "server": 'external' if args.url else args.server,
+                "threads": args.threads,
+                "workers": args.workers if args.server == 'gunicorn' else 1,
+                "mix": mix,
+                "courses": args.courses,
+                "entries_per_course": args.entries,
+                "python": platform.python_version(),
+            },
+            "levels": results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
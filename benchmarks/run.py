@@ -0,0 +1,341 @@
+"""
+핫패스 벤치마크 실행기
+
+사용법:
+    python -m benchmarks.run                                   # 기본 규모 (20과정 × 250일정)
+    python -m benchmarks.run --courses 100 --entries 250 --output bench.json
+    python -m benchmarks.run --filter cosmos --repeat 10
+    python -m benchmarks.run --filter cosmos --latency 5         # Cosmos 왕복마다 5ms 지연 주입
+    python -m benchmarks.run --compare baseline.json --threshold 0.15
+
+결과는 JSON 으로 저장되며, --compare 로 이전 결과와 비교해 중앙값이
+threshold 비율 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+
+from benchmarks.fake_cosmos import AsyncFakeContainer, FakeContainer
+from benchmarks.synthetic import generate_courses, write_vertex42_workbook
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """벤치마크 등록 데코레이터
+
+    등록 함수는 ctx 를 받아 `run` 또는 `(setup, run)` 을 반환합니다.
+    setup 이 있으면 반복마다 setup() 결과를 run(arg) 에 전달하고, run 만 시간을 잽니다.
+    """
+    def decorator(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return decorator
+
+
+class Context:
+    """벤치마크 공용 데이터셋과 임시 디렉토리"""
+
+    def __init__(self, n_courses, n_entries, seed, latency=0.0):
+        self.latency = latency  # 가짜 Cosmos 왕복 지연 (초, 데이터 적재 후 적용)
+        self.n_courses = n_courses
+        self.n_entries = n_entries
+        self.dataset = generate_courses(n_courses, n_entries, seed=seed)
+        self.tmpdir = tempfile.mkdtemp(prefix='timetable_bench_')
+        self.container = None
+
+    def copy_dataset(self):
+        return [(dict(course), [dict(e) for e in entries]) for course, entries in self.dataset]
+
+    def new_local_storage(self, seeded=True):
+        from services.cosmos_service import LocalJsonStorage
+        path = os.path.join(tempfile.mkdtemp(dir=self.tmpdir), 'courses.json')
+        storage = LocalJsonStorage(filepath=path)
+        if seeded:
+            for course, entries in self.copy_dataset():
+                storage.save_course(course, entries)
+        return storage
+
+    def new_cosmos_storage(self, seeded=True):
+        from services.cosmos_service import CosmosStorage
+        self.container = FakeContainer()
+        storage = CosmosStorage(container=self.container)
+        if seeded:
+            for course, entries in self.copy_dataset():
+                storage.save_course(course, entries)
+        self.container.latency = self.latency
+        return storage
+
+    def new_async_cosmos_storage(self, seeded=True):
+        from services.async_cosmos_storage import AsyncCosmosStorage
+        self.container = AsyncFakeContainer()
+        storage = AsyncCosmosStorage(container=self.container)
+        if seeded:
+            storage.save_courses(self.copy_dataset())
+        self.container.latency = self.latency
+        return storage
+
+    def new_cached_cosmos_storage(self, seeded=True):
+        from services.cached_storage import CachedStorage
+        return CachedStorage(self.new_cosmos_storage(seeded), max_age=60, max_stale=600, change_feed_interval=0)
+
+    def first_course_id(self):
+        return self.dataset[0][0]["id"]
+
+    def first_entry_id(self):
+        return self.dataset[0][1][0]["id"]
+
+    def close(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+def _without_id(entry):
+    return {k: v for k, v in entry.items() if k != 'id'}
+
+
+SAMPLE_ENTRY = {
+    "date": "2025-06-02",
+    "class_name": "벤치마크 수업",
+    "instructor": "강명호",
+    "hours": 8,
+    "start_time": "09:00",
+    "end_time": "18:00",
+    "is_holiday": False,
+}
+
+
+# ===== 파서 / 서비스 =====
+
+@benchmark('parse.year_workbook')
+def bench_parse(ctx):
+    from services.excel_parser import parse_timetable
+    path = os.path.join(ctx.tmpdir, 'year.xlsx')
+    sheets = write_vertex42_workbook(path, ctx.dataset[0][1])
+    return lambda: parse_timetable(path, sheets)
+
+
+@benchmark('parse.extract')
+def bench_parse_extract(ctx):
+    """워크북 로드 제외, 시트 값 → 일정 추출만 (정규식/캐시 효과)"""
+    import openpyxl
+    from services.excel_parser import _parse_sheet, _sheet_values
+    path = os.path.join(ctx.tmpdir, 'year_extract.xlsx')
+    sheets = write_vertex42_workbook(path, ctx.dataset[0][1])
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    values = [_sheet_values(wb[name]) for name in sheets]
+    wb.close()
+    return lambda: [_parse_sheet(v, '09:00', 8) for v in values]
+
+
+@benchmark('service.format_events')
+def bench_format_events(ctx):
+    from services.calendar_service import format_events
+    courses = ctx.new_local_storage().get_all_courses()
+    return lambda: format_events(courses)
+
+
+@benchmark('service.course_stats')
+def bench_course_stats(ctx):
+    from services.calendar_service import get_course_stats
+    courses = ctx.new_local_storage().get_all_courses()
+    return lambda: get_course_stats(courses)
+
+
+@benchmark('service.reschedule_plan')
+def bench_reschedule_plan(ctx):
+    from models import ordinal_to_date
+    from services.reschedule_service import plan
+    courses = ctx.new_local_storage().get_all_courses()
+    first = min(e.day for c in courses for e in c.entries)
+    start = first + (7 - (first - 1) % 7) % 7  # 첫 일정 이후 첫 월요일, 그다음 주 월~금을 막음
+    return lambda: plan(courses, ordinal_to_date(start + 7), ordinal_to_date(start + 11), policy='shift')
+
+
+# ===== 저장소 공통 =====
+
+def _storage_benchmarks(prefix, factory):
+    @benchmark(f'{prefix}.save_course')
+    def bench_save(ctx):
+        storage = factory(ctx)(seeded=True)
+        course, entries = ctx.copy_dataset()[0]
+
+        def setup():
+            c = dict(course, id=f"{course['id']}_{time.perf_counter_ns()}")
+            return c, [_without_id(e) for e in entries]
+        return setup, lambda args: storage.save_course(*args)
+
+    @benchmark(f'{prefix}.get_all_courses')
+    def bench_list(ctx):
+        storage = factory(ctx)(seeded=True)
+        return storage.get_all_courses
+
+    @benchmark(f'{prefix}.query_entries_page')
+    def bench_query_page(ctx):
+        storage = factory(ctx)(seeded=True)
+        return lambda: storage.query_entries(fields=('date', 'class_name', 'instructor'), limit=101)
+
+    @benchmark(f'{prefix}.add_entry')
+    def bench_add(ctx):
+        storage = factory(ctx)(seeded=True)
+        course_id = ctx.first_course_id()
+        return lambda: storage.add_entry(course_id, dict(SAMPLE_ENTRY))
+
+    @benchmark(f'{prefix}.update_entry')
+    def bench_update(ctx):
+        storage = factory(ctx)(seeded=True)
+        course_id = ctx.first_course_id()
+        entry_id = storage.add_entry(course_id, dict(SAMPLE_ENTRY))
+        return lambda: storage.update_entry(course_id, entry_id, dict(SAMPLE_ENTRY, hours=9))
+
+    @benchmark(f'{prefix}.delete_entry')
+    def bench_delete(ctx):
+        storage = factory(ctx)(seeded=True)
+        course_id = ctx.first_course_id()
+        return (lambda: storage.add_entry(course_id, dict(SAMPLE_ENTRY)),
+                lambda entry_id: storage.delete_entry(course_id, entry_id))
+
+    @benchmark(f'{prefix}.delete_course')
+    def bench_delete_course(ctx):
+        storage = factory(ctx)(seeded=True)
+        course, entries = ctx.copy_dataset()[0]
+
+        def setup():
+            c = dict(course, id=f"{course['id']}_{time.perf_counter_ns()}")
+            storage.save_course(c, [_without_id(e) for e in entries])
+            return c['id']
+        return setup, storage.delete_course
+
+
+_storage_benchmarks('local', lambda ctx: ctx.new_local_storage)
+_storage_benchmarks('cosmos', lambda ctx: ctx.new_cosmos_storage)
+_storage_benchmarks('cosmos_cached', lambda ctx: ctx.new_cached_cosmos_storage)
+_storage_benchmarks('cosmos_async', lambda ctx: ctx.new_async_cosmos_storage)
+
+
+# ===== 실행 / 비교 =====
+
+def _run_one(name, ctx, repeat):
+    prepared = BENCHMARKS[name](ctx)
+    setup, run = prepared if isinstance(prepared, tuple) else (None, prepared)
+    calls_before = 0
+
+    timings = []
+    for i in range(repeat + 1):  # 첫 회는 워밍업
+        arg = setup() if setup else None
+        if ctx.container:
+            calls_before = sum(ctx.container.calls.values())
+        start = time.perf_counter()
+        run(arg) if setup else run()
+        elapsed = time.perf_counter() - start
+        if i > 0:
+            timings.append(elapsed)
+
+    result = {
+        "runs": len(timings),
+        "min_ms": round(min(timings) * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "mean_ms": round(statistics.mean(timings) * 1000, 4),
+        "max_ms": round(max(timings) * 1000, 4),
+    }
+    if ctx.container and name.startswith(('cosmos.', 'cosmos_cached.', 'cosmos_async.')):
+        # 마지막 반복의 Cosmos 왕복 횟수
+        result["roundtrips"] = sum(ctx.container.calls.values()) - calls_before
+    ctx.container = None
+    return result
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(n_courses, n_entries, repeat, name_filter=None, seed=42, latency=0.0):
+    ctx = Context(n_courses, n_entries, seed, latency)
+    results = {}
+    try:
+        for name in BENCHMARKS:
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = _run_one(name, ctx, repeat)
+            print(f"  {name:<28} median {results[name]['median_ms']:>10.3f} ms")
+    finally:
+        ctx.close()
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "courses": n_courses,
+            "entries_per_course": n_entries,
+            "repeat": repeat,
+            "seed": seed,
+            "cosmos_latency_ms": latency * 1000,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """중앙값 비교 → 회귀 항목 이름 리스트"""
+    regressions = []
+    print(f"\n  {'benchmark':<28} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median_ms"):
+            continue
+        ratio = cur["median_ms"] / base["median_ms"]
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  << 회귀'
+            regressions.append(name)
+        print(f"  {name:<28} {base['median_ms']:>10.3f} {cur['median_ms']:>10.3f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Timetable 핫패스 벤치마크')
+    parser.add_argument('--courses', type=int, default=20)
+    parser.add_argument('--entries', type=int, default=250)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--filter', dest='name_filter')
+    parser.add_argument('--latency', type=float, default=0.0, help='가짜 Cosmos 왕복 지연 (ms)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.15, help='회귀 판정 비율 (기본 0.15 = 15%%)')
+    args = parser.parse_args(argv)
+
+    print(f"벤치마크: {args.courses}과정 × {args.entries}일정, 반복 {args.repeat}회")
+    report = run_benchmarks(args.courses, args.entries, args.repeat, args.name_filter, args.seed,
+                            args.latency / 1000)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+합성 시간표 데이터 생성기
+
+- generate_courses(): N개 과정 × M개 수업 일정 (API/저장소 형식의 dict)
+- write_vertex42_workbook(): excel_parser 가 읽는 Vertex42 레이아웃(DAY_CONFIG / WEEK_START_ROWS)의 엑셀 파일
+
+같은 seed 는 항상 같은 데이터를 생성합니다.
+"""
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from services.excel_parser import DAY_CONFIG, WEEK_START_ROWS, calculate_end_time
+
+CLASS_NAMES = [
+    'AI기본의 이해 및 활용', '파이썬 프로그래밍', '데이터 분석 기초', '클라우드기반 딥러닝',
+    '머신러닝 실습', '웹 개발 입문', '자연어처리', '컴퓨터 비전', 'MLOps 파이프라인', '팀 프로젝트',
+]
+INSTRUCTORS = [
+    '강명호', '인선미', '정종현', '김자영', '황소영',
+    '박정일', '이서준', '최민지', '한지우', '오세훈',
+]
+HOLIDAY_NAMES = ['추석', '대체휴일', '성탄절', '설날', '방학']
+HOURS_CHOICES = [4, 8, 8, 8, 8, 9, 10]
+COLORS = ['#4A90D9', '#E85D75', '#50C878', '#F5A623', '#9B59B6', '#1ABC9C']
+
+
+def _weekdays_from(start):
+    d = start
+    while True:
+        if d.weekday() < 5:
+            yield d
+        d += timedelta(days=1)
+
+
+def generate_entries(n_entries, start=date(2025, 3, 3), rng=None, holiday_rate=0.04):
+    """평일마다 하나씩 수업 일정 생성"""
+    rng = rng or random.Random(42)
+    entries = []
+    days = _weekdays_from(start)
+    for i in range(n_entries):
+        d = next(days)
+        if rng.random() < holiday_rate:
+            entries.append({
+                "date": d.isoformat(),
+                "class_name": rng.choice(HOLIDAY_NAMES),
+                "instructor": "",
+                "hours": 8,
+                "start_time": "09:00",
+                "end_time": "18:00",
+                "is_holiday": True,
+            })
+            continue
+        hours = rng.choice(HOURS_CHOICES)
+        instructors = rng.sample(INSTRUCTORS, 2 if rng.random() < 0.15 else 1)
+        entries.append({
+            "date": d.isoformat(),
+            "class_name": f"{rng.choice(CLASS_NAMES)}{i % 5 + 1}",
+            "instructor": ",".join(instructors),
+            "hours": hours,
+            "start_time": "09:00",
+            "end_time": calculate_end_time("09:00", hours),
+            "is_holiday": False,
+        })
+    return entries
+
+
+def generate_courses(n_courses, n_entries, seed=42):
+    """(course, entries) 튜플 리스트 생성"""
+    rng = random.Random(seed)
+    result = []
+    for idx in range(n_courses):
+        start = date(2023, 1, 2) + timedelta(weeks=rng.randrange(0, 150))
+        course = {
+            "id": f"course_bench_{idx:05d}",
+            "type": "course",
+            "name": f"AI School {idx + 1}",
+            "color": COLORS[idx % len(COLORS)],
+            "file_name": f"timetable_{idx + 1}.xlsx",
+            "uploaded_at": (datetime(2025, 1, 1) + timedelta(minutes=idx)).isoformat(),
+            "default_start_time": "09:00",
+            "entry_count": n_entries,
+        }
+        entries = generate_entries(n_entries, start=start, rng=rng)
+        for j, entry in enumerate(entries):
+            entry["id"] = f"entry_bench_{idx:05d}_{j:05d}"
+        result.append((course, entries))
+    return result
+
+
+def write_vertex42_workbook(path, entries):
+    """수업 일정을 월별 시트의 Vertex42 그리드로 기록 (반환: 시트명 리스트)"""
+    import openpyxl
+
+    by_month = defaultdict(list)
+    for entry in entries:
+        d = date.fromisoformat(entry["date"])
+        if d.weekday() < 5:
+            by_month[(d.year, d.month)].append((d, entry))
+
+    wb = openpyxl.Workbook()
+    wb.active.title = '정보'
+    sheet_names = []
+    for (year, month), items in sorted(by_month.items()):
+        ws = wb.create_sheet(f"{year}.{month:02d}")
+        sheet_names.append(ws.title)
+        first = date(year, month, 1)
+        first_monday = first - timedelta(days=first.weekday())
+        ws.cell(row=2, column=3, value=f"{year}년 {month}월")
+        for d, entry in items:
+            week_row = WEEK_START_ROWS[(d - first_monday).days // 7]
+            date_col, class_col = DAY_CONFIG[d.weekday()]
+            ws.cell(row=week_row, column=date_col, value=datetime(d.year, d.month, d.day))
+            ws.cell(row=week_row, column=class_col, value=entry["class_name"])
+            if not entry.get("is_holiday"):
+                if entry.get("instructor"):
+                    ws.cell(row=week_row + 1, column=class_col,
+                            value=entry["instructor"].replace(',', '/'))
+                ws.cell(row=week_row + 2, column=class_col, value=entry.get("hours", 8))
+    wb.save(path)
+    return sheet_names
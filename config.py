@@ -2,6 +2,11 @@ import os
 import secrets
 from datetime import timedelta
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 데이터 디렉토리 (DATA_DIR 환경변수로 변경 가능 - 부하 테스트 등)
+DATA_ROOT = os.environ.get('DATA_DIR') or os.path.join(BASE_DIR, 'data')
+
+
 class Config:
     """애플리케이션 설정"""
 
@@ -13,19 +18,56 @@ class Config:
     SESSION_COOKIE_SAMESITE = 'Lax'
 
     # 파일 업로드
-    UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'uploads')
+    UPLOAD_FOLDER = os.path.join(DATA_ROOT, 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     ALLOWED_EXTENSIONS = {'xlsx', 'xls'}
+    # 업로드 임시 파일 정리: TTL(초)이 지난 파일 삭제, 전체 크기가 quota 를 넘으면 오래된 것부터 삭제
+    UPLOAD_TTL = int(os.environ.get('UPLOAD_TTL', 3600))
+    UPLOAD_QUOTA_BYTES = int(os.environ.get('UPLOAD_QUOTA_MB', 512)) * 1024 * 1024
+    UPLOAD_REAPER_INTERVAL = float(os.environ.get('UPLOAD_REAPER_INTERVAL', 300))  # 정리 주기 (초, 0 = 사용 안 함)
+
+    # ZIP 일괄 등록 (/api/upload/bulk)
+    BULK_IMPORT_WORKERS = int(os.environ.get('BULK_IMPORT_WORKERS', 4))  # 동시에 파싱할 워크북 수
+    BULK_MAX_FILES = 50
+    BULK_MAX_MEMBER_SIZE = 20 * 1024 * 1024    # 압축 해제 후 파일당 최대
+    BULK_MAX_TOTAL_SIZE = 200 * 1024 * 1024    # 압축 해제 후 전체 최대
+    BULK_MAX_RATIO = 100                       # 파일당 최대 압축률 (xlsx 는 이미 압축되어 보통 1~10)
 
     # 로컬 JSON 저장 (Cosmos DB fallback)
-    DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+    DATA_DIR = DATA_ROOT
     COURSES_FILE = os.path.join(DATA_DIR, 'courses.json')
+    COURSES_SNAPSHOT_FILE = os.path.join(DATA_DIR, 'courses.snap')
+    COURSES_SHARD_DIR = os.path.join(DATA_DIR, 'courses')
+    # 로컬 저장 형식: json (courses.json) | snapshot (courses.snap 바이너리 컬럼 스냅샷, mmap + 지연 디코딩)
+    #                | sharded (courses/ 아래 과정별 일정 파일 + index.json)
+    LOCAL_STORAGE_FORMAT = os.environ.get('LOCAL_STORAGE_FORMAT', 'json').lower()
+
+    # 종료된 과정 보관 (옵트인): 마지막 일정이 ARCHIVE_AFTER_DAYS 일보다 오래된 과정을 보관소로 이동 (0 = 자동 이동 안 함)
+    ARCHIVE_DIR = os.path.join(DATA_DIR, 'archive')
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', 0))
+    ARCHIVE_INTERVAL = float(os.environ.get('ARCHIVE_INTERVAL', 86400))  # 자동 이동 주기 (초, 0 = 사용 안 함)
+
+    # 시작 시 백그라운드에서 저장소 연결 + 과정 캐시 예열 (/api/ready 로 완료 확인)
+    STARTUP_WARMUP = os.environ.get('STARTUP_WARMUP', 'true').lower() in ('1', 'true', 'yes')
 
     # Azure Cosmos DB
     COSMOS_DB_ENDPOINT = os.environ.get('COSMOS_DB_ENDPOINT')
     COSMOS_DB_KEY = os.environ.get('COSMOS_DB_KEY')
     COSMOS_DATABASE_NAME = 'TimetableDashboardDB'
     COSMOS_CONTAINER_NAME = 'ScheduleData'
+    COSMOS_ARCHIVE_CONTAINER_NAME = 'ScheduleArchive'  # 보관된 과정 (과정당 문서 하나)
+    # 읽기 캐시 (stale-while-revalidate): MAX_AGE 초가 지나면 백그라운드 갱신, MAX_STALE 초가 지나면 동기 갱신
+    COSMOS_CACHE_MAX_AGE = float(os.environ.get('COSMOS_CACHE_MAX_AGE', 5))
+    COSMOS_CACHE_MAX_STALE = float(os.environ.get('COSMOS_CACHE_MAX_STALE', 60))
+    # change feed 폴링 주기 (초, 0 = 사용 안 함)
+    COSMOS_CHANGE_FEED_INTERVAL = float(os.environ.get('COSMOS_CHANGE_FEED_INTERVAL', 0))
+    # azure.cosmos.aio 클라이언트 사용 여부와 동시 요청 수 (여러 문서 작업을 동시에 실행)
+    COSMOS_ASYNC = os.environ.get('COSMOS_ASYNC', '').lower() in ('1', 'true', 'yes')
+    COSMOS_ASYNC_CONCURRENCY = int(os.environ.get('COSMOS_ASYNC_CONCURRENCY', 32))
+    # 과정 삭제 시 일정 문서 동시 삭제 수 (SDK 기본 커넥션 풀 크기 10 이하 권장)
+    COSMOS_DELETE_CONCURRENCY = int(os.environ.get('COSMOS_DELETE_CONCURRENCY', 8))
+    # 고아 일정(과정이 없는 entry 문서) 정리 주기 (초, 0 = 사용 안 함)
+    COSMOS_ORPHAN_SWEEP_INTERVAL = float(os.environ.get('COSMOS_ORPHAN_SWEEP_INTERVAL', 3600))
 
     # 시간표 기본값
     DEFAULT_START_TIME = '09:00'
@@ -34,6 +76,9 @@ class Config:
     # 시간대
     TIMEZONE_OFFSET = timedelta(hours=9)  # KST
 
+    # iCalendar 구독 피드 (클라이언트 캐시 시간, 초)
+    ICS_MAX_AGE = int(os.environ.get('ICS_MAX_AGE', 300))
+
     # 과정 색상 프리셋
     COURSE_COLORS = [
         '#4A90D9',  # Blue
@@ -51,8 +96,17 @@ class Config:
     ]
 
     # 로그
-    LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-    LOG_LEVEL = 'INFO'
+    LOG_DIR = os.environ.get('LOG_DIR') or os.path.join(BASE_DIR, 'logs')
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    LOG_MAX_BYTES = int(os.environ.get('LOG_MAX_MB', 10)) * 1024 * 1024  # app.jsonl 회전 크기
+    LOG_BACKUP_COUNT = int(os.environ.get('LOG_BACKUP_COUNT', 5))
+
+    # 요청 프로파일링 (cProfile) - 기본 비활성
+    PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', '').lower() in ('1', 'true', 'yes')
+    PROFILING_SECRET = os.environ.get('PROFILING_SECRET', '')
+    PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0') or 0)  # 0.01 = 1%
+    PROFILE_DIR = os.path.join(LOG_DIR, 'profiles')
+    PROFILE_KEEP = 200  # 보관할 최대 프로파일 파일 수
 
     # 서버
     HOST = '0.0.0.0'
@@ -1,14 +1,54 @@
 """
 Timetable Dashboard - 데이터 모델
+
+저장소와 calendar_service 는 아래 compact 모델로 데이터를 다루며,
+dict 변환은 JSON 경계(API 응답, 파일/Cosmos 문서)에서만 수행합니다.
+  - slots=True 로 인스턴스별 __dict__ 제거
+  - 날짜는 ordinal int 로 저장 (date.toordinal())
+  - 반복되는 문자열(수업명, 강사, 시각)은 sys.intern 으로 공유
+
+캐시된 인스턴스는 여러 요청이 공유하므로 읽기 전용으로 취급합니다.
+수정이 필요하면 copy() / with_updates() 로 새 인스턴스를 만듭니다.
+
+etag 는 낙관적 동시성(If-Match)용입니다. Cosmos 문서는 _etag 를 그대로 쓰고,
+로컬 JSON 은 처음 요청될 때 내용 hash 로 계산해 보관합니다 (내용이 같으면 프로세스가 달라도 같은 값).
 """
-from dataclasses import dataclass, field
-from typing import List, Optional
+import hashlib
+import logging
+import sys
+from dataclasses import dataclass, field, replace
+from datetime import date as _date
+from functools import lru_cache
+from typing import List
+
+_intern = sys.intern
+logger = logging.getLogger(__name__)
+
+ENTRY_FIELDS = ('date', 'class_name', 'instructor', 'hours', 'start_time', 'end_time', 'is_holiday')
+
+
+@lru_cache(maxsize=16384)
+def date_to_ordinal(iso_date):
+    """'2025-09-16' → ordinal"""
+    return _date.fromisoformat(iso_date).toordinal()
+
 
+@lru_cache(maxsize=16384)
+def ordinal_to_date(ordinal):
+    """ordinal → '2025-09-16'"""
+    return _date.fromordinal(ordinal).isoformat()
 
-@dataclass
+
+def content_etag(values):
+    """값 튜플 → 내용 기반 ETag (따옴표 포함)"""
+    raw = '\0'.join(str(v) for v in values).encode('utf-8')
+    return '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+
+
+@dataclass(slots=True)
 class ClassEntry:
     """단일 수업 일정"""
-    date: str                  # "2025-09-16"
+    day: int                   # 날짜 ordinal (2025-09-16 → 739145)
     class_name: str            # "AI기본의 이해 및 활용1"
     instructor: str = ""       # "강명호" 또는 "강명호,인선미" (복수 강사)
     hours: int = 8             # 수업시간
@@ -16,6 +56,46 @@ class ClassEntry:
     end_time: str = "18:00"
     is_holiday: bool = False
     id: str = ""               # 개별 엔트리 식별자
+    etag: str = field(default="", compare=False)  # 비어 있으면 get_etag() 가 계산
+
+    @property
+    def date(self):
+        return ordinal_to_date(self.day)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            day=date_to_ordinal(d['date']),
+            class_name=_intern(d.get('class_name') or ''),
+            instructor=_intern(d.get('instructor') or ''),
+            hours=d.get('hours', 8),
+            start_time=_intern(d.get('start_time') or '09:00'),
+            end_time=_intern(d.get('end_time') or '18:00'),
+            is_holiday=bool(d.get('is_holiday', False)),
+            id=d.get('id') or '',
+            etag=d.get('_etag') or '',
+        )
+
+    def get_etag(self):
+        if not self.etag:
+            self.etag = content_etag((self.id, self.day, self.class_name, self.instructor, self.hours,
+                                      self.start_time, self.end_time, self.is_holiday))
+        return self.etag
+
+    def with_updates(self, updates):
+        """ENTRY_FIELDS 키를 가진 dict 를 반영한 새 인스턴스"""
+        changes = {}
+        for key in ENTRY_FIELDS:
+            if key not in updates:
+                continue
+            value = updates[key]
+            if key == 'date':
+                changes['day'] = date_to_ordinal(value)
+            elif isinstance(value, str):
+                changes[key] = _intern(value)
+            else:
+                changes[key] = value
+        return replace(self, etag="", **changes)
 
     def to_dict(self):
         d = {
@@ -32,7 +112,25 @@ class ClassEntry:
         return d
 
 
-@dataclass
+def parse_entries(raw_entries, owner=''):
+    """일정 dict 리스트 → (ClassEntry 리스트, 날짜를 읽을 수 없는 원본 dict 튜플)
+
+    검증이 느슨하던 이전 버전이 저장한 날짜('2025-02-30', '')는 로드를 막지 않도록 건너뛰고,
+    원본 dict 는 다시 저장할 때 잃지 않도록 그대로 돌려줍니다.
+    """
+    parsed, invalid = [], []
+    for raw in raw_entries:
+        try:
+            parsed.append(ClassEntry.from_dict(raw))
+        except (KeyError, TypeError, ValueError):
+            invalid.append(raw)
+    if invalid:
+        logger.warning("날짜를 읽을 수 없는 일정 %s개 제외: %s (%s)", len(invalid), owner,
+                       ', '.join(repr(e.get('date')) if isinstance(e, dict) else repr(e) for e in invalid[:5]))
+    return parsed, tuple(invalid)
+
+
+@dataclass(slots=True)
 class Course:
     """과정 정보"""
     id: str
@@ -43,6 +141,39 @@ class Course:
     default_start_time: str = "09:00"
     entry_count: int = 0
     entries: List[ClassEntry] = field(default_factory=list)
+    etag: str = field(default="", compare=False)
+    invalid_entries: tuple = field(default=(), compare=False)  # 날짜를 읽을 수 없는 원본 dict (parse_entries)
+
+    @classmethod
+    def from_dict(cls, d, entries=None):
+        """course dict (+ entries dict 리스트) → Course
+
+        entries 를 생략하면 d['entries'] 를 사용합니다.
+        """
+        raw_entries = d.get('entries', []) if entries is None else entries
+        parsed, invalid = parse_entries(raw_entries, d['id'])
+        return cls(
+            id=d['id'],
+            name=d.get('name', ''),
+            color=d.get('color') or '#4A90D9',
+            file_name=d.get('file_name', ''),
+            uploaded_at=d.get('uploaded_at', ''),
+            default_start_time=d.get('default_start_time') or '09:00',
+            entry_count=d.get('entry_count', len(parsed)),
+            entries=parsed,
+            etag=d.get('_etag') or '',
+            invalid_entries=invalid,
+        )
+
+    def get_etag(self):
+        if not self.etag:
+            self.etag = content_etag((self.id, self.name, self.color, self.file_name, self.uploaded_at,
+                                      self.default_start_time, self.entry_count))
+        return self.etag
+
+    def copy(self):
+        """수정용 얕은 복사 (entries 리스트는 새 리스트, 엔트리 객체는 공유)"""
+        return replace(self, entries=list(self.entries), etag="")
 
     def to_dict(self, include_entries=False):
         d = {
@@ -56,5 +187,36 @@ class Course:
             "entry_count": self.entry_count,
         }
         if include_entries:
-            d["entries"] = [e.to_dict() for e in self.entries]
+            d["entries"] = [e.to_dict() for e in self.entries] + list(self.invalid_entries)
         return d
+
+
+class LazyCourse(Course):
+    """entries 를 처음 접근할 때 loader() 로 읽는 Course
+
+    과정 메타데이터만 필요한 조회(/api/courses 등)는 일정을 디코딩하지 않습니다.
+    여러 스레드가 동시에 처음 접근하면 각자 읽을 수 있지만 결과는 같습니다.
+    """
+    __slots__ = ('_loader', '_entries')
+
+    def __init__(self, *args, loader=None, **kwargs):
+        self._loader = None
+        super().__init__(*args, **kwargs)
+        if loader is not None:
+            self._loader = loader
+            self._entries = None
+
+    @property
+    def entries(self):
+        entries = self._entries
+        if entries is None:
+            entries = self._entries = self._loader()
+        return entries
+
+    @entries.setter
+    def entries(self, value):
+        self._entries = value
+
+    @property
+    def entries_loaded(self):
+        return self._entries is not None
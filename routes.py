@@ -1,14 +1,32 @@
 """
 Timetable Dashboard - 라우트 정의
 """
+import os
 import re
+import uuid
 import logging
-from flask import Blueprint, render_template, jsonify, request
+from datetime import date as _date, datetime
+from urllib.parse import quote
+from flask import Blueprint, Response, current_app, render_template, jsonify, request, send_from_directory
+from werkzeug.http import is_resource_modified
+from werkzeug.utils import secure_filename
+from config import Config
+from services import archive_service, ics_service, pagination, reschedule_service, singleflight, warmup
+from services.bulk_import import import_archive
+from services.calendar_service import format_events, get_course_stats
+from services.cosmos_service import get_storage, PreconditionFailedError
+from services.daily_aggregate import get_daily_aggregate
+from services.excel_parser import calculate_end_time, get_sheet_names, parse_timetable
+from services.search_index import get_search_index
+from utils import metrics
+from utils.error_handlers import handle_errors
+# numpy / openpyxl(쓰기) 를 쓰는 리포트·내보내기와 옵트인 프로파일링은 처음 사용할 때 import
 
 logger = logging.getLogger(__name__)
 
 main_bp = Blueprint('main', __name__)
 api_bp = Blueprint('api', __name__, url_prefix='/api')
+feeds_bp = Blueprint('feeds', __name__, url_prefix='/feeds')
 
 # 입력 검증 유틸리티
 HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
@@ -24,6 +42,17 @@ def _validate_time(t):
     return bool(TIME_RE.match(t)) if t else False
 
 
+def _validate_date(d):
+    """YYYY-MM-DD 형식이면서 실제 있는 날짜인지 ('2025-02-30' 은 False)"""
+    if not d or not DATE_RE.match(d):
+        return False
+    try:
+        _date.fromisoformat(d)
+    except ValueError:
+        return False
+    return True
+
+
 def _sanitize_name(name, max_len=50):
     return name.strip()[:max_len] if name else ''
 
@@ -47,57 +76,161 @@ def upload_page():
 
 # ===== API 라우트 =====
 
+def _coalesced_json(endpoint, params, build):
+    """동시 요청 합치기: 같은 (엔드포인트, 파라미터, 데이터 버전)이면 조회·계산·직렬화를 한 번만 수행
+
+    build(courses) 의 결과를 JSON 으로 직렬화한 본문을 진행 중인 요청들이 공유합니다.
+    """
+    storage = get_storage()
+    key = (endpoint, params, storage.get_data_version())
+    body, _ = singleflight.do(key, lambda: current_app.json.response(build(storage.get_all_courses())).get_data())
+    return Response(body, mimetype=current_app.json.mimetype)
+
+
+def _course_summary(c):
+    return {
+        "id": c.id,
+        "name": c.name,
+        "color": c.color,
+        "file_name": c.file_name,
+        "uploaded_at": c.uploaded_at,
+        "default_start_time": c.default_start_time,
+        "entry_count": c.entry_count,
+        "etag": c.get_etag(),
+    }
+
+
+def _course_summaries(courses, archived=()):
+    # entries 제거 → 경량 응답 (보관된 과정은 뒤에 archived 표시와 함께)
+    course_list = [_course_summary(c) for c in courses]
+    course_list.extend({**_course_summary(c), "archived": True} for c in archived)
+    return {"success": True, "courses": course_list}
+
+
+def _include_archived():
+    return request.args.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+
+def _paged_list(kind, queries, allowed, **filters):
+    """limit / cursor / fields 파라미터 → 저장소(들)에서 한 페이지만 조회 ({kind: [...], "next_cursor"})"""
+    fields = pagination.parse_fields(request.args.get('fields'), allowed)
+    limit = pagination.parse_limit(request.args.get('limit'))
+    after = pagination.decode_cursor(kind, request.args.get('cursor'))
+    fetch = None if limit is None else limit + 1
+    pages = [query(fields=fields, limit=fetch, after=after, **filters) for query in queries]
+    records = pages[0] if len(pages) == 1 else pagination.merge(pages, fetch)
+    records, next_cursor = pagination.paginate(kind, records, limit)
+    return jsonify({"success": True, kind: records, "next_cursor": next_cursor})
+
+
 @api_bp.route('/courses', methods=['GET'])
+@handle_errors
 def get_courses():
-    """전체 과정 목록 반환 (entries 제외, 메타데이터만)"""
-    from services.cosmos_service import get_storage
-    storage = get_storage()
-    courses = storage.get_all_courses()
-    # entries 제거 → 경량 응답
-    course_list = []
-    for c in courses:
-        course_list.append({
-            "id": c.get("id"),
-            "name": c.get("name"),
-            "color": c.get("color"),
-            "file_name": c.get("file_name"),
-            "uploaded_at": c.get("uploaded_at"),
-            "default_start_time": c.get("default_start_time"),
-            "entry_count": c.get("entry_count", len(c.get("entries", []))),
-        })
-    return jsonify({"success": True, "courses": course_list})
+    """전체 과정 목록 반환 (entries 제외, 메타데이터만) - limit / cursor / fields 로 페이지 조회
+
+    include_archived=1 이면 보관된 과정도 archived 표시와 함께 포함합니다.
+    """
+    include_archived = _include_archived()
+    if pagination.requested(request.args):
+        queries = [get_storage().query_courses]
+        if include_archived:
+            queries.append(archive_service.get_archive().query_courses)
+        return _paged_list('courses', queries, pagination.COURSE_LIST_FIELDS)
+    if include_archived:
+        archived = archive_service.get_archive().courses()
+        return _coalesced_json('courses', (True,), lambda courses: _course_summaries(courses, archived))
+    return _coalesced_json('courses', (), _course_summaries)
 
 
 @api_bp.route('/events', methods=['GET'])
+@handle_errors
 def get_events():
-    """FullCalendar 이벤트 JSON 반환"""
-    from services.cosmos_service import get_storage
-    from services.calendar_service import format_events
-    storage = get_storage()
+    """FullCalendar 이벤트 JSON 반환 - limit / cursor / fields 가 있으면 일정 레코드 페이지
+
+    include_archived=1 이면 보관된 과정의 일정도 포함합니다 (보관소에서 읽으므로 느림).
+    """
     course_id = request.args.get('course_id')
-    courses = storage.get_all_courses()
-    events = format_events(courses, course_id)
-    return jsonify(events)
+    include_archived = _include_archived()
+    if pagination.requested(request.args):
+        queries = [get_storage().query_entries]
+        if include_archived:
+            queries.append(archive_service.get_archive().query_entries)
+        return _paged_list('events', queries, pagination.ENTRY_LIST_FIELDS, course_id=course_id or None)
+    if include_archived:
+        archived = archive_service.get_archive().courses()
+        return _coalesced_json('events', (course_id, True),
+                               lambda courses: format_events([*courses, *archived], course_id))
+    return _coalesced_json('events', (course_id,), lambda courses: format_events(courses, course_id))
 
 
 @api_bp.route('/stats', methods=['GET'])
 def get_stats():
     """과정별 통계 반환"""
-    from services.cosmos_service import get_storage
-    from services.calendar_service import get_course_stats
-    storage = get_storage()
-    courses = storage.get_all_courses()
-    stats = get_course_stats(courses)
-    return jsonify({"success": True, "stats": stats})
+    return _coalesced_json('stats', (), lambda courses: {"success": True, "stats": get_course_stats(courses)})
+
+
+@api_bp.route('/reports/<kind>', methods=['GET'])
+@handle_errors
+def get_report(kind):
+    """과정 횡단 리포트 (instructor-hours / utilization / holiday-density)"""
+    from services.report_service import REPORTS, run_report
+    if kind not in REPORTS:
+        return jsonify({"success": False, "error": "알 수 없는 리포트 종류입니다."}), 404
+    report = run_report(
+        get_storage(), kind,
+        start=request.args.get('start'),
+        end=request.args.get('end'),
+        group_by=request.args.get('group_by'),
+    )
+    return jsonify({"success": True, **report})
+
+
+@api_bp.route('/calendar/daily', methods=['GET'])
+@handle_errors
+def get_daily_totals():
+    """날짜별 점유 집계 (연간 히트맵용)"""
+    days = get_daily_aggregate(get_storage()).query(request.args.get('start'), request.args.get('end'))
+    return jsonify({"success": True, "days": days})
+
+
+@api_bp.route('/search', methods=['GET'])
+@handle_errors
+def search_entries():
+    """수업명/강사/과정명 검색 (q, page, per_page, course_id)"""
+    result = get_search_index(get_storage()).search(
+        request.args.get('q', ''),
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', type=int),
+        course_id=request.args.get('course_id'),
+    )
+    return jsonify({"success": True, **result})
+
+
+@api_bp.route('/export.xlsx', methods=['GET'])
+@handle_errors
+def export_xlsx():
+    """선택한 과정/기간의 시간표를 엑셀로 내보내기 (layout=list|vertex42)"""
+    from services.export_service import build_export, iter_file
+    course_ids = [cid.strip() for cid in request.args.get('course_ids', '').split(',') if cid.strip()]
+    start = request.args.get('start') or None
+    end = request.args.get('end') or None
+    layout = request.args.get('layout', 'list')
+    spool, size, count = build_export(
+        get_storage().get_all_courses(), start=start, end=end,
+        course_ids=course_ids, layout=layout,
+    )
+    filename = f"timetable_{start or 'all'}_{end or 'all'}_{layout}.xlsx"
+    logger.info("엑셀 내보내기: %s개 일정, %s bytes (%s)", count, size, layout)
+    return Response(iter_file(spool), headers={
+        'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Content-Length': str(size),
+    })
 
 
 @api_bp.route('/sheets', methods=['POST'])
 def get_sheets():
     """엑셀 파일 업로드 후 시트 목록 반환"""
-    from services.excel_parser import get_sheet_names
-    import os
-    from config import Config
-
     if 'file' not in request.files:
         return jsonify({"success": False, "error": "파일이 없습니다."}), 400
 
@@ -109,50 +242,31 @@ def get_sheets():
     if ext not in Config.ALLOWED_EXTENSIONS:
         return jsonify({"success": False, "error": "xlsx 또는 xls 파일만 업로드 가능합니다."}), 400
 
-    import uuid as _uuid
-    from werkzeug.utils import secure_filename as _secure
-    original_name = _secure(file.filename) or 'upload.xlsx'
-    safe_name = f"{_uuid.uuid4().hex[:8]}_{original_name}"
+    original_name = secure_filename(file.filename) or 'upload.xlsx'
+    safe_name = f"{uuid.uuid4().hex[:8]}_{original_name}"
     filepath = os.path.join(Config.UPLOAD_FOLDER, safe_name)
     file.save(filepath)
 
-    # 실제 엑셀 파일인지 검증
-    try:
-        import openpyxl
-        wb = openpyxl.load_workbook(filepath, read_only=True)
-        wb.close()
-    except Exception:
-        try:
-            os.remove(filepath)
-        except OSError:
-            pass
-        return jsonify({"success": False, "error": "유효한 엑셀 파일이 아닙니다."}), 400
-
+    # 실제 엑셀 파일인지 검증 (시트 목록을 읽지 못하면 엑셀 파일이 아님 - 워크북은 한 번만 엶)
     try:
         sheets = get_sheet_names(filepath)
-        if not sheets:
-            os.remove(filepath)
-            return jsonify({"success": False, "error": "유효한 시트를 찾을 수 없습니다."}), 400
-        return jsonify({"success": True, "sheets": sheets, "filepath": filepath})
     except Exception as e:
-        logger.error(f"엑셀 파일 읽기 실패: {e}", exc_info=True)
+        logger.warning("엑셀 파일 읽기 실패: %s", e)
         try:
             os.remove(filepath)
         except OSError:
             pass
-        return jsonify({"success": False, "error": "엑셀 파일을 읽을 수 없습니다. 파일 형식을 확인해주세요."}), 400
+        return jsonify({"success": False, "error": "유효한 엑셀 파일이 아닙니다."}), 400
+
+    if not sheets:
+        os.remove(filepath)
+        return jsonify({"success": False, "error": "유효한 시트를 찾을 수 없습니다."}), 400
+    return jsonify({"success": True, "sheets": sheets, "filepath": filepath})
 
 
 @api_bp.route('/upload', methods=['POST'])
 def upload_course():
     """엑셀 파싱 후 과정 저장"""
-    from services.excel_parser import parse_timetable
-    from services.cosmos_service import get_storage
-    from config import Config
-    import os
-    import uuid
-    from datetime import datetime
-
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "요청 데이터가 없습니다."}), 400
@@ -171,7 +285,7 @@ def upload_course():
     real_filepath = os.path.realpath(filepath)
     real_upload_folder = os.path.realpath(Config.UPLOAD_FOLDER)
     if not real_filepath.startswith(real_upload_folder + os.sep):
-        logger.warning(f"Path Traversal 시도 감지: {filepath}")
+        logger.warning("Path Traversal 시도 감지: %s", filepath)
         return jsonify({"success": False, "error": "잘못된 파일 경로입니다."}), 400
     if not selected_sheets:
         return jsonify({"success": False, "error": "시트를 선택해주세요."}), 400
@@ -214,7 +328,7 @@ def upload_course():
         except OSError:
             pass
 
-        logger.info(f"과정 등록 완료: {course_name} ({len(entries)}개 일정)")
+        logger.info("과정 등록 완료: %s (%s개 일정)", course_name, len(entries))
         return jsonify({
             "success": True,
             "message": f"'{course_name}' 과정이 등록되었습니다. ({len(entries)}개 수업 일정)",
@@ -222,17 +336,62 @@ def upload_course():
             "entry_count": len(entries)
         })
     except Exception as e:
-        logger.error(f"파싱 오류: {e}", exc_info=True)
+        logger.error("파싱 오류: %s", e, exc_info=True)
         return jsonify({"success": False, "error": "시간표 파싱 중 오류가 발생했습니다. 엑셀 형식을 확인해주세요."}), 400
 
 
+@api_bp.route('/upload/bulk', methods=['POST'])
+@handle_errors
+def upload_bulk():
+    """ZIP 으로 여러 시간표 일괄 등록 (manifest: 폼 필드 또는 ZIP 안의 manifest.json)"""
+    file = request.files.get('file')
+    if file is None or file.filename == '':
+        return jsonify({"success": False, "error": "파일이 선택되지 않았습니다."}), 400
+    if not file.filename.lower().endswith('.zip'):
+        return jsonify({"success": False, "error": "zip 파일만 업로드 가능합니다."}), 400
+
+    colors = iter(Config.COURSE_COLORS * (Config.BULK_MAX_FILES // len(Config.COURSE_COLORS) + 1))
+
+    def make_spec(item, member):
+        color = item.get('color')
+        start_time = item.get('start_time')
+        sheets = item.get('sheets', 'all')
+        if not (isinstance(sheets, list) and sheets and all(isinstance(s, str) for s in sheets)):
+            sheets = 'all'
+        return {
+            "course_name": _sanitize_name(item.get('course_name') or os.path.splitext(os.path.basename(member))[0]),
+            "color": color if _validate_color(color) else next(colors),
+            "start_time": start_time if _validate_time(start_time) else Config.DEFAULT_START_TIME,
+            "sheets": sheets,
+        }
+
+    zip_path = os.path.join(Config.UPLOAD_FOLDER, f"{uuid.uuid4().hex[:8]}_bulk.zip")
+    file.save(zip_path)
+    try:
+        report = import_archive(zip_path, request.form.get('manifest'), make_spec, get_storage())
+    finally:
+        try:
+            os.remove(zip_path)
+        except OSError:
+            pass
+
+    imported = [r for r in report if r.get("status") == "ok"]
+    body = {
+        "success": bool(imported),
+        "imported": len(imported),
+        "failed": len(report) - len(imported),
+        "entry_count": sum(r["entry_count"] for r in imported),
+        "files": report,
+    }
+    if not imported:
+        body["error"] = "등록된 과정이 없습니다. 파일별 결과를 확인해주세요."
+        return jsonify(body), 400
+    return jsonify(body)
+
+
 @api_bp.route('/courses/quick', methods=['POST'])
 def create_course_quick():
     """과정 빠른 생성 (엑셀 업로드 없이 이름과 색상만으로)"""
-    from services.cosmos_service import get_storage
-    import uuid
-    from datetime import datetime
-
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "요청 데이터가 없습니다."}), 400
@@ -268,7 +427,7 @@ def create_course_quick():
     storage = get_storage()
     result_id = storage.create_course(course)
     if result_id:
-        logger.info(f"과정 빠른 생성: {course_name}")
+        logger.info("과정 빠른 생성: %s", course_name)
         return jsonify({
             "success": True,
             "message": f"'{course_name}' 과정이 생성되었습니다.",
@@ -280,19 +439,88 @@ def create_course_quick():
 @api_bp.route('/courses/<course_id>', methods=['DELETE'])
 def delete_course(course_id):
     """과정 삭제"""
-    from services.cosmos_service import get_storage
     storage = get_storage()
     success = storage.delete_course(course_id)
     if success:
-        logger.info(f"과정 삭제: {course_id}")
+        logger.info("과정 삭제: %s", course_id)
         return jsonify({"success": True, "message": "과정이 삭제되었습니다."})
     return jsonify({"success": False, "error": "과정을 찾을 수 없습니다."}), 404
 
 
+@api_bp.route('/courses/<course_id>/archive', methods=['POST'])
+@handle_errors
+def archive_course(course_id):
+    """과정을 지금 보관소로 이동 (종료 여부와 관계없이)"""
+    storage = get_storage()
+    course = next((c for c in storage.get_all_courses() if c.id == course_id), None)
+    if course is None:
+        return jsonify({"success": False, "error": "과정을 찾을 수 없습니다."}), 404
+    archive = archive_service.get_archive()
+    if archive.get(course_id) is not None:
+        # 이전 이동이 일부만 진행되어 양쪽에 있음 - 완전한 보관본을 덮어쓰지 않음
+        return jsonify({"success": False, "error": "이미 보관본이 있는 과정입니다. 복원한 뒤 다시 보관해주세요."}), 409
+    record = archive_service.archive_course(storage, archive, course)
+    if record is None:
+        return jsonify({"success": False, "error": "과정을 보관하지 못했습니다. 잠시 후 다시 시도해주세요."}), 409
+    return jsonify({"success": True, "message": "과정이 보관되었습니다.",
+                    "last_date": record.last_date, "archived_at": record.archived_at})
+
+
+@api_bp.route('/courses/<course_id>/restore', methods=['POST'])
+@handle_errors
+def restore_course(course_id):
+    """보관된 과정을 복원 (이후 자동 보관 대상에서 제외)"""
+    course = archive_service.restore(get_storage(), archive_service.get_archive(), course_id)
+    if course is None:
+        return jsonify({"success": False, "error": "보관된 과정을 찾을 수 없습니다."}), 404
+    return jsonify({"success": True, "message": "과정이 복원되었습니다.", "course": _course_summary(course)})
+
+
+@api_bp.route('/archive', methods=['GET'])
+@handle_errors
+def list_archive():
+    """보관된 과정 목록 (메타데이터 + 마지막 일정일, 보관 시각)"""
+    records = archive_service.get_archive().list()
+    return jsonify({"success": True, "courses": [
+        {**_course_summary(r.course), "last_date": r.last_date, "archived_at": r.archived_at}
+        for r in records
+    ]})
+
+
+@api_bp.route('/archive/sweep', methods=['POST'])
+@handle_errors
+def sweep_archive():
+    """종료된 과정 보관을 지금 실행 (body: {"after_days"?: 마지막 일정 이후 경과일, 기본 ARCHIVE_AFTER_DAYS})"""
+    data = request.get_json(silent=True) or {}
+    after_days = data.get('after_days')
+    if after_days is not None and (not isinstance(after_days, int) or isinstance(after_days, bool) or after_days < 1):
+        raise ValueError("after_days 는 1 이상의 정수여야 합니다.")
+    if after_days is None and Config.ARCHIVE_AFTER_DAYS <= 0:
+        raise ValueError("자동 보관이 꺼져 있습니다 (ARCHIVE_AFTER_DAYS). after_days 를 지정해주세요.")
+    archived = archive_service.sweep(after_days=after_days)
+    return jsonify({"success": True, "archived": archived})
+
+
+def _if_match():
+    """If-Match 헤더 → 비교할 ETag (없거나 '*' 이면 None = 조건 없음)"""
+    value = request.headers.get('If-Match', '').strip()
+    if not value or value == '*':
+        return None
+    if value.startswith('W/'):
+        value = value[2:]
+    return value if value.startswith('"') else f'"{value}"'
+
+
+def _precondition_failed():
+    return jsonify({
+        "success": False,
+        "error": "다른 곳에서 먼저 수정되었습니다. 새로고침 후 다시 시도해주세요.",
+    }), 412
+
+
 @api_bp.route('/courses/<course_id>', methods=['PUT'])
 def update_course(course_id):
     """과정 정보 수정 (이름, 색상, 시작시간)"""
-    from services.cosmos_service import get_storage
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "요청 데이터가 없습니다."}), 400
@@ -317,18 +545,20 @@ def update_course(course_id):
         return jsonify({"success": False, "error": "수정할 항목이 없습니다."}), 400
 
     storage = get_storage()
-    success = storage.update_course(course_id, validated)
-    if success:
-        return jsonify({"success": True, "message": "과정 정보가 수정되었습니다."})
+    try:
+        etag = storage.update_course(course_id, validated, _if_match())
+    except PreconditionFailedError:
+        return _precondition_failed()
+    if etag:
+        response = jsonify({"success": True, "message": "과정 정보가 수정되었습니다.", "etag": etag})
+        response.headers['ETag'] = etag
+        return response
     return jsonify({"success": False, "error": "과정을 찾을 수 없습니다."}), 404
 
 
 @api_bp.route('/courses/<course_id>/entries', methods=['POST'])
 def add_entry(course_id):
     """과정에 개별 수업 일정 추가"""
-    from services.cosmos_service import get_storage
-    from services.excel_parser import calculate_end_time
-
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "요청 데이터가 없습니다."}), 400
@@ -344,7 +574,7 @@ def add_entry(course_id):
     is_holiday = bool(data.get('is_holiday', False))
 
     # 입력 검증
-    if not date or not DATE_RE.match(date):
+    if not _validate_date(date):
         return jsonify({"success": False, "error": "날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)"}), 400
     if not class_name:
         return jsonify({"success": False, "error": "수업명을 입력해주세요."}), 400
@@ -369,7 +599,7 @@ def add_entry(course_id):
     storage = get_storage()
     entry_id = storage.add_entry(course_id, entry)
     if entry_id:
-        logger.info(f"수업 일정 추가: {course_id} / {class_name} ({date})")
+        logger.info("수업 일정 추가: %s / %s (%s)", course_id, class_name, date)
         return jsonify({
             "success": True,
             "message": f"'{class_name}' 수업이 추가되었습니다.",
@@ -381,11 +611,10 @@ def add_entry(course_id):
 @api_bp.route('/courses/<course_id>/entries/<entry_id>', methods=['DELETE'])
 def delete_entry(course_id, entry_id):
     """개별 수업 일정 삭제"""
-    from services.cosmos_service import get_storage
     storage = get_storage()
     success = storage.delete_entry(course_id, entry_id)
     if success:
-        logger.info(f"수업 일정 삭제: {course_id} / {entry_id}")
+        logger.info("수업 일정 삭제: %s / %s", course_id, entry_id)
         return jsonify({"success": True, "message": "수업 일정이 삭제되었습니다."})
     return jsonify({"success": False, "error": "수업 일정을 찾을 수 없습니다."}), 404
 
@@ -393,9 +622,6 @@ def delete_entry(course_id, entry_id):
 @api_bp.route('/courses/<course_id>/entries/<entry_id>', methods=['PUT'])
 def update_entry(course_id, entry_id):
     """개별 수업 일정 수정"""
-    from services.cosmos_service import get_storage
-    from services.excel_parser import calculate_end_time
-
     data = request.get_json()
     if not data:
         return jsonify({"success": False, "error": "요청 데이터가 없습니다."}), 400
@@ -403,7 +629,7 @@ def update_entry(course_id, entry_id):
     date = data.get('date', '').strip()
     class_name = _sanitize_name(data.get('class_name', ''), max_len=100)
 
-    if not date or not DATE_RE.match(date):
+    if not _validate_date(date):
         return jsonify({"success": False, "error": "날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)"}), 400
     if not class_name:
         return jsonify({"success": False, "error": "수업명을 입력해주세요."}), 400
@@ -431,8 +657,146 @@ def update_entry(course_id, entry_id):
     }
 
     storage = get_storage()
-    success = storage.update_entry(course_id, entry_id, updates)
-    if success:
-        logger.info(f"수업 일정 수정: {course_id} / {entry_id} ({class_name})")
-        return jsonify({"success": True, "message": f"'{class_name}' 수업이 수정되었습니다."})
+    try:
+        etag = storage.update_entry(course_id, entry_id, updates, _if_match())
+    except PreconditionFailedError:
+        return _precondition_failed()
+    if etag:
+        logger.info("수업 일정 수정: %s / %s (%s)", course_id, entry_id, class_name)
+        response = jsonify({"success": True, "message": f"'{class_name}' 수업이 수정되었습니다.", "etag": etag})
+        response.headers['ETag'] = etag
+        return response
     return jsonify({"success": False, "error": "수업 일정을 찾을 수 없습니다."}), 404
+
+
+@api_bp.route('/reschedule', methods=['POST'])
+@handle_errors
+def reschedule():
+    """휴일 지정 시 수업 일정 자동 조정 (apply 가 없으면 미리보기만)
+
+    body: {"start": "YYYY-MM-DD", "end"?: "YYYY-MM-DD", "course_ids"?: [...],
+           "policy"?: "next_free" | "shift", "apply"?: bool, "plan_id"?: 미리보기의 plan_id}
+    """
+    data = request.get_json(silent=True) or {}
+    course_ids = data.get('course_ids')
+    if course_ids is not None and not (isinstance(course_ids, list) and all(isinstance(c, str) for c in course_ids)):
+        raise ValueError("course_ids 는 과정 ID 리스트여야 합니다.")
+
+    storage = get_storage()
+    preview = reschedule_service.plan(
+        storage.get_all_courses(), data.get('start'), data.get('end'),
+        course_ids=course_ids, policy=data.get('policy') or 'next_free',
+    )
+    if not data.get('apply'):
+        return jsonify({"success": True, "applied": False, **preview})
+
+    expected = data.get('plan_id')
+    if expected and expected != preview["plan_id"]:
+        return jsonify({
+            "success": False, "applied": False,
+            "error": "미리보기 이후 일정이 변경되었습니다. 변경 내용을 다시 확인해주세요.",
+            **preview,
+        }), 409
+    result = reschedule_service.apply(storage, preview)
+    conflicts = [c["course_id"] for c in result["courses"] if c["status"] != "applied"]
+    return jsonify({"success": not conflicts, "applied": True, **result})
+
+
+# ===== 진단 라우트 =====
+
+@api_bp.route('/ready', methods=['GET'])
+def get_ready():
+    """readiness: 시작 준비(저장소 연결 + 과정 캐시 예열)가 끝났으면 200, 아니면 503
+
+    예열 전이거나 실패한 상태면 이 요청에서 실행합니다 (백그라운드 예열 중이면 기다리지 않음).
+    """
+    state = warmup.status()
+    if state["status"] in ("pending", "failed"):
+        state = warmup.run()
+    ready = state["status"] == "ready"
+    return jsonify({"success": ready, **state}), 200 if ready else 503
+
+
+@api_bp.route('/_metrics', methods=['GET'])
+def get_metrics():
+    """프로세스 메트릭 (요청 합치기 횟수 등, 프로파일링 시크릿 필요)"""
+    from utils.profiling import is_authorized
+    if not is_authorized():
+        return jsonify({"success": False, "error": "찾을 수 없습니다."}), 404
+    data = metrics.snapshot()
+    data["singleflight_in_flight"] = singleflight.in_flight()
+    return jsonify({"success": True, **data})
+
+
+@api_bp.route('/_profiles', methods=['GET'])
+def list_profiles():
+    """최근 요청 프로파일 목록 (프로파일링 시크릿 필요)"""
+    from utils.profiling import is_authorized, list_profiles as _list_profiles
+    if not Config.PROFILING_ENABLED or not is_authorized():
+        return jsonify({"success": False, "error": "찾을 수 없습니다."}), 404
+    limit = min(request.args.get('limit', 50, type=int) or 50, Config.PROFILE_KEEP)
+    return jsonify({"success": True, "profiles": _list_profiles(limit)})
+
+
+@api_bp.route('/_profiles/<name>', methods=['GET'])
+def download_profile(name):
+    """프로파일 다운로드 (.prof) 또는 텍스트 요약 (?format=text)"""
+    from utils.profiling import is_authorized, render_profile_text, PROFILE_NAME_RE
+    if not Config.PROFILING_ENABLED or not is_authorized():
+        return jsonify({"success": False, "error": "찾을 수 없습니다."}), 404
+    if not PROFILE_NAME_RE.match(name):
+        return jsonify({"success": False, "error": "잘못된 파일명입니다."}), 400
+    if not os.path.exists(os.path.join(Config.PROFILE_DIR, name)):
+        return jsonify({"success": False, "error": "프로파일을 찾을 수 없습니다."}), 404
+    if request.args.get('format') == 'text':
+        sort_by = request.args.get('sort', 'cumulative')
+        if sort_by not in ('cumulative', 'tottime', 'ncalls'):
+            sort_by = 'cumulative'
+        return Response(render_profile_text(name, sort_by), mimetype='text/plain; charset=utf-8')
+    return send_from_directory(Config.PROFILE_DIR, name, as_attachment=True)
+
+
+# ===== iCalendar 구독 피드 =====
+
+def _ics_response(feed_key, render, filename, empty=None):
+    """피드 → 스트리밍 .ics 응답 (ETag / Last-Modified 조건부 요청이면 304)"""
+    feed = ics_service.get_feed(get_storage(), feed_key, render, empty)
+    if feed is None:
+        return jsonify({"success": False, "error": "피드를 찾을 수 없습니다."}), 404
+    etag, last_modified, chunks = feed
+
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={Config.ICS_MAX_AGE}',
+    }
+    if last_modified is not None:
+        headers['Last-Modified'] = last_modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    if not is_resource_modified(request.environ, etag=etag.strip('"'), last_modified=last_modified):
+        return Response(status=304, headers=headers)
+
+    headers['Content-Disposition'] = f"inline; filename*=UTF-8''{quote(filename)}"
+    return Response(chunks, content_type='text/calendar; charset=utf-8', headers=headers)
+
+
+@feeds_bp.route('/course/<course_id>.ics', methods=['GET'])
+def course_feed(course_id):
+    """과정별 .ics 구독 피드"""
+    return _ics_response(
+        f'course:{course_id}',
+        lambda courses: ics_service.course_feed(courses, course_id),
+        f'{course_id}.ics',
+    )
+
+
+@feeds_bp.route('/instructor/<name>.ics', methods=['GET'])
+def instructor_feed(name):
+    """강사별 .ics 구독 피드 (강사 일정이 없으면 빈 캘린더)"""
+    name = _sanitize_name(name)
+    if not name:
+        return jsonify({"success": False, "error": "강사명이 필요합니다."}), 400
+    return _ics_response(
+        f'instructor:{name}',
+        lambda courses: ics_service.instructor_feed(courses, name),
+        f'{name}.ics',
+        empty=lambda: ics_service.empty_instructor_feed(name),
+    )
@@ -0,0 +1,423 @@
+"""
+종료된 과정 보관 (cold archive)
+
+마지막 일정이 ARCHIVE_AFTER_DAYS 일보다 오래된 과정을 저장소에서 보관소로 옮겨 (옵트인, 기본 0 = 끔),
+get_all_courses / format_events 등 평소 경로가 끝난 과정을 읽지 않게 합니다.
+  - 로컬  : ARCHIVE_DIR/<course_id>.json.gz (과정 + 일정, gzip) + index.json (과정 메타데이터 목록)
+  - Cosmos: 별도 컨테이너 (COSMOS_ARCHIVE_CONTAINER_NAME) 에 과정당 문서 하나 (일정 포함)
+
+보관된 과정은 명시적으로 요청할 때만 읽습니다 (?include_archived=1, /api/archive).
+목록은 메타데이터만 만들고 일정은 과정별로 처음 접근할 때 읽습니다 (LazyCourse).
+
+이동 순서는 보관소 기록 → 저장소에서 삭제, 복원은 저장소에 저장 → 보관소에서 삭제이므로
+중간에 실패해도 과정이 사라지지 않습니다 (양쪽에 남은 과정은 자동 이동에서 제외하며, 복원하면 보관본으로 되돌림).
+복원한 과정은 다시 자동 이동하지 않도록 표시해 두며, 수동 보관(/api/courses/:id/archive)하면 표시가 지워집니다.
+"""
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import NamedTuple
+
+from config import Config
+from models import Course, LazyCourse, content_etag, ordinal_to_date
+from services import pagination
+from services.locking import atomic_write, file_lock
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = 'index.json'
+INDEX_VERSION = 1
+_SAFE_ID = re.compile(r'[A-Za-z0-9_\-]{1,100}')
+ETAG_RETRIES = 3  # 보관 중 과정이 계속 수정될 때 다시 기록하는 최대 횟수
+
+_archive_instance = None
+_archive_init_lock = threading.Lock()
+_start_lock = threading.Lock()
+_started_pid = None
+
+
+class ArchiveRecord(NamedTuple):
+    """보관된 과정 하나 (course 는 일정을 처음 접근할 때 읽는 LazyCourse)"""
+    course: Course
+    last_date: str
+    archived_at: str
+
+
+def get_archive():
+    """보관소 싱글턴 (Cosmos 사용 시 별도 컨테이너, 아니면 로컬 디렉토리)"""
+    global _archive_instance
+    if _archive_instance is not None:
+        return _archive_instance
+    with _archive_init_lock:
+        if _archive_instance is None:
+            _archive_instance = CosmosArchive() if Config.use_cosmos_db() else LocalArchive()
+    return _archive_instance
+
+
+def _last_day(course):
+    return max((e.day for e in course.entries), default=None)
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def _lazy_course(raw, loader):
+    """과정 메타데이터 dict → 일정을 loader() 로 읽는 LazyCourse"""
+    return LazyCourse(
+        id=raw['id'],
+        name=raw.get('name', ''),
+        color=raw.get('color') or '#4A90D9',
+        file_name=raw.get('file_name', ''),
+        uploaded_at=raw.get('uploaded_at', ''),
+        default_start_time=raw.get('default_start_time') or '09:00',
+        entry_count=raw.get('entry_count', 0),
+        loader=loader,
+    )
+
+
+class _ArchiveQueries(ABC):
+    """보관소 공통 조회 (저장소의 query_courses / query_entries 와 같은 형식, 레코드에 archived 표시)"""
+
+    @abstractmethod
+    def list(self):
+        """보관된 과정 레코드 리스트"""
+
+    def courses(self):
+        return [record.course for record in self.list()]
+
+    def query_courses(self, fields=pagination.COURSE_LIST_FIELDS, limit=None, after=None):
+        records = pagination.page_courses(self.courses(), fields, limit, after)
+        for record in records:
+            record["archived"] = True
+        return records
+
+    def query_entries(self, course_id=None, fields=pagination.ENTRY_LIST_FIELDS, limit=None, after=None):
+        records = pagination.page_entries(self.courses(), course_id, fields, limit, after, cache_index=False)
+        for record in records:
+            record["archived"] = True
+        return records
+
+
+class LocalArchive(_ArchiveQueries):
+    """과정별 gzip 파일 + 메타데이터 색인 (색인 교체는 프로세스 간 파일 락 안에서)"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or Config.ARCHIVE_DIR
+        self.index_path = os.path.join(self.directory, INDEX_NAME)
+        self.lockpath = self.index_path + '.lock'
+        self._cache = (None, [])  # (색인 파일 시그니처, ArchiveRecord 리스트)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, course_id):
+        if course_id == 'index' or not _SAFE_ID.fullmatch(course_id):
+            course_id = 'h_' + hashlib.blake2b(course_id.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{course_id}.json.gz")
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {"version": INDEX_VERSION, "courses": [], "restored": []}
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 보관소 색인 버전입니다: {data.get('version')}")
+        return data
+
+    def _write_index(self, data):
+        atomic_write(self.index_path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def _read_file(self, course_id):
+        with open(self._path(course_id), 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def put(self, course):
+        """과정(일정 포함) 기록 → ArchiveRecord"""
+        last_day = _last_day(course)
+        record = ArchiveRecord(course, ordinal_to_date(last_day) if last_day else '', _now())
+        payload = {
+            "course": course.to_dict(),
+            "entries": [e.to_dict() for e in course.entries],
+            "last_date": record.last_date,
+            "archived_at": record.archived_at,
+        }
+        raw = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        atomic_write(self._path(course.id), gzip.compress(raw, mtime=0))
+        with file_lock(self.lockpath):
+            data = self._read_index()
+            data["courses"] = [c for c in data["courses"] if c["id"] != course.id]
+            data["courses"].append({
+                **course.to_dict(), "last_date": record.last_date, "archived_at": record.archived_at,
+            })
+            data["restored"] = [cid for cid in data.get("restored", []) if cid != course.id]
+            self._write_index(data)
+        return record
+
+    def get(self, course_id):
+        """보관된 과정 (일정 포함) → Course 또는 None"""
+        try:
+            data = self._read_file(course_id)
+        except FileNotFoundError:
+            return None
+        return Course.from_dict(data["course"], data["entries"])
+
+    def list(self):
+        """보관된 과정 목록 (색인이 바뀌지 않았으면 이전 목록과 이미 읽은 일정을 재사용)"""
+        try:
+            stat = os.stat(self.index_path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            return []
+        cache = self._cache
+        if cache[0] == signature:
+            return cache[1]
+        records = []
+        for raw in self._read_index()["courses"]:
+            course = _lazy_course(raw, lambda course_id=raw['id']: self._load_entries(course_id))
+            records.append(ArchiveRecord(course, raw.get('last_date', ''), raw.get('archived_at', '')))
+        self._cache = (signature, records)
+        return records
+
+    def _load_entries(self, course_id):
+        course = self.get(course_id)
+        return course.entries if course is not None else []
+
+    def remove(self, course_id, restored=False):
+        """보관소에서 삭제 (restored=True 면 자동 이동 제외 표시) → 있었으면 True"""
+        with file_lock(self.lockpath):
+            data = self._read_index()
+            courses = [c for c in data["courses"] if c["id"] != course_id]
+            found = len(courses) != len(data["courses"])
+            data["courses"] = courses
+            if restored and course_id not in data.get("restored", []):
+                data["restored"] = [*data.get("restored", []), course_id]
+            self._write_index(data)
+        try:
+            os.remove(self._path(course_id))
+        except FileNotFoundError:
+            pass
+        return found
+
+    def restored_ids(self):
+        return set(self._read_index().get("restored", []))
+
+
+class CosmosArchive(_ArchiveQueries):
+    """별도 Cosmos 컨테이너 (파티션 키 /type: 'archive' 과정 문서, 'restored' 복원 표시)"""
+
+    def __init__(self, container=None):
+        if container is not None:
+            self.container = container
+            return
+        from azure.cosmos import CosmosClient, PartitionKey
+        client = CosmosClient(Config.COSMOS_DB_ENDPOINT, Config.COSMOS_DB_KEY)
+        database = client.create_database_if_not_exists(id=Config.COSMOS_DATABASE_NAME)
+        self.container = database.create_container_if_not_exists(
+            id=Config.COSMOS_ARCHIVE_CONTAINER_NAME,
+            partition_key=PartitionKey(path="/type")
+        )
+        logger.info("Cosmos 보관 컨테이너 초기화 완료: %s", Config.COSMOS_ARCHIVE_CONTAINER_NAME)
+
+    def put(self, course):
+        last_day = _last_day(course)
+        record = ArchiveRecord(course, ordinal_to_date(last_day) if last_day else '', _now())
+        self.container.upsert_item(body={
+            "id": course.id,
+            "type": "archive",
+            "course": course.to_dict(),
+            "entries": [e.to_dict() for e in course.entries],
+            "last_date": record.last_date,
+            "archived_at": record.archived_at,
+        })
+        self._delete(course.id, 'restored')
+        return record
+
+    def get(self, course_id):
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        try:
+            doc = self.container.read_item(item=course_id, partition_key='archive')
+        except CosmosResourceNotFoundError:
+            return None
+        return Course.from_dict(doc["course"], doc["entries"])
+
+    def list(self):
+        """보관된 과정 목록 (일정 필드는 읽지 않음)"""
+        docs = self.container.query_items(
+            query="SELECT c.id, c.course, c.last_date, c.archived_at FROM c WHERE c.type = 'archive'",
+            partition_key='archive'
+        )
+        records = []
+        for doc in docs:
+            course = _lazy_course(doc["course"], lambda course_id=doc['id']: self._load_entries(course_id))
+            records.append(ArchiveRecord(course, doc.get('last_date', ''), doc.get('archived_at', '')))
+        return records
+
+    def _load_entries(self, course_id):
+        course = self.get(course_id)
+        return course.entries if course is not None else []
+
+    def _delete(self, item_id, doc_type):
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        try:
+            self.container.delete_item(item=item_id, partition_key=doc_type)
+            return True
+        except CosmosResourceNotFoundError:
+            return False
+
+    def remove(self, course_id, restored=False):
+        found = self._delete(course_id, 'archive')
+        if restored:
+            self.container.upsert_item(body={"id": course_id, "type": "restored", "restored_at": _now()})
+        return found
+
+    def restored_ids(self):
+        return set(self.container.query_items(
+            query="SELECT VALUE c.id FROM c WHERE c.type = 'restored'",
+            partition_key='restored'
+        ))
+
+
+# ===== 이동 / 복원 =====
+
+def _read_course(storage, course_id):
+    """저장소에서 과정 하나를 최신 상태로 읽음 (없으면 None)
+
+    Cosmos 는 그 과정 문서만 다시 읽고 (캐시 래퍼도 backend 에서), 로컬은 파일 시그니처로 최신 여부를 확인합니다.
+    """
+    load = getattr(storage, 'load_course_documents', None)
+    if load is not None:
+        course_doc, entry_docs = load(course_id)
+        return Course.from_dict(course_doc, entry_docs) if course_doc else None
+    return next((c for c in storage.get_all_courses() if c.id == course_id), None)
+
+
+def _fingerprint(course):
+    """과정 + 모든 일정의 ETag → 내용이 바뀌었는지 비교용 값"""
+    return content_etag((course.get_etag(), *sorted(e.get_etag() for e in course.entries)))
+
+
+def archive_course(storage, archive, course):
+    """과정 하나를 보관소로 이동 (보관소 기록 → 저장소에서 삭제) → ArchiveRecord (옮기지 않았으면 None)
+
+    course 는 조회 시점의 스냅샷이므로, 기록 직전과 삭제 직전에 저장소에서 다시 읽어
+    그 사이 일정이 추가/수정되었으면 최신 내용으로 다시 기록합니다 (변경이 계속되면 이번에는 옮기지 않음).
+    삭제가 실패하면 아무것도 지워지지 않은 경우 보관본을 되돌리고, 일부만 지워진 경우 완전한 보관본을 남깁니다.
+    """
+    course_id = course.id
+    current = _read_course(storage, course_id)
+    for _ in range(ETAG_RETRIES):
+        if current is None:
+            return None
+        record = archive.put(current)
+        latest = _read_course(storage, course_id)
+        if latest is None:  # 그 사이 다른 요청이 과정을 삭제함
+            archive.remove(course_id)
+            return None
+        if _fingerprint(latest) == _fingerprint(current):
+            break
+        current = latest
+    else:
+        archive.remove(course_id)
+        logger.warning("과정 보관 보류 (수정이 계속됨): %s", course_id)
+        return None
+
+    if not storage.delete_course(course_id):
+        latest = _read_course(storage, course_id)
+        if latest is not None:
+            metrics.incr('archive.failed')
+            if _fingerprint(latest) == _fingerprint(current):
+                archive.remove(course_id)
+                logger.error("과정 보관 실패 (저장소 삭제 실패, 보관본 되돌림): %s", course_id)
+            else:
+                logger.error("과정 보관 중 저장소 삭제가 일부만 진행됨: %s - 완전한 보관본을 유지하므로 "
+                             "/api/courses/%s/restore 로 되돌리세요.", course_id, course_id)
+            return None
+
+    metrics.incr('archive.archived')
+    logger.info("과정 보관: %s (%s, 마지막 일정 %s)", current.name, course_id, record.last_date or '-')
+    return record
+
+
+def find_finished(courses, after_days, today=None):
+    """마지막 일정이 after_days 일보다 오래된 과정 (일정이 없는 과정은 제외)"""
+    cutoff = (today or date.today()).toordinal() - after_days
+    finished = []
+    for course in courses:
+        last_day = _last_day(course)
+        if last_day is not None and last_day < cutoff:
+            finished.append(course)
+    return finished
+
+
+def sweep(storage=None, archive=None, after_days=None, today=None):
+    """종료된 과정을 모두 보관소로 이동 (복원 표시된 과정 제외) → 이동한 과정 ID 리스트"""
+    from services.cosmos_service import get_storage
+    storage = storage or get_storage()
+    archive = archive or get_archive()
+    after_days = Config.ARCHIVE_AFTER_DAYS if after_days is None else after_days
+    if after_days <= 0:
+        return []
+
+    started = time.perf_counter()
+    candidates = find_finished(storage.get_all_courses(), after_days, today)
+    if candidates:
+        # 복원한 과정, 그리고 이전 이동이 일부만 진행되어 양쪽에 있는 과정 (보관본을 덮어쓰지 않음) 제외
+        skip = archive.restored_ids() | {r.course.id for r in archive.list()}
+        candidates = [c for c in candidates if c.id not in skip]
+    archived = []
+    for course in candidates:
+        record = archive_course(storage, archive, course)
+        if record is not None:
+            archived.append(record.course.id)
+    metrics.observe('archive.sweep', time.perf_counter() - started)
+    if archived:
+        logger.info("종료된 과정 보관: %s개 (마지막 일정 %s일 경과)", len(archived), after_days)
+    return archived
+
+
+def restore(storage, archive, course_id):
+    """보관된 과정을 저장소로 복원 → Course (보관소에 없으면 None)
+
+    이전 이동이 중간에 실패해 저장소에도 남아 있으면 그 과정을 지우고 보관본으로 다시 저장합니다.
+    """
+    course = archive.get(course_id)
+    if course is None:
+        return None
+    if any(c.id == course_id for c in storage.get_all_courses()):
+        storage.delete_course(course_id)
+    storage.save_courses([(course.to_dict(), [e.to_dict() for e in course.entries])])
+    archive.remove(course_id, restored=True)
+    metrics.incr('archive.restored')
+    logger.info("과정 복원: %s (%s, 일정 %s개)", course.name, course_id, len(course.entries))
+    return course
+
+
+def _run(interval):
+    # 시작 직후에는 옮기지 않음 (배포/재시작마다 과정이 이동하지 않도록 한 주기 뒤부터)
+    while True:
+        time.sleep(interval)
+        try:
+            sweep()
+        except Exception:
+            logger.exception("종료된 과정 보관 실패")
+
+
+def start():
+    """백그라운드 자동 보관 스레드 시작 (옵트인: ARCHIVE_AFTER_DAYS 를 지정해야 사용, 첫 이동은 한 주기 뒤)"""
+    global _started_pid
+    interval = Config.ARCHIVE_INTERVAL
+    if not interval or Config.ARCHIVE_AFTER_DAYS <= 0:
+        return
+    with _start_lock:
+        if _started_pid == os.getpid():
+            return
+        _started_pid = os.getpid()
+    threading.Thread(target=_run, args=(interval,), name='course-archiver', daemon=True).start()
@@ -0,0 +1,179 @@
+"""
+azure.cosmos.aio 기반 Cosmos 저장소 (동기 facade)
+
+동기 CosmosClient 는 문서 하나마다 요청 스레드가 네트워크 왕복을 기다리므로,
+여러 문서를 다루는 작업(업로드, 과정 삭제, 전체 조회)이 왕복 횟수만큼 길어집니다.
+
+AsyncCosmosStorage 는
+  - 전용 이벤트 루프 스레드 하나에서 aio CosmosClient 하나(= aiohttp 커넥션 풀 하나)를 공유하고
+  - 여러 문서 작업은 asyncio.gather 로 동시에 보내되 세마포어(COSMOS_ASYNC_CONCURRENCY)로 제한하며
+  - CosmosStorage 와 같은 동기 메서드를 제공합니다 (routes.py 변경 없음).
+단일 문서 작업(수정, 일정 추가/삭제 등)은 CosmosStorage 구현을 그대로 쓰고,
+컨테이너 호출만 이벤트 루프로 넘겨 실행합니다.
+"""
+import asyncio
+import logging
+import threading
+
+from config import Config
+from services.cosmos_service import CosmosStorage
+
+logger = logging.getLogger(__name__)
+
+
+async def _collect(items):
+    return [item async for item in items]
+
+
+class _SyncContainer:
+    """aio ContainerProxy → CosmosStorage 가 쓰는 동기 ContainerProxy 메서드"""
+
+    def __init__(self, container, run):
+        self.aio = container
+        self._run = run
+
+    def __getattr__(self, name):
+        return getattr(self.aio, name)
+
+    def create_item(self, body, **kwargs):
+        return self._run(self.aio.create_item(body=body, **kwargs))
+
+    def upsert_item(self, body, **kwargs):
+        return self._run(self.aio.upsert_item(body=body, **kwargs))
+
+    def read_item(self, item, partition_key, **kwargs):
+        return self._run(self.aio.read_item(item=item, partition_key=partition_key, **kwargs))
+
+    def replace_item(self, item, body, **kwargs):
+        return self._run(self.aio.replace_item(item=item, body=body, **kwargs))
+
+    def patch_item(self, item, partition_key, patch_operations, **kwargs):
+        return self._run(self.aio.patch_item(
+            item=item, partition_key=partition_key, patch_operations=patch_operations, **kwargs
+        ))
+
+    def delete_item(self, item, partition_key, **kwargs):
+        return self._run(self.aio.delete_item(item=item, partition_key=partition_key, **kwargs))
+
+    def query_items(self, query, parameters=None, partition_key=None, enable_cross_partition_query=None, **kwargs):
+        # aio 클라이언트는 partition_key 가 없으면 자동으로 교차 파티션 쿼리
+        if partition_key is not None:
+            kwargs['partition_key'] = partition_key
+        return iter(self._run(_collect(self.aio.query_items(query, parameters=parameters, **kwargs))))
+
+    def query_items_change_feed(self, **kwargs):
+        return iter(self._run(_collect(self.aio.query_items_change_feed(**kwargs))))
+
+
+class AsyncCosmosStorage(CosmosStorage):
+    """azure.cosmos.aio 기반 저장소 (여러 문서 작업을 동시에 실행)"""
+
+    def __init__(self, container=None, concurrency=None):
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name='cosmos-aio', daemon=True).start()
+        self._semaphore = asyncio.Semaphore(concurrency or Config.COSMOS_ASYNC_CONCURRENCY)
+        self._client = None
+
+        if container is None:
+            container = self._run(self._open())
+        super().__init__(container=_SyncContainer(container, self._run))
+        if self._client is not None:
+            self._start_orphan_sweeper()
+            logger.info("Azure Cosmos DB 저장소 초기화 완료 (aio)")
+
+    async def _open(self):
+        from azure.cosmos import PartitionKey
+        from azure.cosmos.aio import CosmosClient
+        self._client = CosmosClient(Config.COSMOS_DB_ENDPOINT, Config.COSMOS_DB_KEY)
+        database = await self._client.create_database_if_not_exists(id=Config.COSMOS_DATABASE_NAME)
+        return await database.create_container_if_not_exists(
+            id=Config.COSMOS_CONTAINER_NAME,
+            partition_key=PartitionKey(path="/type")
+        )
+
+    def close(self):
+        """클라이언트(커넥션 풀)를 닫고 이벤트 루프 종료"""
+        if self._client is not None:
+            self._run(self._client.close())
+            self._client = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # ---- 이벤트 루프 실행 ----
+
+    async def _limited(self, coro):
+        async with self._semaphore:
+            return await coro
+
+    def _run(self, coro):
+        """요청 스레드에서 코루틴을 이벤트 루프로 넘겨 실행하고 결과를 기다림"""
+        return asyncio.run_coroutine_threadsafe(self._limited(coro), self._loop).result()
+
+    def _gather(self, coros):
+        """여러 코루틴을 동시에 실행 (각각 세마포어로 제한) → 같은 순서의 결과/예외 리스트"""
+        async def run_all():
+            return await asyncio.gather(*(self._limited(c) for c in coros), return_exceptions=True)
+        return asyncio.run_coroutine_threadsafe(run_all(), self._loop).result()
+
+    # ---- 여러 문서 작업 (동시 실행) ----
+
+    def load_documents(self):
+        """전체 과정/일정 문서 → (과정 문서 리스트, 일정 문서 리스트) - 두 쿼리를 동시에 실행"""
+        aio = self.container.aio
+        course_docs, entry_docs = self._gather([
+            _collect(aio.query_items(
+                "SELECT * FROM c WHERE c.type = 'course' ORDER BY c.uploaded_at DESC",
+                partition_key='course'
+            )),
+            _collect(aio.query_items(
+                "SELECT * FROM c WHERE c.type = 'entry'",
+                partition_key='entry'
+            )),
+        ])
+        for result in (course_docs, entry_docs):
+            if isinstance(result, BaseException):
+                raise result
+        return course_docs, entry_docs
+
+    def save_course(self, course, entries):
+        """과정과 수업 일정 저장 (과정 문서 생성 후 일정 문서들을 동시에 생성)"""
+        self.save_courses([(course, entries)])
+
+    def save_courses(self, items):
+        """여러 과정 저장 (items: [(course dict, entries dict 리스트)])
+
+        과정 문서를 모두 먼저 만든 뒤 일정 문서를 만들므로, 일정은 항상 과정 문서가 있는 상태에서
+        생깁니다 (sweep_orphans 가 오인하지 않음). 실패가 있으면 첫 예외를 다시 던집니다.
+        """
+        aio = self.container.aio
+        self._raise_first(self._gather([aio.create_item(body=course) for course, _ in items]))
+        entry_docs = [
+            {
+                "id": entry.get('id') or self._generate_id("entry"),
+                "type": "entry",
+                "course_id": course['id'],
+                **{k: v for k, v in entry.items() if k != 'id'}
+            }
+            for course, entries in items
+            for entry in entries
+        ]
+        self._raise_first(self._gather([aio.create_item(body=doc) for doc in entry_docs]))
+        for course, entries in items:
+            logger.info("과정 문서 저장: %s (수업 일정 %s개)", course['name'], len(entries))
+
+    @staticmethod
+    def _raise_first(results):
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _delete_entries(self, entry_ids):
+        """일정 문서 동시 삭제 → 삭제 실패한 id 리스트 (이미 없는 문서는 성공)"""
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        aio = self.container.aio
+        results = self._gather([aio.delete_item(item=entry_id, partition_key='entry') for entry_id in entry_ids])
+        failed = []
+        for entry_id, result in zip(entry_ids, results):
+            if isinstance(result, BaseException) and not isinstance(result, CosmosResourceNotFoundError):
+                logger.warning("일정 삭제 실패: %s (%s)", entry_id, result)
+                failed.append(entry_id)
+        return failed
@@ -0,0 +1,225 @@
+"""
+여러 시간표 엑셀을 ZIP 하나로 일괄 등록
+
+1. ZIP 검증/추출: 경로 조작(.., 절대경로) 차단, 파일 수·크기·압축률 제한,
+   헤더의 크기를 믿지 않고 추출하면서 실제 바이트 수를 셈 (zip bomb 방지)
+2. 파싱: 워크북별로 bounded 스레드 풀에서 동시에 파싱
+   (zip 압축 해제·파일 I/O 는 GIL 을 놓으므로 겹쳐지고, 동시에 열린 워크북 수가 제한됨.
+    프로세스 풀은 웹 서버 워커 안에서 fork/spawn 해야 해서 사용하지 않음)
+3. 저장: 성공한 과정만 storage.save_courses() 로 한 번에 저장
+4. 파일별 결과 리포트 반환
+"""
+import os
+import json
+import shutil
+import uuid
+import zipfile
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from config import Config
+from services.excel_parser import parse_timetable, get_sheet_names
+from services.upload_reaper import IN_USE_MARKER
+
+logger = logging.getLogger(__name__)
+
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xlsm')
+MANIFEST_NAME = 'manifest.json'
+COPY_CHUNK = 64 * 1024
+
+
+class ArchiveError(ValueError):
+    """ZIP 자체를 처리할 수 없음 (전체 요청 실패)"""
+
+
+def _member_name_ok(name):
+    parts = name.replace('\\', '/').split('/')
+    return not (name.startswith(('/', '\\')) or ':' in parts[0] or '..' in parts)
+
+
+def _copy_limited(src, dst, limit):
+    """최대 limit 바이트까지 복사 (초과하면 ArchiveError)"""
+    written = 0
+    while True:
+        chunk = src.read(COPY_CHUNK)
+        if not chunk:
+            return written
+        written += len(chunk)
+        if written > limit:
+            raise ArchiveError("압축 해제 크기 제한을 초과했습니다.")
+        dst.write(chunk)
+
+
+def extract_workbooks(zip_path, dest_dir):
+    """ZIP → dest_dir 에 워크북 추출 → ({멤버명: 파일경로}, manifest bytes 또는 None)"""
+    try:
+        zf = zipfile.ZipFile(zip_path)
+    except zipfile.BadZipFile:
+        raise ArchiveError("유효한 ZIP 파일이 아닙니다.")
+
+    with zf:
+        members = [
+            info for info in zf.infolist()
+            if not info.is_dir() and not os.path.basename(info.filename).startswith(('.', '~$'))
+            and '__MACOSX/' not in info.filename
+        ]
+        workbooks = [m for m in members if m.filename.lower().endswith(WORKBOOK_EXTENSIONS)]
+        if not workbooks:
+            raise ArchiveError("ZIP 안에 엑셀(.xlsx) 파일이 없습니다.")
+        if len(workbooks) > Config.BULK_MAX_FILES:
+            raise ArchiveError(f"한 번에 최대 {Config.BULK_MAX_FILES}개 파일까지 등록할 수 있습니다.")
+
+        declared_total = 0
+        for info in members:
+            if not _member_name_ok(info.filename):
+                raise ArchiveError(f"잘못된 파일 경로가 포함되어 있습니다: {info.filename}")
+            if info.file_size > Config.BULK_MAX_MEMBER_SIZE:
+                raise ArchiveError(f"파일이 너무 큽니다: {info.filename}")
+            if info.compress_size and info.file_size / info.compress_size > Config.BULK_MAX_RATIO:
+                raise ArchiveError(f"압축률이 비정상적인 파일입니다: {info.filename}")
+            declared_total += info.file_size
+        if declared_total > Config.BULK_MAX_TOTAL_SIZE:
+            raise ArchiveError("압축 해제 크기 제한을 초과했습니다.")
+
+        manifest = None
+        manifest_info = next((m for m in members if os.path.basename(m.filename) == MANIFEST_NAME), None)
+        if manifest_info is not None:
+            with zf.open(manifest_info) as f:
+                manifest = f.read(Config.BULK_MAX_MEMBER_SIZE + 1)
+
+        # 저장 파일명은 순번으로 만들어 멤버명과 무관하게 dest_dir 내부로 고정
+        remaining = Config.BULK_MAX_TOTAL_SIZE
+        paths = {}
+        for n, info in enumerate(workbooks):
+            path = os.path.join(dest_dir, f"{n:03d}{os.path.splitext(info.filename)[1].lower()}")
+            with zf.open(info) as src, open(path, 'wb') as dst:
+                remaining -= _copy_limited(src, dst, min(Config.BULK_MAX_MEMBER_SIZE, remaining))
+            paths[info.filename] = path
+        return paths, manifest
+
+
+def _match_spec(member, specs):
+    """manifest 항목 찾기 (ZIP 내 전체 경로 또는 파일명으로 매칭)"""
+    return specs.get(member) or specs.get(os.path.basename(member))
+
+
+def _parse_job(job):
+    """(파일경로, 시트 선택, 시작시간) → (사용한 시트, entries)"""
+    path, sheets, start_time = job
+    available = get_sheet_names(path)
+    if sheets == 'all':
+        selected = available
+    else:
+        missing = [s for s in sheets if s not in available]
+        if missing:
+            raise ValueError(f"시트를 찾을 수 없습니다: {', '.join(missing)}")
+        selected = sheets
+    if not selected:
+        raise ValueError("유효한 시트를 찾을 수 없습니다.")
+    return selected, parse_timetable(path, selected, start_time)
+
+
+def _run_jobs(jobs):
+    """jobs → 같은 순서의 (결과, 예외) 리스트"""
+    if not jobs:
+        return []
+    workers = max(1, min(Config.BULK_IMPORT_WORKERS, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bulk-import') as pool:
+        futures = [pool.submit(_parse_job, job) for job in jobs]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
+
+def _new_course(name, color, start_time, file_name, entry_count):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return {
+        "id": f"course_{timestamp}_{str(uuid.uuid4())[:8]}",
+        "type": "course",
+        "name": name,
+        "color": color,
+        "file_name": file_name,
+        "uploaded_at": datetime.now().isoformat(),
+        "default_start_time": start_time,
+        "entry_count": entry_count,
+    }
+
+
+def parse_manifest(raw):
+    """manifest(JSON 문자열/bytes 또는 dict/list) → {파일명: 항목 dict}
+
+    형식: [{"file": "a.xlsx", "course_name": ..., "color": ..., "start_time": ..., "sheets": "all" | [...]}]
+          또는 {"courses": [...]}
+    """
+    if raw is None or raw == '' or raw == b'':
+        return {}
+    if isinstance(raw, (str, bytes)):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            raise ArchiveError("manifest 형식이 올바르지 않습니다. (JSON)")
+    items = raw.get('courses') if isinstance(raw, dict) else raw
+    if not isinstance(items, list) or not all(isinstance(i, dict) and i.get('file') for i in items):
+        raise ArchiveError("manifest 는 file 항목을 가진 과정 리스트여야 합니다.")
+    return {str(item['file']).replace('\\', '/'): item for item in items}
+
+
+def import_archive(zip_path, manifest, make_spec, storage):
+    """ZIP 일괄 등록 → 파일별 리포트 리스트
+
+    manifest: 요청으로 받은 manifest (없으면 ZIP 안의 manifest.json 사용)
+    make_spec(item, member) → 검증된 {"course_name", "color", "start_time", "sheets"}
+      (item 은 manifest 항목, manifest 에 없는 파일이면 빈 dict)
+    """
+    work_dir = os.path.join(Config.UPLOAD_FOLDER, f"bulk_{uuid.uuid4().hex[:8]}")
+    os.makedirs(work_dir)
+    try:
+        # 파싱이 끝날 때까지 업로드 정리(quota)가 작업 디렉토리를 지우지 않도록 표시
+        open(os.path.join(work_dir, IN_USE_MARKER), 'wb').close()
+        paths, zip_manifest = extract_workbooks(zip_path, work_dir)
+        items = parse_manifest(manifest if manifest else zip_manifest)
+
+        report, jobs, pending = [], [], []
+        for member, path in paths.items():
+            spec = make_spec(_match_spec(member, items) or {}, member)
+            item = {"file": member, "course_name": spec["course_name"]}
+            report.append(item)
+            if len(spec["course_name"]) < 2:
+                item.update(status="error", error="과정명은 2자 이상 입력해주세요.")
+                continue
+            jobs.append((path, spec["sheets"], spec["start_time"]))
+            pending.append((item, spec))
+
+        for name in items:
+            if not any(name in (m, os.path.basename(m)) for m in paths):
+                report.append({"file": name, "status": "error", "error": "ZIP 안에 파일이 없습니다."})
+
+        to_save = []
+        for (item, spec), (result, error) in zip(pending, _run_jobs(jobs)):
+            if error is not None:
+                logger.warning("일괄 등록 파싱 실패: %s: %s", item['file'], error)
+                message = str(error) if isinstance(error, ValueError) else "시간표 파싱 중 오류가 발생했습니다."
+                item.update(status="error", error=message)
+                continue
+            sheets, entries = result
+            if not entries:
+                item.update(status="error", error="파싱된 수업 일정이 없습니다.")
+                continue
+            course = _new_course(
+                spec["course_name"], spec["color"], spec["start_time"],
+                os.path.basename(item["file"]), len(entries),
+            )
+            item.update(status="ok", course_id=course["id"], sheets=sheets, entry_count=len(entries))
+            to_save.append((course, entries))
+
+        if to_save:
+            storage.save_courses(to_save)
+        logger.info("일괄 등록 완료: %s/%s개 과정", len(to_save), len(paths))
+        return report
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,328 @@
+"""
+CosmosStorage 앞단 stale-while-revalidate 읽기 캐시
+
+- 읽기는 메모리 스냅샷에서 바로 반환합니다.
+  스냅샷이 max_age 초보다 오래되면 백그라운드 스레드에서 새로 읽고 (single-flight),
+  그동안은 이전 스냅샷을 그대로 반환합니다. max_stale 초를 넘으면 새로 읽을 때까지 기다립니다.
+- 이 인스턴스의 쓰기는 해당 과정 문서만 다시 읽어 스냅샷에 즉시 반영합니다.
+- (선택) Cosmos change feed 를 폴링해 다른 인스턴스의 생성/수정을 과정 단위로 반영합니다.
+  삭제는 change feed 에 나오지 않으므로 주기적 전체 갱신으로 반영됩니다.
+
+데이터 버전은 문서 (id, _etag) 해시의 XOR 입니다. 순서와 무관하고 과정 단위로 증분 갱신되며,
+같은 데이터면 인스턴스가 달라도 같은 버전이 됩니다.
+변경은 과정 단위 StorageChange 로 리스너(파생 인덱스 등)에 전달됩니다.
+"""
+import hashlib
+import logging
+import threading
+import time
+
+from config import Config
+from models import Course
+from services import pagination
+from services.cosmos_service import PreconditionFailedError, StorageChange, StorageEventsMixin
+
+logger = logging.getLogger(__name__)
+
+
+def _doc_hash(doc):
+    digest = hashlib.blake2b(f"{doc['id']}\0{doc.get('_etag', '')}".encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def _course_fingerprint(course_doc, entry_docs):
+    fp = _doc_hash(course_doc)
+    for doc in entry_docs:
+        fp ^= _doc_hash(doc)
+    return fp
+
+
+def _format_version(fp):
+    return f"{fp:032x}"
+
+
+def _sort_courses(courses):
+    # CosmosStorage.get_all_courses 와 같은 순서 (업로드 최신순)
+    return sorted(courses, key=lambda c: c.uploaded_at, reverse=True)
+
+
+class _Snapshot:
+    __slots__ = ('courses', 'by_id', 'fingerprints', 'version', 'loaded_at')
+
+    def __init__(self, courses, fingerprints, loaded_at):
+        self.courses = courses                      # Course 리스트 (읽기 전용)
+        self.by_id = {c.id: c for c in courses}
+        self.fingerprints = fingerprints            # course_id → 과정 문서들의 해시 XOR
+        version = 0
+        for fp in fingerprints.values():
+            version ^= fp
+        self.version = _format_version(version)
+        self.loaded_at = loaded_at
+
+
+class CachedStorage(StorageEventsMixin):
+    """CosmosStorage 읽기 캐시 래퍼 (쓰기는 backend 로 위임 후 스냅샷 패치)"""
+
+    def __init__(self, backend, max_age=None, max_stale=None, change_feed_interval=None):
+        self.backend = backend
+        self.max_age = Config.COSMOS_CACHE_MAX_AGE if max_age is None else max_age
+        self.max_stale = Config.COSMOS_CACHE_MAX_STALE if max_stale is None else max_stale
+        self._snapshot = None
+        self._lock = threading.Lock()           # 스냅샷 교체/패치
+        self._refresh_lock = threading.Lock()   # single-flight 전체 갱신
+        self._refreshing = False
+        self._written = set()                   # 진행 중인 전체 갱신 이후 직접 반영한 과정
+        self.stats = {"hits": 0, "stale_hits": 0, "refreshes": 0, "course_reloads": 0}
+
+        interval = Config.COSMOS_CHANGE_FEED_INTERVAL if change_feed_interval is None else change_feed_interval
+        if interval:
+            threading.Thread(
+                target=self._follow_change_feed, args=(interval,),
+                name='cosmos-change-feed', daemon=True,
+            ).start()
+
+    def __getattr__(self, name):
+        # container 등 래핑하지 않은 속성은 backend 로 위임
+        return getattr(self.backend, name)
+
+    # ---- 스냅샷 ----
+
+    def _load_full(self):
+        course_docs, entry_docs = self.backend.load_documents()
+        by_course = {}
+        for doc in entry_docs:
+            by_course.setdefault(doc.get('course_id'), []).append(doc)
+        courses, fingerprints = [], {}
+        for doc in course_docs:
+            entries = by_course.get(doc['id'], [])
+            courses.append(Course.from_dict(doc, entries))
+            fingerprints[doc['id']] = _course_fingerprint(doc, entries)
+        return courses, fingerprints
+
+    def refresh(self):
+        """전체 다시 읽기 (동시에 여러 번 호출되면 한 번만 실행하고 나머지는 그 결과를 기다림)"""
+        if not self._refresh_lock.acquire(blocking=False):
+            with self._refresh_lock:  # 진행 중인 갱신이 끝날 때까지 대기
+                return
+        changes = []
+        try:
+            with self._lock:
+                self._written = set()
+            started = time.monotonic()
+            courses, fingerprints = self._load_full()
+            self.stats["refreshes"] += 1
+            with self._lock:
+                old = self._snapshot
+                if old is not None:
+                    # 갱신 도중 이 인스턴스가 쓴 과정은 이미 더 최신 값이 반영되어 있음
+                    new_by_id = {c.id: c for c in courses}
+                    for course_id in self._written:
+                        if course_id in old.by_id:
+                            new_by_id[course_id] = old.by_id[course_id]
+                            fingerprints[course_id] = old.fingerprints[course_id]
+                        else:
+                            new_by_id.pop(course_id, None)
+                            fingerprints.pop(course_id, None)
+                    courses = _sort_courses(new_by_id.values())
+                changes = self._install(_Snapshot(courses, fingerprints, started))
+        finally:
+            self._refreshing = False
+            self._refresh_lock.release()
+        self._publish(changes)
+
+    def _install(self, new):
+        """스냅샷 교체 → 과정 단위 변경 리스트 (self._lock 안에서 호출)"""
+        old = self._snapshot
+        self._snapshot = new
+        if old is None or old.version == new.version:
+            return []
+        changes = []
+        version = old.version
+        for course_id in old.fingerprints.keys() | new.fingerprints.keys():
+            before_fp = old.fingerprints.get(course_id)
+            after_fp = new.fingerprints.get(course_id)
+            if before_fp == after_fp:
+                continue
+            # 과정 하나씩 순서대로 반영한 중간 버전을 만들어 연속된 before/after 를 보장
+            next_version = _format_version(int(version, 16) ^ (before_fp or 0) ^ (after_fp or 0))
+            before_course = old.by_id.get(course_id)
+            after_course = new.by_id.get(course_id)
+            changes.append(StorageChange(
+                course_id,
+                tuple(before_course.entries) if before_course else (),
+                tuple(after_course.entries) if after_course else (),
+                version, next_version, after_course,
+            ))
+            version = next_version
+        return changes
+
+    def _publish(self, changes):
+        """락 밖에서 알림 (리스너가 자기 락을 잡은 채 저장소를 읽어도 교착되지 않도록)
+
+        스레드 간 알림 순서가 뒤바뀌면 리스너는 before 버전 불일치로 재구성합니다.
+        """
+        for change in changes:
+            self._notify(change)
+
+    def _refresh_now(self):
+        self.refresh()
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("Cosmos 데이터를 읽지 못했습니다.")
+        return snapshot
+
+    def _current(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self._refresh_now()
+        age = time.monotonic() - snapshot.loaded_at
+        if age <= self.max_age:
+            self.stats["hits"] += 1
+            return snapshot
+        if age > self.max_stale:
+            return self._refresh_now()
+        self.stats["stale_hits"] += 1
+        self._refresh_in_background()
+        return snapshot
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Cosmos 캐시 갱신 실패 (이전 스냅샷 유지)")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name='cosmos-cache-refresh', daemon=True).start()
+
+    def _reload_course(self, course_id):
+        """과정 하나만 다시 읽어 스냅샷에 반영"""
+        course_doc, entry_docs = self.backend.load_course_documents(course_id)
+        self.stats["course_reloads"] += 1
+        with self._lock:
+            old = self._snapshot
+            if old is None:
+                return  # 아직 첫 전체 로드 전 (다음 로드에 포함됨)
+            self._written.add(course_id)
+            by_id = dict(old.by_id)
+            fingerprints = dict(old.fingerprints)
+            if course_doc is None:
+                by_id.pop(course_id, None)
+                fingerprints.pop(course_id, None)
+            else:
+                by_id[course_id] = Course.from_dict(course_doc, entry_docs)
+                fingerprints[course_id] = _course_fingerprint(course_doc, entry_docs)
+            changes = self._install(_Snapshot(_sort_courses(by_id.values()), fingerprints, old.loaded_at))
+        self._publish(changes)
+
+    def _follow_change_feed(self, interval):
+        """다른 인스턴스의 생성/수정을 change feed 로 받아 과정 단위로 반영"""
+        container = self.backend.container
+        continuation = None
+        while True:
+            try:
+                changed = set()
+                for pk in ('course', 'entry'):
+                    # 다음 continuation 은 이 피드 응답의 etag (client_connection.last_response_headers 는
+                    # 다른 스레드의 요청이 덮어쓸 수 있음). 훅은 페이지마다 불리므로 마지막 값이 최신입니다.
+                    feed_etag = []
+                    docs = container.query_items_change_feed(
+                        partition_key=pk,
+                        is_start_from_beginning=False,
+                        continuation=continuation.get(pk) if continuation else None,
+                        response_hook=lambda headers, _result, out=feed_etag: out.append(headers.get('etag')),
+                    )
+                    for doc in docs:
+                        changed.add(doc['id'] if doc.get('type') == 'course' else doc.get('course_id'))
+                    if feed_etag and feed_etag[-1]:
+                        continuation = dict(continuation or {})
+                        continuation[pk] = feed_etag[-1]
+                if self._snapshot is not None:
+                    for course_id in changed - {None}:
+                        self._reload_course(course_id)
+            except Exception:
+                logger.exception("Cosmos change feed 처리 실패")
+            time.sleep(interval)
+
+    # ---- 읽기 (메모리) ----
+
+    def get_all_courses(self):
+        return self._current().courses
+
+    def get_snapshot(self):
+        snapshot = self._current()
+        return snapshot.version, snapshot.courses
+
+    def get_data_version(self):
+        return self._current().version
+
+    def query_courses(self, fields=pagination.COURSE_LIST_FIELDS, limit=None, after=None):
+        return pagination.page_courses(self._current().courses, fields, limit, after)
+
+    def query_entries(self, course_id=None, fields=pagination.ENTRY_LIST_FIELDS, limit=None, after=None):
+        return pagination.page_entries(self._current().courses, course_id, fields, limit, after)
+
+    # ---- 쓰기 (backend 위임 후 스냅샷 패치) ----
+
+    def _conditional(self, course_id, write, *args):
+        """If-Match 쓰기: ETag 불일치면 캐시가 오래된 것이므로 과정을 다시 읽은 뒤 예외 전달"""
+        try:
+            return write(*args)
+        except PreconditionFailedError:
+            self._reload_course(course_id)
+            raise
+
+    def save_course(self, course, entries):
+        self.backend.save_course(course, entries)
+        self._reload_course(course['id'])
+
+    def save_courses(self, items):
+        self.backend.save_courses(items)
+        for course, _ in items:
+            self._reload_course(course['id'])
+
+    def create_course(self, course):
+        course_id = self.backend.create_course(course)
+        if course_id:
+            self._reload_course(course_id)
+        return course_id
+
+    def delete_course(self, course_id):
+        ok = self.backend.delete_course(course_id)
+        self._reload_course(course_id)
+        return ok
+
+    def update_course(self, course_id, updates, if_match=None):
+        ok = self._conditional(course_id, self.backend.update_course, course_id, updates, if_match)
+        if ok:
+            self._reload_course(course_id)
+        return ok
+
+    def add_entry(self, course_id, entry):
+        entry_id = self.backend.add_entry(course_id, entry)
+        if entry_id:
+            self._reload_course(course_id)
+        return entry_id
+
+    def delete_entry(self, course_id, entry_id):
+        ok = self.backend.delete_entry(course_id, entry_id)
+        self._reload_course(course_id)
+        return ok
+
+    def update_entry(self, course_id, entry_id, updates, if_match=None):
+        ok = self._conditional(course_id, self.backend.update_entry, course_id, entry_id, updates, if_match)
+        if ok:
+            self._reload_course(course_id)
+        return ok
+
+    def bulk_update_entries(self, course_id, updates, if_match=None):
+        etags = self._conditional(course_id, self.backend.bulk_update_entries, course_id, updates, if_match)
+        if etags:
+            self._reload_course(course_id)
+        return etags
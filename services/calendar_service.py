@@ -1,32 +1,36 @@
 """
 FullCalendar 이벤트 포맷 변환 서비스
+
+입력은 저장소가 반환하는 Course / ClassEntry 모델이며, 여기서 JSON 용 dict 로 변환합니다.
 """
 from collections import defaultdict
 
+from models import ordinal_to_date
+
 
 def format_events(courses, course_id_filter=None):
     """과정 데이터를 FullCalendar 이벤트 JSON 포맷으로 변환"""
     events = []
 
     for course in courses:
-        if course_id_filter and course.get('id') != course_id_filter:
+        if course_id_filter and course.id != course_id_filter:
             continue
 
-        color = course.get('color', '#4A90D9')
-        course_name = course.get('name', '')
-        cid = course.get('id', '')
+        color = course.color
+        course_name = course.name
+        cid = course.id
 
-        for entry in course.get('entries', []):
-            date = entry.get('date', '')
-            is_holiday = entry.get('is_holiday', False)
+        for entry in course.entries:
+            date = entry.date
+            is_holiday = entry.is_holiday
 
-            entry_id = entry.get('id', '')
+            entry_id = entry.id
 
             if is_holiday:
                 # 공휴일은 종일 이벤트로 표시
                 event = {
                     "id": entry_id or f"{cid}_holiday_{date}",
-                    "title": f"[휴일] {entry.get('class_name', '')}",
+                    "title": f"[휴일] {entry.class_name}",
                     "start": date,
                     "allDay": True,
                     "color": "#f3f4f6",
@@ -37,16 +41,17 @@ def format_events(courses, course_id_filter=None):
                         "course_id": cid,
                         "course_name": course_name,
                         "entry_id": entry_id,
+                        "etag": entry.get_etag(),
                         "instructor": "",
                         "hours": 0,
                         "is_holiday": True,
                     }
                 }
             else:
-                start_time = entry.get('start_time', '09:00')
-                end_time = entry.get('end_time', '18:00')
-                instructor = entry.get('instructor', '')
-                class_name = entry.get('class_name', '')
+                start_time = entry.start_time
+                end_time = entry.end_time
+                instructor = entry.instructor
+                class_name = entry.class_name
                 title = f"({instructor}) {class_name}" if instructor else class_name
                 event = {
                     "id": entry_id or f"{cid}_{date}",
@@ -59,8 +64,9 @@ def format_events(courses, course_id_filter=None):
                         "course_id": cid,
                         "course_name": course_name,
                         "entry_id": entry_id,
-                        "instructor": entry.get('instructor', ''),
-                        "hours": entry.get('hours', 0),
+                        "etag": entry.get_etag(),
+                        "instructor": instructor,
+                        "hours": entry.hours,
                         "is_holiday": False,
                     }
                 }
@@ -73,16 +79,15 @@ def get_course_stats(courses):
     """과정별 통계 계산"""
     stats = []
     for course in courses:
-        entries = course.get('entries', [])
-        total_entries = len(entries)
-        class_entries = [e for e in entries if not e.get('is_holiday', False)]
-        holiday_entries = [e for e in entries if e.get('is_holiday', False)]
-        total_hours = sum(e.get('hours', 0) for e in class_entries)
+        entries = course.entries
+        class_entries = [e for e in entries if not e.is_holiday]
+        holiday_count = len(entries) - len(class_entries)
+        total_hours = sum(e.hours for e in class_entries)
 
         # 강사별 수업 수 (쉼표로 구분된 복수 강사 개별 집계)
         instructor_counts = defaultdict(int)
         for e in class_entries:
-            instructor = e.get('instructor', '')
+            instructor = e.instructor
             if instructor:
                 for name in instructor.split(','):
                     name = name.strip()
@@ -90,15 +95,15 @@ def get_course_stats(courses):
                         instructor_counts[name] += 1
 
         # 날짜 범위
-        dates = sorted([e.get('date', '') for e in entries if e.get('date')])
-        date_range = f"{dates[0]} ~ {dates[-1]}" if dates else ""
+        days = [e.day for e in entries]
+        date_range = f"{ordinal_to_date(min(days))} ~ {ordinal_to_date(max(days))}" if days else ""
 
         stats.append({
-            "course_id": course.get('id'),
-            "course_name": course.get('name'),
-            "color": course.get('color'),
+            "course_id": course.id,
+            "course_name": course.name,
+            "color": course.color,
             "total_classes": len(class_entries),
-            "total_holidays": len(holiday_entries),
+            "total_holidays": holiday_count,
             "total_hours": total_hours,
             "date_range": date_range,
             "instructors": dict(instructor_counts),
@@ -5,12 +5,25 @@ import os
 import json
 import uuid
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
+from typing import NamedTuple, Optional
 from config import Config
+from models import ENTRY_FIELDS, Course, ClassEntry
+from services import pagination
+from services.locking import ReadWriteLock, file_lock, atomic_write
 
 logger = logging.getLogger(__name__)
 
 _storage_instance = None
+_storage_init_lock = threading.Lock()
+
+ETAG_RETRIES = 5  # ETag 조건부 쓰기 충돌 시 다시 읽어 재시도하는 최대 횟수
+COURSE_FIELDS = ('name', 'color', 'default_start_time')
 
 
 def _generate_entry_id():
@@ -21,151 +34,432 @@ def _generate_entry_id():
 
 
 def get_storage():
-    """저장소 싱글턴 인스턴스 반환"""
+    """저장소 싱글턴 인스턴스 반환 (시작 예열 스레드와 요청 스레드가 동시에 불러도 하나만 생성)"""
     global _storage_instance
-    if _storage_instance is None:
+    if _storage_instance is not None:
+        return _storage_instance
+    with _storage_init_lock:
+        if _storage_instance is not None:
+            return _storage_instance
         if Config.use_cosmos_db():
-            _storage_instance = CosmosStorage()
+            if Config.COSMOS_ASYNC:
+                from services.async_cosmos_storage import AsyncCosmosStorage
+                storage = AsyncCosmosStorage()
+            else:
+                storage = CosmosStorage()
+            if Config.COSMOS_CACHE_MAX_AGE > 0:
+                from services.cached_storage import CachedStorage
+                storage = CachedStorage(storage)
+        elif Config.LOCAL_STORAGE_FORMAT == 'sharded':
+            from services.sharded_storage import ShardedJsonStorage
+            storage = ShardedJsonStorage()
         else:
-            _storage_instance = LocalJsonStorage()
+            storage = LocalJsonStorage()
+        _storage_instance = storage
     return _storage_instance
 
 
-class LocalJsonStorage:
-    """로컬 JSON 파일 기반 저장소 (개발용 fallback)"""
+class PreconditionFailedError(Exception):
+    """If-Match 로 받은 ETag 가 현재 문서와 다름 (다른 요청이 먼저 수정함)"""
+
+
+class StorageCorruptedError(Exception):
+    """로컬 저장 파일을 읽을 수 없음 (손상 / 지원하지 않는 형식)
+
+    요청 값의 문제가 아니므로 ValueError(→ 400)로 전달하지 않습니다 (handle_errors 에서 500).
+    """
+
+
+def _check_if_match(current_etag, if_match):
+    if if_match is not None and if_match != current_etag:
+        raise PreconditionFailedError(current_etag)
+
+
+class StorageChange(NamedTuple):
+    """저장소 변경 알림
+
+    removed / added 는 제거·추가된 ClassEntry 튜플이며 (수정 = 이전 제거 + 새 값 추가),
+    None 이면 변경 내용을 알 수 없다는 뜻입니다 (리스너는 전체 재구성 필요).
+    before / after 는 변경 전후 데이터 버전입니다.
+    """
+    course_id: Optional[str]
+    removed: Optional[tuple]
+    added: Optional[tuple]
+    before: Optional[str]
+    after: Optional[str]
+    course: Optional[Course]  # 변경 후 과정 (삭제 시 None)
+
+
+class StorageEventsMixin:
+    """변경 리스너 등록/알림 (버전을 제공하는 저장소만 알림을 보냄)"""
+
+    _listeners = ()
+
+    def add_listener(self, listener):
+        # copy-on-write: 알림 중 등록되어도 안전
+        self._listeners = (*self._listeners, listener)
+
+    def _notify(self, change):
+        for listener in self._listeners:
+            try:
+                listener(change)
+            except Exception:
+                logger.exception("저장소 변경 리스너 오류")
+
+
+def _file_signature(stat):
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
 
-    def __init__(self):
-        self.filepath = Config.COURSES_FILE
+def _format_version(signature):
+    return '-'.join(f"{v:x}" for v in signature) if signature else None
+
+
+def _find_course(courses, course_id):
+    for idx, course in enumerate(courses):
+        if course.id == course_id:
+            return idx, course
+    return None, None
+
+
+class LocalJsonStorage(StorageEventsMixin):
+    """로컬 JSON 파일 기반 저장소 (개발용 fallback)
+
+    동시성:
+      - 쓰기는 프로세스 내 writer 뮤텍스 + 프로세스 간 파일 락(`<파일>.lock`) 안에서
+        읽기-수정-쓰기를 수행하므로 동시 수정이 유실되지 않습니다.
+      - 파일은 임시 파일 + fsync + os.replace 로 교체되므로 reader 는 항상
+        완전한 스냅샷(이전 또는 새 파일)만 봅니다. reader/writer 락의 writer 측은
+        교체 순간에만 잡으므로 reader 끼리는 물론 진행 중인 쓰기에도 거의 막히지 않습니다.
+
+    캐시:
+      - 파일을 Course/ClassEntry 객체 리스트로 변환해 캐시하고, 파일 시그니처
+        (mtime, 크기, inode)가 바뀌었을 때만 다시 읽습니다 (다른 프로세스의 쓰기 반영).
+      - 쓰기는 copy-on-write: 수정된 과정만 복사한 새 리스트를 만들어 교체하므로
+        이미 반환된 스냅샷은 변하지 않습니다.
+
+    파일 형식 (LOCAL_STORAGE_FORMAT):
+      - json     : courses.json (기본)
+      - snapshot : courses.snap 바이너리 컬럼 스냅샷 (services/course_snapshot.py).
+                   mmap 으로 읽어 과정 메타데이터만 바로 만들고 일정은 과정별로 처음 접근할 때 디코딩.
+                   스냅샷이 없고 courses.json 이 있으면 처음 한 번 변환합니다.
+      - sharded  : courses/ 아래 과정별 일정 파일 + 메타데이터 색인 (services/sharded_storage.py)
+    """
+
+    FORMATS = ('json', 'snapshot')
+
+    def __init__(self, filepath=None, fmt=None):
+        self.format = fmt or Config.LOCAL_STORAGE_FORMAT
+        if self.format not in self.FORMATS:
+            raise ValueError(f"알 수 없는 로컬 저장소 형식입니다: {self.format}")
+        self.filepath = filepath or self._default_path()
+        self.lockpath = self.filepath + '.lock'
+        self._rwlock = ReadWriteLock()
+        self._write_mutex = threading.Lock()
+        self._reload_mutex = threading.Lock()
+        self._cache = (None, [])  # (파일 시그니처, Course 리스트)
+        self._txn_signature = None
         os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
         if not os.path.exists(self.filepath):
-            self._save_data({"courses": []})
+            with self._write_transaction() as courses:
+                if not os.path.exists(self.filepath):
+                    if filepath is None:
+                        courses.extend(self._migrate())
+                    self._commit(courses)
         logger.info("로컬 JSON 저장소 초기화 완료")
 
-    def _load_data(self):
+    def _default_path(self):
+        return Config.COURSES_SNAPSHOT_FILE if self.format == 'snapshot' else Config.COURSES_FILE
+
+    def _migrate(self):
+        """기본 경로에 저장 파일이 없을 때 이전 형식 데이터 → Course 리스트 (없으면 빈 리스트)"""
+        if self.format == 'snapshot' and os.path.exists(Config.COURSES_FILE):
+            from services.course_snapshot import json_to_courses
+            courses = json_to_courses(self._load_json(Config.COURSES_FILE))
+            logger.info("courses.json → 스냅샷 변환: 과정 %s개", len(courses))
+            return courses
+        return []
+
+    # ---- 파일 I/O (dict ↔ 모델 변환은 여기서만) ----
+
+    @staticmethod
+    def _load_json(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _load_courses(self):
+        """파일 → Course 리스트"""
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"courses": []}
-
-    def _save_data(self, data):
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    def _ensure_entry_ids(self, data):
-        """기존 엔트리에 ID가 없으면 자동 할당 (lazy migration)"""
-        modified = False
-        for course in data.get('courses', []):
-            for entry in course.get('entries', []):
-                if not entry.get('id'):
-                    entry['id'] = _generate_entry_id()
-                    modified = True
-        if modified:
-            self._save_data(data)
-        return data
+            if self.format == 'snapshot':
+                from services.course_snapshot import load
+                return load(self.filepath)
+            return [Course.from_dict(c) for c in self._load_json(self.filepath).get('courses', [])]
+        except FileNotFoundError:
+            return []
+        except ValueError as e:  # JSONDecodeError / SnapshotError
+            # 원자적 교체 이후에는 손상된 파일을 빈 데이터로 취급하지 않음 (덮어쓰기로 인한 유실 방지)
+            logger.error("저장소 파일 손상: %s (%s)", self.filepath, e)
+            raise StorageCorruptedError(self.filepath) from e
+
+    def _encode(self, courses):
+        if self.format == 'snapshot':
+            from services.course_snapshot import encode
+            return encode(courses)
+        data = {"courses": [c.to_dict(include_entries=True) for c in courses]}
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def _stat_signature(self):
+        try:
+            return _file_signature(os.stat(self.filepath))
+        except FileNotFoundError:
+            return None
+
+    def _current_snapshot(self):
+        """(파일 시그니처, Course 리스트) - 캐시가 최신이면 그대로, 아니면 파일에서 다시 로드"""
+        with self._rwlock.read_lock():
+            signature = self._stat_signature()
+            cache = self._cache
+        if signature is not None and signature == cache[0]:
+            return cache
+
+        with self._reload_mutex:
+            cache = self._cache
+            if signature is not None and signature == cache[0]:
+                return cache
+            courses = self._load_courses()
+            self._cache = (signature, courses)
+            return self._cache
+
+    def _current_courses(self):
+        return self._current_snapshot()[1]
+
+    def _commit(self, courses, course_id=None, removed=None, added=None, course=None):
+        """과정 리스트를 파일에 원자적으로 기록하고 캐시 교체 후 변경 알림
+
+        호출자는 _write_transaction() 안에 있어야 하며, 알림도 락 안에서 순서대로 전달됩니다.
+        """
+        payload = self._encode(courses)
+        stat = atomic_write(self.filepath, payload, replace_lock=self._rwlock.write_lock())
+        before, after = self._txn_signature, _file_signature(stat)
+        self._cache = (after, courses)
+        self._txn_signature = after
+        self._notify(StorageChange(
+            course_id, removed, added, _format_version(before), _format_version(after), course
+        ))
+
+    @contextmanager
+    def _write_transaction(self):
+        """프로세스 내/간 배타 락을 잡고 최신 과정 리스트의 사본을 반환"""
+        with self._write_mutex, file_lock(self.lockpath):
+            signature, courses = self._current_snapshot()
+            self._txn_signature = signature
+            yield list(courses)
+
+    def _ensure_entry_ids(self, courses):
+        """기존 엔트리에 ID가 없으면 자동 할당 (lazy migration)
+
+        스냅샷/샤드 형식은 모든 일정에 ID 가 있으므로 검사하지 않습니다 (일정 디코딩 방지).
+        """
+        if self.format != 'json' or all(e.id for c in courses for e in c.entries):
+            return courses
+        with self._write_transaction() as courses:
+            for idx, course in enumerate(courses):
+                if all(e.id for e in course.entries):
+                    continue
+                course = course.copy()
+                course.entries = [
+                    e if e.id else replace(e, id=_generate_entry_id(), etag='')
+                    for e in course.entries
+                ]
+                courses[idx] = course
+            self._commit(courses)
+        return courses
+
+    # ---- 조회 ----
 
     def get_all_courses(self):
-        """전체 과정 목록 반환"""
-        data = self._load_data()
-        data = self._ensure_entry_ids(data)
-        return data.get("courses", [])
+        """전체 과정 목록 반환 (읽기 전용 Course 리스트)"""
+        return self.get_snapshot()[1]
+
+    def get_snapshot(self):
+        """(데이터 버전, 전체 과정 목록) - 버전은 같은 내용이면 같은 값"""
+        signature, courses = self._current_snapshot()
+        if self._ensure_entry_ids(courses) is not courses:
+            signature, courses = self._current_snapshot()
+        return _format_version(signature), courses
+
+    def get_data_version(self):
+        """현재 데이터 버전 (파일 시그니처 기반 - 다른 프로세스의 쓰기도 반영)"""
+        signature = self._stat_signature()
+        return _format_version(signature) if signature == self._cache[0] else self.get_snapshot()[0]
+
+    def query_courses(self, fields=pagination.COURSE_LIST_FIELDS, limit=None, after=None):
+        """과정 메타데이터 → ID 순 after 이후 limit 개, fields 만 담은 dict 리스트"""
+        return pagination.page_courses(self.get_all_courses(), fields, limit, after)
+
+    def query_entries(self, course_id=None, fields=pagination.ENTRY_LIST_FIELDS, limit=None, after=None):
+        """일정 → ID 순 after 이후 limit 개, id / course_id + fields 만 담은 dict 리스트"""
+        return pagination.page_entries(self.get_all_courses(), course_id, fields, limit, after)
+
+    # ---- 변경 ----
 
     def save_course(self, course, entries):
         """과정과 수업 일정 저장"""
-        data = self._load_data()
         for entry in entries:
             if not entry.get('id'):
                 entry['id'] = _generate_entry_id()
-        course['entries'] = entries
-        data['courses'].append(course)
-        self._save_data(data)
-        logger.info(f"과정 저장: {course['name']} ({len(entries)}개 일정)")
+        new_course = Course.from_dict(course, entries)
+        with self._write_transaction() as courses:
+            courses.append(new_course)
+            self._commit(courses, new_course.id, (), tuple(new_course.entries), new_course)
+        logger.info("과정 저장: %s (%s개 일정)", course['name'], len(entries))
+
+    def save_courses(self, items):
+        """여러 과정을 한 번의 쓰기로 저장 (items: [(course dict, entries dict 리스트)])"""
+        new_courses = []
+        for course, entries in items:
+            for entry in entries:
+                if not entry.get('id'):
+                    entry['id'] = _generate_entry_id()
+            new_courses.append(Course.from_dict(course, entries))
+        with self._write_transaction() as courses:
+            courses.extend(new_courses)
+            self._commit(courses)  # 여러 과정 변경 → 리스너는 전체 재구성
+        logger.info("과정 일괄 저장: %s개 과정", len(new_courses))
 
     def delete_course(self, course_id):
         """과정 삭제"""
-        data = self._load_data()
-        original_len = len(data['courses'])
-        data['courses'] = [c for c in data['courses'] if c.get('id') != course_id]
-        if len(data['courses']) < original_len:
-            self._save_data(data)
-            logger.info(f"과정 삭제: {course_id}")
-            return True
-        return False
-
-    def update_course(self, course_id, updates):
-        """과정 정보 수정"""
-        data = self._load_data()
-        for course in data['courses']:
-            if course.get('id') == course_id:
-                for key in ['name', 'color', 'default_start_time']:
-                    if key in updates:
-                        course[key] = updates[key]
-                self._save_data(data)
-                logger.info(f"과정 수정: {course_id}")
-                return True
-        return False
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return False
+            del courses[idx]
+            self._commit(courses, course_id, tuple(course.entries), (), None)
+        logger.info("과정 삭제: %s", course_id)
+        return True
+
+    def update_course(self, course_id, updates, if_match=None):
+        """과정 정보 수정 → 새 ETag (과정이 없으면 False)
+
+        if_match 가 현재 ETag 와 다르면 PreconditionFailedError
+        """
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return False
+            _check_if_match(course.get_etag(), if_match)
+            course = course.copy()
+            for key in COURSE_FIELDS:
+                if key in updates:
+                    setattr(course, key, updates[key])
+            courses[idx] = course
+            self._commit(courses, course_id, (), (), course)
+        logger.info("과정 수정: %s", course_id)
+        return course.get_etag()
 
     def create_course(self, course):
         """과정 메타데이터만 생성 (엑셀 업로드 없이)"""
-        data = self._load_data()
-        course['entries'] = []
-        data['courses'].append(course)
-        self._save_data(data)
-        logger.info(f"과정 생성: {course['name']}")
+        new_course = Course.from_dict(course, [])
+        with self._write_transaction() as courses:
+            courses.append(new_course)
+            self._commit(courses, new_course.id, (), (), new_course)
+        logger.info("과정 생성: %s", course['name'])
         return course['id']
 
     def add_entry(self, course_id, entry):
         """과정에 개별 수업 일정 추가"""
-        data = self._load_data()
-        for course in data['courses']:
-            if course.get('id') == course_id:
-                if not entry.get('id'):
-                    entry['id'] = _generate_entry_id()
-                course.setdefault('entries', []).append(entry)
-                course['entry_count'] = len(course['entries'])
-                self._save_data(data)
-                logger.info(f"수업 일정 추가: {course_id} / {entry.get('class_name')}")
-                return entry['id']
-        return None
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return None
+            if not entry.get('id'):
+                entry['id'] = _generate_entry_id()
+            new_entry = ClassEntry.from_dict(entry)
+            course = course.copy()
+            course.entries.append(new_entry)
+            course.entry_count = len(course.entries)
+            courses[idx] = course
+            self._commit(courses, course_id, (), (new_entry,), course)
+        logger.info("수업 일정 추가: %s / %s", course_id, entry.get('class_name'))
+        return entry['id']
 
     def delete_entry(self, course_id, entry_id):
         """과정에서 개별 수업 일정 삭제"""
-        data = self._load_data()
-        for course in data['courses']:
-            if course.get('id') == course_id:
-                original_len = len(course.get('entries', []))
-                course['entries'] = [
-                    e for e in course.get('entries', [])
-                    if e.get('id') != entry_id
-                ]
-                if len(course['entries']) < original_len:
-                    course['entry_count'] = len(course['entries'])
-                    self._save_data(data)
-                    logger.info(f"수업 일정 삭제: {course_id} / {entry_id}")
-                    return True
-        return False
-
-    def update_entry(self, course_id, entry_id, updates):
-        """개별 수업 일정 수정"""
-        data = self._load_data()
-        for course in data['courses']:
-            if course.get('id') == course_id:
-                for entry in course.get('entries', []):
-                    if entry.get('id') == entry_id:
-                        for key in ['date', 'class_name', 'instructor', 'hours',
-                                    'start_time', 'end_time', 'is_holiday']:
-                            if key in updates:
-                                entry[key] = updates[key]
-                        self._save_data(data)
-                        logger.info(f"수업 일정 수정: {course_id} / {entry_id}")
-                        return True
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return False
+            removed = tuple(e for e in course.entries if e.id == entry_id)
+            if not removed:
+                return False
+            course = course.copy()
+            course.entries = [e for e in course.entries if e.id != entry_id]
+            course.entry_count = len(course.entries)
+            courses[idx] = course
+            self._commit(courses, course_id, removed, (), course)
+        logger.info("수업 일정 삭제: %s / %s", course_id, entry_id)
+        return True
+
+    def update_entry(self, course_id, entry_id, updates, if_match=None):
+        """개별 수업 일정 수정 → 새 ETag (일정이 없으면 False)
+
+        if_match 가 현재 ETag 와 다르면 PreconditionFailedError
+        """
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return False
+            for pos, entry in enumerate(course.entries):
+                if entry.id == entry_id:
+                    _check_if_match(entry.get_etag(), if_match)
+                    updated = entry.with_updates(updates)
+                    course = course.copy()
+                    course.entries[pos] = updated
+                    courses[idx] = course
+                    self._commit(courses, course_id, (entry,), (updated,), course)
+                    logger.info("수업 일정 수정: %s / %s", course_id, entry_id)
+                    return updated.get_etag()
         return False
 
+    def bulk_update_entries(self, course_id, updates, if_match=None):
+        """과정 하나의 여러 일정을 한 번의 쓰기로 수정 → {entry_id: 새 ETag} (과정이 없으면 False)
 
-class CosmosStorage:
+        updates: {entry_id: ENTRY_FIELDS 키를 가진 dict}, 과정에 없는 일정은 건너뜁니다.
+        if_match ({entry_id: ETag}) 중 하나라도 다르면 아무것도 쓰지 않고 PreconditionFailedError
+        """
+        if_match = if_match or {}
+        with self._write_transaction() as courses:
+            idx, course = _find_course(courses, course_id)
+            if course is None:
+                return False
+            course = course.copy()
+            removed, added = [], []
+            for pos, entry in enumerate(course.entries):
+                changes = updates.get(entry.id)
+                if changes is None:
+                    continue
+                _check_if_match(entry.get_etag(), if_match.get(entry.id))
+                updated = entry.with_updates(changes)
+                course.entries[pos] = updated
+                removed.append(entry)
+                added.append(updated)
+            if not added:
+                return {}
+            courses[idx] = course
+            self._commit(courses, course_id, tuple(removed), tuple(added), course)
+        logger.info("수업 일정 일괄 수정: %s (%s개)", course_id, len(added))
+        return {e.id: e.get_etag() for e in added}
+
+
+class CosmosStorage(StorageEventsMixin):
     """Azure Cosmos DB 기반 저장소"""
 
-    def __init__(self):
+    def __init__(self, container=None):
+        self._patch_supported = True
+        if container is not None:
+            # 외부에서 주입된 컨테이너 (벤치마크용 인메모리 대체 등)
+            self.container = container
+            return
         from azure.cosmos import CosmosClient, PartitionKey
         self.client = CosmosClient(Config.COSMOS_DB_ENDPOINT, Config.COSMOS_DB_KEY)
         self.database = self.client.create_database_if_not_exists(id=Config.COSMOS_DATABASE_NAME)
@@ -173,6 +467,7 @@ class CosmosStorage:
             id=Config.COSMOS_CONTAINER_NAME,
             partition_key=PartitionKey(path="/type")
         )
+        self._start_orphan_sweeper()
         logger.info("Azure Cosmos DB 저장소 초기화 완료")
 
     def _generate_id(self, doc_type):
@@ -180,109 +475,256 @@ class CosmosStorage:
         unique_id = str(uuid.uuid4())[:8]
         return f"{doc_type}_{timestamp}_{unique_id}"
 
-    def get_all_courses(self):
-        """전체 과정 목록 (entries 포함) 반환"""
-        query = "SELECT * FROM c WHERE c.type = 'course' ORDER BY c.uploaded_at DESC"
-        courses = list(self.container.query_items(
-            query=query, enable_cross_partition_query=True
+    def load_documents(self):
+        """전체 과정/일정 문서 → (과정 문서 리스트, 일정 문서 리스트)
+
+        파티션 키가 /type 이므로 각각 단일 파티션 쿼리 (과정별 N+1 쿼리 없음)
+        """
+        course_docs = list(self.container.query_items(
+            query="SELECT * FROM c WHERE c.type = 'course' ORDER BY c.uploaded_at DESC",
+            partition_key='course'
+        ))
+        entry_docs = list(self.container.query_items(
+            query="SELECT * FROM c WHERE c.type = 'entry'",
+            partition_key='entry'
         ))
+        return course_docs, entry_docs
 
-        for course in courses:
-            entry_query = "SELECT * FROM c WHERE c.type = 'entry' AND c.course_id = @course_id"
-            entries = list(self.container.query_items(
-                query=entry_query,
-                parameters=[{"name": "@course_id", "value": course['id']}],
-                enable_cross_partition_query=True
-            ))
-            course['entries'] = entries
+    def load_course_documents(self, course_id):
+        """과정 하나의 문서 → (과정 문서 또는 None, 일정 문서 리스트)"""
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        try:
+            course_doc = self.container.read_item(item=course_id, partition_key='course')
+        except CosmosResourceNotFoundError:
+            return None, []
+        entry_docs = list(self.container.query_items(
+            query="SELECT * FROM c WHERE c.type = 'entry' AND c.course_id = @course_id",
+            parameters=[{"name": "@course_id", "value": course_id}],
+            partition_key='entry'
+        ))
+        return course_doc, entry_docs
 
-        return courses
+    def get_all_courses(self):
+        """전체 과정 목록 (entries 포함, Course 리스트) 반환"""
+        course_docs, entry_docs = self.load_documents()
+        by_course = {}
+        for entry in entry_docs:
+            by_course.setdefault(entry.get('course_id'), []).append(entry)
+        return [Course.from_dict(c, by_course.get(c['id'], [])) for c in course_docs]
+
+    def get_snapshot(self):
+        """(데이터 버전, 전체 과정 목록) - Cosmos 는 값싼 버전 정보가 없으므로 None"""
+        return None, self.get_all_courses()
+
+    def get_data_version(self):
+        """None = 버전 미지원 (호출자는 매번 최신 데이터를 조회해야 함)"""
+        return None
+
+    def _query_page(self, doc_type, fields, course_id, limit, after):
+        """필드 프로젝션 + keyset 페이지 쿼리 (단일 파티션, ORDER BY c.id 는 기본 색인으로 처리)"""
+        columns = ['c.id'] + (['c.course_id'] if doc_type == 'entry' else [])
+        columns += ['c._etag' if name == 'etag' else f'c.{name}' for name in fields]
+        conditions, parameters = [f"c.type = '{doc_type}'"], []
+        if course_id is not None:
+            conditions.append("c.course_id = @course_id")
+            parameters.append({"name": "@course_id", "value": course_id})
+        if after is not None:
+            conditions.append("c.id > @after")
+            parameters.append({"name": "@after", "value": after})
+        query = f"SELECT {', '.join(columns)} FROM c WHERE {' AND '.join(conditions)} ORDER BY c.id"
+        if limit is not None:
+            query += f" OFFSET 0 LIMIT {int(limit)}"
+        return list(self.container.query_items(query=query, parameters=parameters, partition_key=doc_type))
+
+    def query_courses(self, fields=pagination.COURSE_LIST_FIELDS, limit=None, after=None):
+        """과정 메타데이터 → ID 순 after 이후 limit 개, fields 만 담은 dict 리스트 (일정 문서는 읽지 않음)"""
+        docs = self._query_page('course', fields, None, limit, after)
+        return [pagination.doc_record(doc, fields) for doc in docs]
+
+    def query_entries(self, course_id=None, fields=pagination.ENTRY_LIST_FIELDS, limit=None, after=None):
+        """일정 → ID 순 after 이후 limit 개, id / course_id + fields 만 담은 dict 리스트"""
+        docs = self._query_page('entry', fields, course_id, limit, after)
+        return [pagination.doc_record(doc, fields, course_id=True) for doc in docs]
 
     def save_course(self, course, entries):
         """과정과 수업 일정 저장"""
         self.container.create_item(body=course)
-        logger.info(f"과정 문서 저장: {course['name']}")
+        logger.info("과정 문서 저장: %s", course['name'])
 
         for entry in entries:
             entry_doc = {
-                "id": self._generate_id("entry"),
+                "id": entry.get('id') or self._generate_id("entry"),
                 "type": "entry",
                 "course_id": course['id'],
-                **entry
+                **{k: v for k, v in entry.items() if k != 'id'}
             }
             self.container.create_item(body=entry_doc)
 
-        logger.info(f"수업 일정 {len(entries)}개 저장 완료")
+        logger.info("수업 일정 %s개 저장 완료", len(entries))
+
+    def save_courses(self, items):
+        """여러 과정 저장 (items: [(course dict, entries dict 리스트)])"""
+        for course, entries in items:
+            self.save_course(course, entries)
 
     def delete_course(self, course_id):
-        """과정 및 관련 일정 삭제"""
-        try:
-            # 과정 삭제
-            self.container.delete_item(item=course_id, partition_key='course')
+        """과정 및 관련 일정 삭제
 
-            # 관련 일정 삭제
-            entry_query = "SELECT c.id FROM c WHERE c.type = 'entry' AND c.course_id = @course_id"
-            entries = list(self.container.query_items(
-                query=entry_query,
+        일정 문서를 동시에 삭제한 뒤 과정 문서를 삭제합니다.
+        중간에 실패해도 과정 문서가 남아 있으므로 다시 삭제하면 이어서 정리되고,
+        그래도 남은 고아 일정은 sweep_orphans() 가 정리합니다.
+        """
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        try:
+            entry_ids = list(self.container.query_items(
+                query="SELECT VALUE c.id FROM c WHERE c.type = 'entry' AND c.course_id = @course_id",
                 parameters=[{"name": "@course_id", "value": course_id}],
-                enable_cross_partition_query=True
+                partition_key='entry'
             ))
-            for entry in entries:
-                self.container.delete_item(item=entry['id'], partition_key='entry')
+            failed = self._delete_entries(entry_ids)
+            if failed:
+                logger.error("과정 삭제 실패: %s (일정 %s/%s개 삭제 실패)", course_id, len(failed), len(entry_ids))
+                return False
+
+            try:
+                self.container.delete_item(item=course_id, partition_key='course')
+            except CosmosResourceNotFoundError:
+                if not entry_ids:
+                    return False
 
-            logger.info(f"과정 삭제: {course_id} ({len(entries)}개 일정 포함)")
+            logger.info("과정 삭제: %s (%s개 일정 포함)", course_id, len(entry_ids))
             return True
         except Exception as e:
-            logger.error(f"과정 삭제 실패: {e}")
+            logger.error("과정 삭제 실패: %s", e)
             return False
 
-    def update_course(self, course_id, updates):
-        """과정 정보 수정"""
+    def _delete_entries(self, entry_ids):
+        """일정 문서를 COSMOS_DELETE_CONCURRENCY 개씩 동시에 삭제 → 삭제 실패한 id 리스트
+
+        4.5.1 SDK 에는 트랜잭션 배치가 없고, 파티션 키가 /type 이라 파티션 단위 삭제는
+        모든 일정을 지우므로 문서 단위 삭제를 동시에 보냅니다. 이미 없는 문서는 성공으로 봅니다.
+        """
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
+        if not entry_ids:
+            return []
+
+        def delete(entry_id):
+            try:
+                self.container.delete_item(item=entry_id, partition_key='entry')
+            except CosmosResourceNotFoundError:
+                pass
+
+        failed = []
+        for entry_id, (_, error) in zip(entry_ids, self._run_concurrently(delete, entry_ids)):
+            if error is not None:
+                logger.warning("일정 삭제 실패: %s (%s)", entry_id, error)
+                failed.append(entry_id)
+        return failed
+
+    @staticmethod
+    def _run_concurrently(fn, items):
+        """fn(item) 을 COSMOS_DELETE_CONCURRENCY 개씩 동시에 실행 → 같은 순서의 (결과, 예외) 리스트"""
+        if not items:
+            return []
+        workers = max(1, min(Config.COSMOS_DELETE_CONCURRENCY, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cosmos-docs') as pool:
+            futures = [pool.submit(fn, item) for item in items]
+        return [(None, f.exception()) if f.exception() is not None else (f.result(), None) for f in futures]
+
+    def sweep_orphans(self):
+        """과정 문서가 없는 일정 문서 삭제 → 삭제한 일정 수
+
+        일정의 course_id 를 과정 id 보다 먼저 읽습니다. 일정은 과정 문서가 생긴 뒤에만
+        만들어지므로, 그 사이에 새로 생긴 과정의 일정을 고아로 오인하지 않습니다.
+        """
+        course_ids_of_entries = set(self.container.query_items(
+            query="SELECT DISTINCT VALUE c.course_id FROM c WHERE c.type = 'entry'",
+            partition_key='entry'
+        ))
+        course_ids = set(self.container.query_items(
+            query="SELECT VALUE c.id FROM c WHERE c.type = 'course'",
+            partition_key='course'
+        ))
+        orphan_course_ids = course_ids_of_entries - course_ids
+        if not orphan_course_ids:
+            return 0
+        entry_ids = list(self.container.query_items(
+            query="SELECT VALUE c.id FROM c WHERE c.type = 'entry' AND ARRAY_CONTAINS(@course_ids, c.course_id)",
+            parameters=[{"name": "@course_ids", "value": sorted(orphan_course_ids, key=str)}],
+            partition_key='entry'
+        ))
+        failed = self._delete_entries(entry_ids)
+        deleted = len(entry_ids) - len(failed)
+        logger.info("고아 일정 정리: %s개 삭제 (과정 %s개)", deleted, len(orphan_course_ids))
+        return deleted
+
+    def _start_orphan_sweeper(self):
+        if Config.COSMOS_ORPHAN_SWEEP_INTERVAL > 0:
+            threading.Thread(
+                target=self._sweep_orphans_periodically, args=(Config.COSMOS_ORPHAN_SWEEP_INTERVAL,),
+                name='cosmos-orphan-sweep', daemon=True,
+            ).start()
+
+    def _sweep_orphans_periodically(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.sweep_orphans()
+            except Exception:
+                logger.exception("고아 일정 정리 실패")
+
+    def update_course(self, course_id, updates, if_match=None):
+        """과정 정보 수정 → 새 ETag (과정이 없으면 False)
+
+        변경 필드만 patch 하므로 동시에 진행되는 entry_count 증감과 겹쳐도 유실되지 않습니다.
+        if_match 를 지정하면 그 ETag 조건부로 수정하고, 다르면 PreconditionFailedError
+        """
+        from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosResourceNotFoundError
+        fields = {key: updates[key] for key in COURSE_FIELDS if key in updates}
         try:
-            query = "SELECT * FROM c WHERE c.type = 'course' AND c.id = @course_id"
-            items = list(self.container.query_items(
-                query=query,
-                parameters=[{"name": "@course_id", "value": course_id}],
-                enable_cross_partition_query=True
-            ))
-            if not items:
-                return False
-
-            course = items[0]
-            for key in ['name', 'color', 'default_start_time']:
-                if key in updates:
-                    course[key] = updates[key]
-
-            self.container.replace_item(item=course['id'], body=course)
-            logger.info(f"과정 수정: {course_id}")
-            return True
+            operations = [{"op": "set", "path": f"/{key}", "value": value} for key, value in fields.items()]
+            try:
+                doc = self._patch(course_id, 'course', operations, if_match)
+            except _PatchUnsupported:
+                doc = self._conditional_update(course_id, 'course', lambda d: d.update(fields), if_match)
+            logger.info("과정 수정: %s", course_id)
+            return doc['_etag']
+        except CosmosAccessConditionFailedError:
+            raise PreconditionFailedError(if_match)
+        except CosmosResourceNotFoundError:
+            return False
+        except PreconditionFailedError:
+            raise
         except Exception as e:
-            logger.error(f"과정 수정 실패: {e}")
+            logger.error("과정 수정 실패: %s", e)
             return False
 
     def create_course(self, course):
         """과정 메타데이터만 생성 (엑셀 업로드 없이)"""
         try:
             self.container.create_item(body=course)
-            logger.info(f"과정 생성: {course['name']}")
+            logger.info("과정 생성: %s", course['name'])
             return course['id']
         except Exception as e:
-            logger.error(f"과정 생성 실패: {e}")
+            logger.error("과정 생성 실패: %s", e)
             return None
 
     def add_entry(self, course_id, entry):
-        """과정에 개별 수업 일정 추가"""
+        """과정에 개별 수업 일정 추가
+
+        entry_count 를 먼저 원자적으로 증가시켜 과정 존재 확인을 겸하고 (과정 조회 쿼리 없음),
+        일정 생성이 실패하면 다시 감소시킵니다.
+        """
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
         try:
-            # 과정 존재 확인
-            course_query = "SELECT * FROM c WHERE c.type = 'course' AND c.id = @course_id"
-            course_docs = list(self.container.query_items(
-                query=course_query,
-                parameters=[{"name": "@course_id", "value": course_id}],
-                enable_cross_partition_query=True
-            ))
-            if not course_docs:
-                return None
+            self._adjust_entry_count(course_id, 1)
+        except CosmosResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error("엔트리 추가 실패: %s", e)
+            return None
 
+        try:
             entry_id = entry.get('id') or self._generate_id("entry")
             entry_doc = {
                 "id": entry_id,
@@ -291,65 +733,188 @@ class CosmosStorage:
                 **{k: v for k, v in entry.items() if k != 'id'}
             }
             self.container.create_item(body=entry_doc)
-
-            # entry_count 갱신
-            course_doc = course_docs[0]
-            course_doc['entry_count'] = course_doc.get('entry_count', 0) + 1
-            self.container.replace_item(item=course_doc['id'], body=course_doc)
-
-            logger.info(f"수업 일정 추가: {course_id} / {entry.get('class_name')}")
-            return entry_id
         except Exception as e:
-            logger.error(f"엔트리 추가 실패: {e}")
+            logger.error("엔트리 추가 실패: %s", e)
+            try:
+                self._adjust_entry_count(course_id, -1)
+            except Exception:
+                logger.exception("entry_count 복구 실패: %s", course_id)
             return None
 
+        logger.info("수업 일정 추가: %s / %s", course_id, entry.get('class_name'))
+        return entry_id
+
     def delete_entry(self, course_id, entry_id):
         """개별 수업 일정 삭제"""
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
         try:
             self.container.delete_item(item=entry_id, partition_key='entry')
+            try:
+                self._adjust_entry_count(course_id, -1)
+            except CosmosResourceNotFoundError:
+                pass  # 과정이 이미 삭제됨
 
-            # entry_count 갱신
-            course_query = "SELECT * FROM c WHERE c.type = 'course' AND c.id = @course_id"
-            course_docs = list(self.container.query_items(
-                query=course_query,
-                parameters=[{"name": "@course_id", "value": course_id}],
-                enable_cross_partition_query=True
-            ))
-            if course_docs:
-                course_doc = course_docs[0]
-                course_doc['entry_count'] = max(0, course_doc.get('entry_count', 1) - 1)
-                self.container.replace_item(item=course_doc['id'], body=course_doc)
-
-            logger.info(f"수업 일정 삭제: {course_id} / {entry_id}")
+            logger.info("수업 일정 삭제: %s / %s", course_id, entry_id)
             return True
         except Exception as e:
-            logger.error(f"엔트리 삭제 실패: {e}")
+            logger.error("엔트리 삭제 실패: %s", e)
             return False
 
-    def update_entry(self, course_id, entry_id, updates):
-        """개별 수업 일정 수정"""
-        try:
-            entry_query = "SELECT * FROM c WHERE c.type = 'entry' AND c.id = @entry_id AND c.course_id = @course_id"
-            entry_docs = list(self.container.query_items(
-                query=entry_query,
-                parameters=[
-                    {"name": "@entry_id", "value": entry_id},
-                    {"name": "@course_id", "value": course_id},
-                ],
-                enable_cross_partition_query=True
-            ))
-            if not entry_docs:
-                return False
+    def update_entry(self, course_id, entry_id, updates, if_match=None):
+        """개별 수업 일정 수정 → 새 ETag (일정이 없으면 False)
+
+        포인트 읽기 후 _etag 조건부 replace. if_match 를 지정하면 그 ETag 와 다를 때
+        PreconditionFailedError (지정하지 않으면 충돌 시 다시 읽어 재시도)
+        """
+        from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
-            entry_doc = entry_docs[0]
+        def apply(doc):
             for key in ['date', 'class_name', 'instructor', 'hours',
                         'start_time', 'end_time', 'is_holiday']:
                 if key in updates:
-                    entry_doc[key] = updates[key]
+                    doc[key] = updates[key]
 
-            self.container.replace_item(item=entry_doc['id'], body=entry_doc)
-            logger.info(f"수업 일정 수정: {course_id} / {entry_id}")
-            return True
+        try:
+            doc = self._conditional_update(entry_id, 'entry', apply, if_match, course_id=course_id)
+            if doc is None:
+                return False
+            logger.info("수업 일정 수정: %s / %s", course_id, entry_id)
+            return doc['_etag']
+        except CosmosResourceNotFoundError:
+            return False
+        except PreconditionFailedError:
+            raise
         except Exception as e:
-            logger.error(f"엔트리 수정 실패: {e}")
+            logger.error("엔트리 수정 실패: %s", e)
+            return False
+
+    def bulk_update_entries(self, course_id, updates, if_match=None):
+        """과정 하나의 여러 일정 수정 → {entry_id: 새 ETag} (과정이 없으면 False)
+
+        트랜잭션 배치가 없으므로 일정 문서를 동시에 읽어 if_match ({entry_id: ETag}) 를 모두 확인한 뒤
+        (하나라도 다르면 쓰지 않고 PreconditionFailedError) 각 문서를 _etag 조건부 replace 로 동시에 씁니다.
+        확인 이후 다른 요청이 먼저 고친 일정이 있으면 나머지는 반영된 채 PreconditionFailedError 를 던집니다.
+        """
+        from azure.core import MatchConditions
+        from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosResourceNotFoundError
+        if_match = if_match or {}
+        try:
+            self.container.read_item(item=course_id, partition_key='course')
+        except CosmosResourceNotFoundError:
             return False
+
+        def read(entry_id):
+            try:
+                doc = self.container.read_item(item=entry_id, partition_key='entry')
+            except CosmosResourceNotFoundError:
+                return None
+            return doc if doc.get('course_id') == course_id else None
+
+        entry_ids = list(updates)
+        docs = []
+        for entry_id, (doc, error) in zip(entry_ids, self._run_concurrently(read, entry_ids)):
+            if error is not None:
+                raise error
+            if doc is not None:
+                _check_if_match(doc.get('_etag'), if_match.get(entry_id))
+                docs.append(doc)
+
+        def write(doc):
+            for key in ENTRY_FIELDS:
+                if key in updates[doc['id']]:
+                    doc[key] = updates[doc['id']][key]
+            return self.container.replace_item(
+                item=doc['id'], body=doc, etag=doc['_etag'], match_condition=MatchConditions.IfNotModified,
+            )
+
+        etags, conflicts = {}, []
+        for doc, (written, error) in zip(docs, self._run_concurrently(write, docs)):
+            if isinstance(error, CosmosAccessConditionFailedError):
+                conflicts.append(doc['id'])
+            elif error is not None:
+                raise error
+            else:
+                etags[doc['id']] = written['_etag']
+        if conflicts:
+            logger.warning("일정 일괄 수정 충돌: %s (%s개)", course_id, len(conflicts))
+            raise PreconditionFailedError(conflicts)
+        logger.info("수업 일정 일괄 수정: %s (%s개)", course_id, len(etags))
+        return etags
+
+    # ---- 부분 수정 / 조건부 쓰기 ----
+
+    def _patch(self, item_id, partition_key, operations, if_match=None, filter_predicate=None):
+        """patch_item (부분 문서 수정) → 수정된 문서
+
+        SDK 나 계정(에뮬레이터 등)이 patch 를 지원하지 않으면(405 / 501) _PatchUnsupported 를 던지고,
+        이후 호출은 바로 조건부 replace 로 대체됩니다. 400 (잘못된 patch 등)은 그대로 전달합니다.
+        """
+        from azure.core import MatchConditions
+        from azure.cosmos.exceptions import CosmosHttpResponseError
+        if not self._patch_supported or not hasattr(self.container, 'patch_item'):
+            raise _PatchUnsupported()
+        kwargs = {}
+        if if_match is not None:
+            kwargs.update(etag=if_match, match_condition=MatchConditions.IfNotModified)
+        if filter_predicate is not None:
+            kwargs['filter_predicate'] = filter_predicate
+        try:
+            return self.container.patch_item(
+                item=item_id, partition_key=partition_key, patch_operations=operations, **kwargs
+            )
+        except CosmosHttpResponseError as e:
+            if e.status_code not in (405, 501):
+                raise
+            logger.warning("patch 미지원 → 조건부 replace 로 대체: %s", e)
+            self._patch_supported = False
+            raise _PatchUnsupported()
+
+    def _conditional_update(self, item_id, partition_key, mutate, if_match=None, course_id=None):
+        """포인트 읽기 → mutate(doc) → _etag 조건부 replace → 수정된 문서
+
+        mutate 가 False 를 반환하면 쓰지 않고 None 을 반환합니다.
+        course_id 를 주면 다른 과정의 문서일 때 if_match 확인 전에 None 을 반환합니다 (412 가 아닌 404).
+        if_match 가 없으면 충돌(412) 시 다시 읽어 ETAG_RETRIES 번까지 재시도하고,
+        있으면 그 ETag 와 다를 때 재시도 없이 PreconditionFailedError 를 던집니다.
+        """
+        from azure.core import MatchConditions
+        from azure.cosmos.exceptions import CosmosAccessConditionFailedError
+        for _ in range(ETAG_RETRIES):
+            doc = self.container.read_item(item=item_id, partition_key=partition_key)
+            if course_id is not None and doc.get('course_id') != course_id:
+                return None
+            _check_if_match(doc.get('_etag'), if_match)
+            if mutate(doc) is False:
+                return None
+            try:
+                return self.container.replace_item(
+                    item=item_id, body=doc,
+                    etag=doc['_etag'], match_condition=MatchConditions.IfNotModified,
+                )
+            except CosmosAccessConditionFailedError:
+                if if_match is not None:
+                    raise PreconditionFailedError(if_match)
+        raise RuntimeError(f"동시 수정 충돌이 계속되어 수정하지 못했습니다: {item_id}")
+
+    def _adjust_entry_count(self, course_id, delta):
+        """과정 entry_count 원자적 증감 (0 미만으로 내려가지 않음)
+
+        과정이 없으면 CosmosResourceNotFoundError
+        """
+        from azure.cosmos.exceptions import CosmosAccessConditionFailedError
+        try:
+            # 감소는 entry_count > 0 일 때만 (조건 불일치 = 412 → 이미 0)
+            self._patch(
+                course_id, 'course', [{"op": "incr", "path": "/entry_count", "value": delta}],
+                filter_predicate="FROM c WHERE c.entry_count > 0" if delta < 0 else None,
+            )
+        except CosmosAccessConditionFailedError:
+            pass
+        except _PatchUnsupported:
+            def apply(doc):
+                doc['entry_count'] = max(0, doc.get('entry_count', 0) + delta)
+            self._conditional_update(course_id, 'course', apply)
+
+
+class _PatchUnsupported(Exception):
+    """patch_item 을 쓸 수 없음 (조건부 replace 로 대체)"""
@@ -0,0 +1,241 @@
+"""
+로컬 저장소용 바이너리 컬럼 스냅샷 (.snap)
+
+courses.json 은 일정마다 키 이름이 반복되고 전체를 json.load 해야 하므로 크고 느립니다.
+스냅샷은 같은 데이터를 타입이 있는 컬럼 + 문자열 테이블로 저장하고 mmap 으로 읽습니다.
+  - 과정 메타데이터는 로드 시 바로 만들고 (과정 수만큼만 디코딩)
+  - 일정은 과정별로 처음 접근할 때 그 과정 구간만 디코딩합니다 (LazyCourse)
+
+파일 구조 (리틀 엔디언, 버전 1):
+  header   : magic 'TTSNAP' | version u16 | flags u16 | 문자열 수 u32 | 과정 수 u32 | 일정 수 u32
+  strings  : 오프셋 u32 × (문자열 수 + 1) | UTF-8 blob
+  courses  : 과정마다 u32 × 9 (id, name, color, file_name, uploaded_at, default_start_time 문자열 번호,
+             entry_count, 첫 일정 번호, 일정 수)
+  entries  : 컬럼별 연속 배열 (과정 순서대로, 과정의 일정은 연속 구간)
+             day i32 | class_name u32 | instructor u32 | start_time u32 | end_time u32 | id u32 |
+             hours f64 | is_holiday u8
+
+쓰기는 모든 일정을 인코딩하므로 JSON 과 비슷한 비용이며, 이득은 읽기(시작, 다른 프로세스의 쓰기 반영)에 있습니다.
+모든 일정에는 ID 가 있어야 합니다 (JSON 에서 변환할 때 없는 ID 는 부여).
+
+변환:
+    python -m services.course_snapshot to-snap data/courses.json data/courses.snap
+    python -m services.course_snapshot to-json data/courses.snap data/courses.json
+"""
+import sys
+import json
+import mmap
+import logging
+import struct
+import argparse
+from array import array
+
+from models import ClassEntry, Course, LazyCourse
+
+MAGIC = b'TTSNAP'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<6sHHIII')
+_COURSE_FIELDS = 9
+_STRING_COLUMNS = ('class_name', 'instructor', 'start_time', 'end_time', 'id')
+_intern = sys.intern
+logger = logging.getLogger(__name__)
+
+
+class SnapshotError(ValueError):
+    """스냅샷 파일을 읽을 수 없음 (형식/버전 불일치, 손상)"""
+
+
+def _le(arr):
+    """array → 리틀 엔디언 bytes"""
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def encode(courses):
+    """Course 리스트 → 스냅샷 bytes"""
+    strings, table = [], {}
+
+    def ref(value):
+        idx = table.get(value)
+        if idx is None:
+            idx = table[value] = len(strings)
+            strings.append(value)
+        return idx
+
+    course_cols = array('I')
+    day = array('i')
+    str_cols = {name: array('I') for name in _STRING_COLUMNS}
+    hours = array('d')
+    holiday = array('B')
+
+    for course in courses:
+        first = len(day)
+        if course.invalid_entries:
+            logger.warning("날짜를 읽을 수 없는 일정 %s개는 스냅샷에 저장하지 않습니다: %s",
+                           len(course.invalid_entries), course.id)
+        for e in course.entries:
+            if not e.id:
+                raise ValueError(f"ID 가 없는 일정은 스냅샷에 저장할 수 없습니다: {course.id}")
+            day.append(e.day)
+            str_cols['class_name'].append(ref(e.class_name))
+            str_cols['instructor'].append(ref(e.instructor))
+            str_cols['start_time'].append(ref(e.start_time))
+            str_cols['end_time'].append(ref(e.end_time))
+            str_cols['id'].append(ref(e.id))
+            hours.append(e.hours)
+            holiday.append(1 if e.is_holiday else 0)
+        course_cols.extend((
+            ref(course.id), ref(course.name), ref(course.color), ref(course.file_name),
+            ref(course.uploaded_at), ref(course.default_start_time),
+            course.entry_count, first, len(day) - first,
+        ))
+
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = array('I', [0])
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+
+    parts = [
+        _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(strings), len(courses), len(day)),
+        _le(offsets), b''.join(encoded),
+        _le(course_cols),
+        _le(day), *(_le(str_cols[name]) for name in _STRING_COLUMNS), _le(hours), holiday.tobytes(),
+    ]
+    return b''.join(parts)
+
+
+class _Reader:
+    """mmap 된 스냅샷 하나 (LazyCourse 의 loader 가 참조하는 동안 유지)"""
+
+    def __init__(self, buf):
+        self.buf = buf
+        if len(buf) < _HEADER.size:
+            raise SnapshotError("스냅샷 파일이 너무 짧습니다.")
+        magic, version, _flags, n_strings, n_courses, n_entries = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise SnapshotError("스냅샷 파일이 아닙니다.")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"지원하지 않는 스냅샷 버전입니다: {version}")
+
+        pos = _HEADER.size
+        self.string_offsets = struct.unpack_from(f'<{n_strings + 1}I', buf, pos)
+        pos += 4 * (n_strings + 1)
+        self.blob_start = pos
+        pos += self.string_offsets[-1]
+        self.course_table = struct.unpack_from(f'<{n_courses * _COURSE_FIELDS}I', buf, pos)
+        pos += 4 * n_courses * _COURSE_FIELDS
+
+        self.n_entries = n_entries
+        self.columns = {'day': pos}
+        pos += 4 * n_entries
+        for name in _STRING_COLUMNS:
+            self.columns[name] = pos
+            pos += 4 * n_entries
+        self.columns['hours'] = pos
+        pos += 8 * n_entries
+        self.columns['is_holiday'] = pos
+        pos += n_entries
+        if pos != len(buf):
+            raise SnapshotError("스냅샷 파일 크기가 헤더와 맞지 않습니다 (손상).")
+        self._strings = {}
+
+    def string(self, idx):
+        s = self._strings.get(idx)
+        if s is None:
+            start = self.blob_start + self.string_offsets[idx]
+            end = self.blob_start + self.string_offsets[idx + 1]
+            s = self._strings[idx] = _intern(bytes(self.buf[start:end]).decode('utf-8'))
+        return s
+
+    def _column(self, name, fmt, size, first, count):
+        return struct.unpack_from(f'<{count}{fmt}', self.buf, self.columns[name] + size * first)
+
+    def entries(self, first, count):
+        """first 번째부터 count 개 일정 디코딩 → ClassEntry 리스트"""
+        if not count:
+            return []
+        s = self.string
+        cols = [self._column(name, 'I', 4, first, count) for name in _STRING_COLUMNS]
+        days = self._column('day', 'i', 4, first, count)
+        hours = self._column('hours', 'd', 8, first, count)
+        holidays = self._column('is_holiday', 'B', 1, first, count)
+        return [
+            ClassEntry(day, s(cn), s(ins), int(h) if h.is_integer() else h, s(st), s(et), bool(hol), s(eid))
+            for day, cn, ins, st, et, eid, h, hol in zip(days, *cols, hours, holidays)
+        ]
+
+    def courses(self):
+        s, table = self.string, self.course_table
+        courses = []
+        for i in range(0, len(table), _COURSE_FIELDS):
+            cid, name, color, file_name, uploaded_at, start, entry_count, first, count = table[i:i + _COURSE_FIELDS]
+            courses.append(LazyCourse(
+                id=s(cid), name=s(name), color=s(color), file_name=s(file_name),
+                uploaded_at=s(uploaded_at), default_start_time=s(start), entry_count=entry_count,
+                loader=lambda first=first, count=count: self.entries(first, count),
+            ))
+        return courses
+
+
+def load(path):
+    """스냅샷 파일 → LazyCourse 리스트 (일정은 과정별로 처음 접근할 때 디코딩)"""
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일은 mmap 불가
+            raise SnapshotError("스냅샷 파일이 비어 있습니다.")
+    return _Reader(buf).courses()
+
+
+def loads(data):
+    """스냅샷 bytes → LazyCourse 리스트"""
+    return _Reader(memoryview(data)).courses()
+
+
+# ===== 변환 도구 =====
+
+def json_to_courses(data):
+    """courses.json 데이터 → Course 리스트 (ID 없는 일정에는 ID 부여)"""
+    from dataclasses import replace
+    from services.cosmos_service import _generate_entry_id
+    courses = []
+    for raw in data.get('courses', []):
+        course = Course.from_dict(raw)
+        course.entries = [e if e.id else replace(e, id=_generate_entry_id()) for e in course.entries]
+        courses.append(course)
+    return courses
+
+
+def convert_json_to_snapshot(src, dst):
+    from services.locking import atomic_write
+    with open(src, 'r', encoding='utf-8') as f:
+        courses = json_to_courses(json.load(f))
+    atomic_write(dst, encode(courses))
+    return courses
+
+
+def convert_snapshot_to_json(src, dst):
+    from services.locking import atomic_write
+    courses = load(src)
+    data = {"courses": [c.to_dict(include_entries=True) for c in courses]}
+    atomic_write(dst, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+    return courses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='courses.json ↔ 바이너리 스냅샷 변환')
+    parser.add_argument('command', choices=('to-snap', 'to-json'))
+    parser.add_argument('src')
+    parser.add_argument('dst')
+    args = parser.parse_args(argv)
+
+    convert = convert_json_to_snapshot if args.command == 'to-snap' else convert_snapshot_to_json
+    courses = convert(args.src, args.dst)
+    print(f"{args.src} → {args.dst}: 과정 {len(courses)}개, 일정 {sum(c.entry_count for c in courses)}개")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+날짜별 점유 집계 (연간 히트맵용)
+
+날짜 ordinal → DayTotals 테이블을 유지하며, 저장소 쓰기 알림으로 증분 갱신합니다.
+1년치 조회도 최대 366개 행의 작은 응답이 됩니다.
+"""
+from collections import Counter
+
+from models import date_to_ordinal, ordinal_to_date
+from services.derived_index import DerivedIndex, get_index
+
+MAX_RANGE_DAYS = 366 * 3
+
+
+class DayTotals:
+    """하루치 집계"""
+    __slots__ = ('classes', 'hours', 'instructor_hours', 'holiday_entries', 'instructors', 'courses')
+
+    def __init__(self):
+        self.classes = 0
+        self.hours = 0
+        self.instructor_hours = 0
+        self.holiday_entries = 0
+        self.instructors = Counter()  # 강사명 → 수업 수
+        self.courses = Counter()      # 과정 id → 수업 수
+
+    def is_empty(self):
+        return not self.classes and not self.holiday_entries
+
+    def to_dict(self, day):
+        return {
+            "date": ordinal_to_date(day),
+            "courses": len(self.courses),
+            "classes": self.classes,
+            "hours": self.hours,
+            "instructor_hours": self.instructor_hours,
+            "instructors": len(self.instructors),
+            "holiday": self.holiday_entries > 0,
+        }
+
+
+def _instructor_names(entry):
+    return [n.strip() for n in entry.instructor.split(',') if n.strip()] if entry.instructor else []
+
+
+class DailyAggregate(DerivedIndex):
+    """날짜별 수업 수 / 수업시간 / 휴일 / 강사 수 집계 테이블"""
+
+    def __init__(self, storage):
+        self._days = {}
+        super().__init__(storage)
+
+    def _add(self, course_id, entry, sign):
+        totals = self._days.get(entry.day)
+        if totals is None:
+            if sign < 0:
+                return
+            totals = self._days[entry.day] = DayTotals()
+
+        if entry.is_holiday:
+            totals.holiday_entries += sign
+        else:
+            names = _instructor_names(entry)
+            totals.classes += sign
+            totals.hours += sign * entry.hours
+            totals.instructor_hours += sign * entry.hours * len(names)
+            for name in names:
+                totals.instructors[name] += sign
+                if totals.instructors[name] <= 0:
+                    del totals.instructors[name]
+            totals.courses[course_id] += sign
+            if totals.courses[course_id] <= 0:
+                del totals.courses[course_id]
+
+        if totals.is_empty():
+            del self._days[entry.day]
+
+    def _rebuild(self, courses):
+        self._days = {}
+        for course in courses:
+            for entry in course.entries:
+                self._add(course.id, entry, 1)
+
+    def _apply(self, change):
+        for entry in change.removed:
+            self._add(change.course_id, entry, -1)
+        for entry in change.added:
+            self._add(change.course_id, entry, 1)
+
+    def query(self, start, end):
+        """[start, end] 날짜별 집계 리스트 (데이터가 있는 날만)"""
+        try:
+            start_ord, end_ord = date_to_ordinal(start), date_to_ordinal(end)
+        except (TypeError, ValueError):
+            raise ValueError("start, end 날짜를 YYYY-MM-DD 형식으로 입력해주세요.")
+        if start_ord > end_ord:
+            raise ValueError("시작일이 종료일보다 늦습니다.")
+        if end_ord - start_ord + 1 > MAX_RANGE_DAYS:
+            raise ValueError(f"조회 기간은 최대 {MAX_RANGE_DAYS}일입니다.")
+
+        self.ensure_current()
+        with self._lock:
+            days = self._days
+            return [
+                days[day].to_dict(day)
+                for day in range(start_ord, end_ord + 1)
+                if day in days
+            ]
+
+
+def get_daily_aggregate(storage):
+    return get_index(DailyAggregate, storage)
@@ -0,0 +1,71 @@
+"""
+저장소 데이터에서 파생되는 인메모리 인덱스의 공통 뼈대
+
+- 저장소 변경 알림(StorageChange)을 받아 증분 갱신하고,
+- 알림을 놓쳤거나(다른 프로세스의 쓰기 등) 버전을 알 수 없으면
+  다음 조회 시 저장소 스냅샷에서 전체 재구성합니다.
+
+인덱스는 저장소 인스턴스마다 하나씩 get_index(cls, storage) 로 얻습니다.
+"""
+import threading
+import weakref
+from abc import ABC, abstractmethod
+
+_STALE = object()
+
+_instances = weakref.WeakKeyDictionary()
+_instances_lock = threading.Lock()
+
+
+class DerivedIndex(ABC):
+    """하위 클래스는 _rebuild(courses) 와 _apply(change) 를 구현합니다."""
+
+    def __init__(self, storage):
+        self._storage = storage
+        self._lock = threading.RLock()
+        self._version = _STALE
+        storage.add_listener(self._on_change)
+
+    @abstractmethod
+    def _rebuild(self, courses):
+        """저장소 스냅샷의 Course 리스트로 전체 재구성"""
+
+    def _apply(self, change):
+        """증분 반영. False 를 반환하면 다음 조회 때 전체 재구성"""
+        return False
+
+    def _on_change(self, change):
+        with self._lock:
+            if (change.before is None or change.before != self._version
+                    or change.removed is None or change.added is None):
+                self._version = _STALE
+                return
+            if self._apply(change) is False:
+                self._version = _STALE
+                return
+            self._version = change.after
+
+    def ensure_current(self):
+        """현재 저장소 버전과 다르면 재구성 (호출 후 self._lock 안에서 조회)"""
+        version = self._storage.get_data_version()
+        if version is not None and version == self._version:
+            return
+        # 스냅샷은 인덱스 락 밖에서 읽음: get_snapshot 이 저장소 쓰기(로컬 JSON 의 ID 보정 등)를 거쳐
+        # _on_change 를 부를 수 있어, 락을 잡은 채 읽으면 변경 알림을 기다리는 writer 와 교착됩니다.
+        version, courses = self._storage.get_snapshot()
+        with self._lock:
+            if version is not None and version == self._version:
+                return
+            self._rebuild(courses)
+            self._version = version if version is not None else _STALE
+
+
+def get_index(cls, storage):
+    """저장소별 인덱스 싱글턴"""
+    per_storage = _instances.get(storage)
+    if per_storage is None or cls not in per_storage:
+        with _instances_lock:
+            per_storage = _instances.setdefault(storage, {})
+            if cls not in per_storage:
+                per_storage[cls] = cls(storage)
+    return per_storage[cls]
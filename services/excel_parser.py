@@ -1,9 +1,16 @@
 """
 Vertex42 캘린더 엑셀 템플릿 파서
+
+openpyxl 은 import 비용이 커서 (앱 시작 시간의 대부분) 워크북을 열 때 import 합니다.
+calculate_end_time 이나 상수만 쓰는 모듈은 openpyxl 을 로드하지 않습니다.
+
+시트는 read_only 로 한 번 훑어 {(행, 열): 값} 으로 읽고 (빈 셀마다 Cell 객체를 만들지 않음),
+정규식은 모듈 로드 시 컴파일합니다. 셀 텍스트 해석과 종료 시간 계산은 같은 입력이
+매우 자주 반복되므로 (강사명, "3h", 기본 시작 시간) 크기 제한 LRU 캐시로 memoize 합니다.
 """
 import re
 from datetime import datetime, timedelta
-import openpyxl
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,14 +39,30 @@ HOLIDAY_KEYWORDS = {
 }
 
 
+# 공휴일 키워드 중 하나라도 포함하는지 (키워드별 substring 검사 대신 한 번의 검색)
+_HOLIDAY_RE = re.compile('|'.join(map(re.escape, sorted(HOLIDAY_KEYWORDS, key=len, reverse=True))))
+
+_NAME_RE = re.compile(r'^[가-힣]{2,4}$')                    # 한국어 이름 2~4자
+_NAME_PAIR_RE = re.compile(r'^[가-힣]{2,4}/[가-힣]{2,4}$')   # "황소영/정종현"
+_NAME_TITLE_RE = re.compile(r'^[가-힣]{2,4}강사$')           # "박정일강사"
+_HOURS_ONLY_RE = re.compile(r'^\d+h?$', re.IGNORECASE)      # "8", "8h"
+_HOURS_TOKEN_RE = re.compile(r'^(\d+)h$', re.IGNORECASE)    # 텍스트 안의 "3h"
+_TRAILING_HOURS_RE = re.compile(r'\s+\d+h\s*$', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+SCAN_MAX_COL = max(col for pair in DAY_CONFIG for col in pair)
+
+
 def get_sheet_names(filepath):
     """엑셀 파일의 시트 목록 반환 (정보 시트 제외)"""
+    import openpyxl
     wb = openpyxl.load_workbook(filepath, data_only=True, read_only=True)
     sheets = [name for name in wb.sheetnames if name not in INFO_SHEETS]
     wb.close()
     return sheets
 
 
+@lru_cache(maxsize=1024)
 def calculate_end_time(start_time_str, hours):
     """시작 시간 + 수업 시간 → 종료 시간 계산 (점심시간 13:00~14:00 포함)"""
     h, m = map(int, start_time_str.split(':'))
@@ -54,12 +77,22 @@ def calculate_end_time(start_time_str, hours):
     return end.strftime('%H:%M')
 
 
-def _detect_week_start_rows(ws):
+def _sheet_values(ws):
+    """워크시트 → {(행, 열): 값} (빈 셀 제외, 파서가 보는 열까지만)"""
+    values = {}
+    for row, cells in enumerate(ws.iter_rows(max_col=SCAN_MAX_COL, values_only=True), start=1):
+        for col, value in enumerate(cells, start=1):
+            if value is not None:
+                values[row, col] = value
+    return values
+
+
+def _detect_week_start_rows(values):
     """시트에서 실제 주 시작 행을 동적으로 감지"""
     date_rows = set()
     for row in range(8, 55):
         for date_col, _ in DAY_CONFIG:
-            cell_val = ws.cell(row=row, column=date_col).value
+            cell_val = values.get((row, date_col))
             if isinstance(cell_val, datetime) and cell_val.year >= 2020:
                 date_rows.add(row)
                 break
@@ -75,7 +108,7 @@ def _detect_week_start_rows(ws):
         if r - week_rows[-1] >= 4:
             week_rows.append(r)
 
-    logger.info(f"감지된 주 시작 행: {week_rows}")
+    logger.info("감지된 주 시작 행: %s", week_rows)
     return week_rows
 
 
@@ -98,25 +131,26 @@ def _is_korean_name(text):
     if cleaned.replace('h', '').replace('H', '').replace(' ', '').isdigit():
         return False
     # '8h' 같은 시간 형식 제외
-    if re.match(r'^\d+h?$', cleaned, re.IGNORECASE):
+    if _HOURS_ONLY_RE.match(cleaned):
         return False
     # 이름이 아닌 키워드 필터
     if cleaned in NOT_NAME_WORDS:
         return False
     # 한국어 이름: 2~4자 한글만 (한국 이름은 대부분 2~4자)
-    if re.match(r'^[가-힣]{2,4}$', cleaned):
+    if _NAME_RE.match(cleaned):
         return True
     # "황소영/정종현" 같은 복수 강사
-    if re.match(r'^[가-힣]{2,4}/[가-힣]{2,4}$', cleaned):
+    if _NAME_PAIR_RE.match(cleaned):
         return True
     # "박정일강사" 같은 패턴 → "박정일"로 정제
-    if re.match(r'^[가-힣]{2,4}강사$', cleaned):
+    if _NAME_TITLE_RE.match(cleaned):
         return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def _extract_names_from_text(text):
-    """텍스트에서 한국어 강사명 추출 (복수 가능)"""
+    """텍스트에서 한국어 강사명 추출 (복수 가능) → 튜플 (캐시 공유되므로 불변)"""
     names = []
 
     # "황소영/정종현" 슬래시 구분
@@ -125,10 +159,10 @@ def _extract_names_from_text(text):
             part = part.strip()
             if part.endswith('강사'):
                 part = part[:-2]
-            if re.match(r'^[가-힣]{2,4}$', part):
+            if _NAME_RE.match(part):
                 names.append(part)
         if names:
-            return names
+            return tuple(names)
 
     # "강명호,인선미" 쉼표 구분
     if ',' in text:
@@ -136,10 +170,10 @@ def _extract_names_from_text(text):
             part = part.strip().split()[0] if part.strip() else ''
             if part.endswith('강사'):
                 part = part[:-2]
-            if re.match(r'^[가-힣]{2,4}$', part):
+            if _NAME_RE.match(part):
                 names.append(part)
         if names:
-            return names
+            return tuple(names)
 
     # 단어별 스캔
     for part in text.split():
@@ -148,25 +182,38 @@ def _extract_names_from_text(text):
             cleaned = cleaned[:-2]
         if cleaned in NOT_NAME_WORDS:
             continue
-        if re.match(r'^[가-힣]{2,4}$', cleaned):
+        if _NAME_RE.match(cleaned):
             names.append(cleaned)
 
-    return names
+    return tuple(names)
 
 
-def _extract_instructors_and_hours(ws, date_col, class_col, week_row, default_hours):
+@lru_cache(maxsize=4096)
+def _text_hours(text):
+    """텍스트 안의 "Xh" 시간들 (12h 이하만 — 16h 버그 수정) → 튜플"""
+    hours = []
+    for part in text.split():
+        m = _HOURS_TOKEN_RE.match(part)
+        if m:
+            h = int(m.group(1))
+            if 1 <= h <= 12:
+                hours.append(h)
+    return tuple(hours)
+
+
+def _extract_instructors_and_hours(values, date_col, class_col, week_row, default_hours):
     """수업명 아래에서 강사명(복수)과 수업시간 추출"""
     instructors = []
     numeric_hours = None      # 숫자 셀에서 발견된 시간 (우선순위 1)
     text_hours_list = []      # 텍스트 "Xh"에서 발견된 시간들
 
     # 날짜 열과 수업명 열 모두에서 스캔
-    scan_cols = sorted(set([date_col, class_col]))
+    scan_cols = sorted({date_col, class_col})
 
     for offset in range(1, 6):
         row = week_row + offset
         for col in scan_cols:
-            cell_val = ws.cell(row=row, column=col).value
+            cell_val = values.get((row, col))
             if cell_val is None:
                 continue
 
@@ -181,18 +228,12 @@ def _extract_instructors_and_hours(ws, date_col, class_col, week_row, default_ho
                     continue
 
                 # 강사명 추출 (복수 수집)
-                names = _extract_names_from_text(text)
-                for name in names:
+                for name in _extract_names_from_text(text):
                     if name not in instructors:
                         instructors.append(name)
 
-                # 텍스트 내 시간 추출 (12h 이하만 — 16h 버그 수정)
-                for part in text.split():
-                    m = re.match(r'^(\d+)h$', part, re.IGNORECASE)
-                    if m:
-                        h = int(m.group(1))
-                        if 1 <= h <= 12:
-                            text_hours_list.append(h)
+                # 텍스트 내 시간 추출
+                text_hours_list.extend(_text_hours(text))
 
     # 시간 결정: 숫자 셀 우선 → 텍스트 합산 → 기본값
     if numeric_hours is not None:
@@ -204,80 +245,87 @@ def _extract_instructors_and_hours(ws, date_col, class_col, week_row, default_ho
 
     # 강사 있고 시간 없으면 기본값
     if instructors and numeric_hours is None and not text_hours_list:
-        logger.debug(f"  강사 {instructors} 발견, 시간 미지정 → 기본 {hours}h 적용")
+        logger.debug("  강사 %s 발견, 시간 미지정 → 기본 %sh 적용", instructors, hours)
 
     instructor_str = ",".join(instructors)
     return instructor_str, hours
 
 
-def parse_timetable(filepath, selected_sheets, default_start_time='09:00', default_hours=8):
-    """엑셀 시간표 파싱 → ClassEntry 리스트 반환"""
-    wb = openpyxl.load_workbook(filepath, data_only=True)
+def _parse_sheet(values, default_start_time, default_hours):
+    """시트 값 ({(행, 열): 값}) → entry dict 리스트"""
     entries = []
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    for sheet_name in selected_sheets:
-        if sheet_name in INFO_SHEETS:
-            continue
-        if sheet_name not in wb.sheetnames:
-            logger.warning(f"시트 '{sheet_name}'을 찾을 수 없습니다.")
-            continue
+    # 동적으로 주 시작 행 감지
+    week_start_rows = _detect_week_start_rows(values)
 
-        ws = wb[sheet_name]
-        logger.info(f"시트 '{sheet_name}' 파싱 중...")
+    for week_row in week_start_rows:
+        for date_col, class_col in DAY_CONFIG:
+            # 1. 날짜 읽기
+            date_cell = values.get((week_row, date_col))
+            if not isinstance(date_cell, datetime):
+                continue
+            if date_cell.year < 2020:
+                continue
 
-        # 동적으로 주 시작 행 감지
-        week_start_rows = _detect_week_start_rows(ws)
+            # 2. 수업명 읽기
+            class_cell = values.get((week_row, class_col))
+            if not isinstance(class_cell, str):
+                continue
+            class_name = _WHITESPACE_RE.sub(' ', class_cell.strip())
+            if not class_name:
+                continue
 
-        for week_row in week_start_rows:
-            for date_col, class_col in DAY_CONFIG:
-                # 1. 날짜 읽기
-                date_cell = ws.cell(row=week_row, column=date_col).value
-                if date_cell is None:
-                    continue
-                if not isinstance(date_cell, datetime):
-                    continue
-                if date_cell.year < 2020:
-                    continue
+            # 3. 공휴일 체크
+            is_holiday = _HOLIDAY_RE.search(class_name) is not None
+
+            # 4. 수업명에서 잔여 시간 패턴 제거 ("수업명 3h" → "수업명")
+            class_name = _TRAILING_HOURS_RE.sub('', class_name)
+
+            # 5. 강사명(복수), 수업시간 추출
+            instructor = ""
+            hours = default_hours
+            if not is_holiday:
+                instructor, hours = _extract_instructors_and_hours(
+                    values, date_col, class_col, week_row, default_hours
+                )
+
+            # 6. 종료 시간 계산
+            end_time = calculate_end_time(default_start_time, hours)
+
+            # 7. Entry 생성
+            entry = {
+                "date": date_cell.strftime('%Y-%m-%d'),
+                "class_name": class_name,
+                "instructor": instructor,
+                "hours": hours,
+                "start_time": default_start_time,
+                "end_time": end_time,
+                "is_holiday": is_holiday,
+            }
+            entries.append(entry)
+            if debug:
+                logger.debug("  %s | %s | %s | %sh", entry['date'], class_name, instructor, hours)
+    return entries
 
-                # 2. 수업명 읽기
-                class_cell = ws.cell(row=week_row, column=class_col).value
-                if class_cell is None or not isinstance(class_cell, str):
-                    continue
-                class_name = class_cell.strip().replace('\n', ' ').replace('\t', ' ')
-                class_name = re.sub(r'\s+', ' ', class_name)
-                if not class_name:
-                    continue
 
-                # 3. 공휴일 체크
-                is_holiday = any(kw in class_name for kw in HOLIDAY_KEYWORDS)
-
-                # 4. 수업명에서 잔여 시간 패턴 제거 ("수업명 3h" → "수업명")
-                class_name = re.sub(r'\s+\d+h\s*$', '', class_name, flags=re.IGNORECASE)
-
-                # 5. 강사명(복수), 수업시간 추출
-                instructor = ""
-                hours = default_hours
-                if not is_holiday:
-                    instructor, hours = _extract_instructors_and_hours(
-                        ws, date_col, class_col, week_row, default_hours
-                    )
-
-                # 6. 종료 시간 계산
-                end_time = calculate_end_time(default_start_time, hours)
-
-                # 7. Entry 생성
-                entry = {
-                    "date": date_cell.strftime('%Y-%m-%d'),
-                    "class_name": class_name,
-                    "instructor": instructor,
-                    "hours": hours,
-                    "start_time": default_start_time,
-                    "end_time": end_time,
-                    "is_holiday": is_holiday,
-                }
-                entries.append(entry)
-                logger.debug(f"  {entry['date']} | {class_name} | {instructor} | {hours}h")
+def parse_timetable(filepath, selected_sheets, default_start_time='09:00', default_hours=8):
+    """엑셀 시간표 파싱 → ClassEntry 리스트 반환"""
+    import openpyxl
+    wb = openpyxl.load_workbook(filepath, data_only=True, read_only=True)
+    entries = []
+    try:
+        for sheet_name in selected_sheets:
+            if sheet_name in INFO_SHEETS:
+                continue
+            if sheet_name not in wb.sheetnames:
+                logger.warning("시트 '%s'을 찾을 수 없습니다.", sheet_name)
+                continue
 
-    wb.close()
-    logger.info(f"총 {len(entries)}개 수업 일정 파싱 완료")
+            logger.info("시트 '%s' 파싱 중...", sheet_name)
+            entries.extend(_parse_sheet(_sheet_values(wb[sheet_name]), default_start_time, default_hours))
+    finally:
+        wb.close()
+
+    logger.info("총 %s개 수업 일정 파싱 완료", len(entries))
     return entries
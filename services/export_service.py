@@ -0,0 +1,212 @@
+"""
+시간표 엑셀 내보내기 (openpyxl write_only 스트리밍)
+
+행 단위로 write_only 워크북에 기록하고 SpooledTemporaryFile 에 저장한 뒤
+청크 단위로 읽어 응답하므로, 큰 내보내기도 메모리 사용량이 일정합니다.
+
+레이아웃:
+  list     : 한 시트에 (날짜, 과정, 수업명, 강사, ...) 목록
+  vertex42 : 과정별·월별 시트에 excel_parser 가 읽는 Vertex42 그리드
+             (WEEK_START_ROWS × DAY_CONFIG) → 다시 업로드 가능
+"""
+import heapq
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import islice
+from operator import itemgetter
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from models import date_to_ordinal
+from services.excel_parser import DAY_CONFIG, HOLIDAY_KEYWORDS, WEEK_START_ROWS
+
+LAYOUTS = ('list', 'vertex42')
+SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 이보다 크면 디스크 임시 파일로 전환
+CHUNK_SIZE = 64 * 1024
+
+LIST_HEADER = ('날짜', '요일', '과정', '수업명', '강사', '시간', '시작', '종료', '휴일', '과정 ID', '일정 ID')
+WEEKDAYS = '월화수목금토일'
+INVALID_SHEET_CHARS = str.maketrans({c: ' ' for c in '[]:*?/\\'})
+_ROW_KEY = itemgetter(0, 1, 2)  # (날짜, 과정 순번, 시작 시각)
+
+
+def _select(courses, start, end, course_ids):
+    """조회 조건 검증 → (선택된 과정 리스트, 시작 ordinal, 종료 ordinal)"""
+    try:
+        start_ord = date_to_ordinal(start) if start else date.min.toordinal()
+        end_ord = date_to_ordinal(end) if end else date.max.toordinal()
+    except ValueError:
+        raise ValueError("날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+    if start_ord > end_ord:
+        raise ValueError("시작일이 종료일보다 늦습니다.")
+
+    if course_ids:
+        by_id = {c.id: c for c in courses}
+        missing = [cid for cid in course_ids if cid not in by_id]
+        if missing:
+            raise ValueError(f"과정을 찾을 수 없습니다: {', '.join(missing)}")
+        courses = [by_id[cid] for cid in dict.fromkeys(course_ids)]
+    return courses, start_ord, end_ord
+
+
+def _bold(ws, values):
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = Font(bold=True)
+        cells.append(cell)
+    return cells
+
+
+# ===== list 레이아웃 =====
+
+def _write_list(wb, courses, start_ord, end_ord):
+    ws = wb.create_sheet('일정')
+    ws.freeze_panes = 'A2'
+    ws.append(_bold(ws, LIST_HEADER))
+
+    # 과정별 (날짜, 시작 시각) 순 스트림을 병합하며 바로 기록 (전체 일정을 모아 정렬하지 않음)
+    streams = [_course_rows(ci, course, start_ord, end_ord) for ci, course in enumerate(courses)]
+    count = 0
+    for day, ci, _, entry in heapq.merge(*streams, key=_ROW_KEY):
+        course = courses[ci]
+        d = date.fromordinal(day)
+        ws.append((
+            d, WEEKDAYS[d.weekday()], course.name, entry.class_name, entry.instructor,
+            0 if entry.is_holiday else entry.hours, entry.start_time, entry.end_time,
+            'Y' if entry.is_holiday else '', course.id, entry.id,
+        ))
+        count += 1
+    return count
+
+
+def _course_rows(ci, course, start_ord, end_ord):
+    """과정 하나의 기간 내 일정 → (날짜, 과정 순번, 시작 시각, 일정) 스트림 (날짜·시작 시각 순)
+
+    저장된 일정은 대개 날짜 순이라 그대로 흘려보내고, 순서가 어긋난 과정만 그 과정 안에서 정렬합니다.
+    """
+    entries = course.entries
+    rows = ((e.day, ci, e.start_time, e) for e in entries if start_ord <= e.day <= end_ord)
+    in_order = all((a.day, a.start_time) <= (b.day, b.start_time) for a, b in zip(entries, islice(entries, 1, None)))
+    return rows if in_order else iter(sorted(rows, key=_ROW_KEY))
+
+
+# ===== vertex42 레이아웃 =====
+
+def _sheet_title(course_name, year, month, used):
+    base = f"{course_name.translate(INVALID_SHEET_CHARS).strip()[:20]} {year}.{month:02d}".strip()
+    title, n = base, 2
+    while title in used:
+        title = f"{base[:28]}~{n}"
+        n += 1
+    used.add(title)
+    return title
+
+
+def _grid_class_name(entry):
+    """휴일 키워드가 없는 휴일명은 다시 읽을 때 휴일로 인식되도록 표시"""
+    if entry.is_holiday and not any(kw in entry.class_name for kw in HOLIDAY_KEYWORDS):
+        return f"{entry.class_name} (휴일)"
+    return entry.class_name
+
+
+def _write_month(ws, year, month, entries):
+    """월 하나를 Vertex42 그리드로 기록 (write_only 이므로 행 순서대로 append)"""
+    first = date(year, month, 1)
+    first_monday = first - timedelta(days=first.weekday())
+    grid = defaultdict(dict)  # row → {col: value}
+    grid[2][3] = f"{year}년 {month}월"
+
+    # 평일 날짜 칸은 모두 채움 (파서의 주 시작 행 감지용)
+    d = first
+    while d.month == month:
+        if d.weekday() < 5:
+            week_row = WEEK_START_ROWS[(d - first_monday).days // 7]
+            date_col, _ = DAY_CONFIG[d.weekday()]
+            cell = WriteOnlyCell(ws, value=datetime(d.year, d.month, d.day))
+            cell.number_format = 'd'
+            grid[week_row][date_col] = cell
+        d += timedelta(days=1)
+
+    for entry in entries:
+        d = date.fromordinal(entry.day)
+        week_row = WEEK_START_ROWS[(d - first_monday).days // 7]
+        _, class_col = DAY_CONFIG[d.weekday()]
+        if class_col in grid[week_row]:
+            continue  # 그리드는 하루 한 칸 (같은 날 두 번째 일정은 생략)
+        grid[week_row][class_col] = _grid_class_name(entry)
+        if not entry.is_holiday:
+            if entry.instructor:
+                grid[week_row + 1][class_col] = entry.instructor.replace(',', '/')
+            grid[week_row + 2][class_col] = entry.hours
+
+    for row in range(1, max(grid) + 1):
+        cols = grid.get(row)
+        if not cols:
+            ws.append(())
+            continue
+        ws.append([cols.get(col) for col in range(1, max(cols) + 1)])
+
+
+def _write_vertex42(wb, courses, start_ord, end_ord):
+    info = wb.create_sheet('정보')
+    info.append(_bold(info, ('과정 ID', '과정명', '시트')))
+    used = set()
+    written = 0
+    for course in courses:
+        by_month = defaultdict(list)
+        for entry in course.entries:
+            if start_ord <= entry.day <= end_ord:
+                d = date.fromordinal(entry.day)
+                if d.weekday() < 5:  # 템플릿은 평일만
+                    by_month[(d.year, d.month)].append(entry)
+        titles = []
+        for (year, month), entries in sorted(by_month.items()):
+            entries.sort(key=lambda e: (e.day, e.start_time))
+            ws = wb.create_sheet(_sheet_title(course.name, year, month, used))
+            _write_month(ws, year, month, entries)
+            titles.append(ws.title)
+            written += len(entries)
+        info.append((course.id, course.name, ', '.join(titles)))
+    return written
+
+
+def build_export(courses, start=None, end=None, course_ids=None, layout='list'):
+    """선택된 일정을 xlsx 로 기록 → (SpooledTemporaryFile, 크기, 일정 수)
+
+    반환된 파일은 호출자가 iter_file() 로 읽거나 닫아야 합니다.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout 은 {', '.join(LAYOUTS)} 중 하나여야 합니다.")
+    courses, start_ord, end_ord = _select(courses, start, end, course_ids)
+
+    wb = Workbook(write_only=True)
+    if layout == 'vertex42':
+        count = _write_vertex42(wb, courses, start_ord, end_ord)
+    else:
+        count = _write_list(wb, courses, start_ord, end_ord)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    try:
+        wb.save(spool)
+        size = spool.tell()
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return spool, size, count
+
+
+def iter_file(f, chunk_size=CHUNK_SIZE):
+    """파일을 청크 단위로 읽어 전송하고 닫음"""
+    try:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
@@ -0,0 +1,224 @@
+"""
+iCalendar (.ics) 피드 서비스
+
+과정별 / 강사별 구독 피드를 format_events 와 같은 이벤트에서 만들어 스트리밍합니다.
+렌더링 결과는 (피드, 데이터 버전) 단위로 캐시되어, 구독 앱의 반복 폴링은
+304 또는 캐시 히트로 끝납니다.
+  - 버전이 있는 저장소(로컬 JSON): ETag = hash(피드, 버전) → 렌더링 전에 304 판단
+  - 버전이 없는 저장소(Cosmos): 본문을 렌더링한 뒤 내용 hash 를 ETag 로 사용
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+
+from config import Config
+from services.calendar_service import format_events
+
+FEED_CACHE_SIZE = 512
+EVENTS_PER_CHUNK = 64
+PRODID = '-//Timetable Dashboard//KO'
+
+
+class CachedFeed:
+    """피드 한 버전의 메타데이터 + 렌더링 완료된 본문"""
+    __slots__ = ('etag', 'last_modified', 'body')
+
+    def __init__(self, etag, last_modified):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = None  # 첫 스트리밍이 끝나면 채워짐
+
+
+class FeedCache:
+    """(피드 키, 데이터 버전) → CachedFeed LRU"""
+
+    def __init__(self, maxsize=FEED_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            feed = self._items.get(key)
+            if feed is not None:
+                self._items.move_to_end(key)
+            return feed
+
+    def get_or_create(self, key, etag):
+        with self._lock:
+            feed = self._items.get(key)
+            if feed is not None:
+                self._items.move_to_end(key)
+                return feed
+            feed = self._items[key] = CachedFeed(etag, datetime.now(timezone.utc).replace(microsecond=0))
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return feed
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_cache = FeedCache()
+
+
+# ===== iCalendar 포맷 =====
+
+def _escape(text):
+    return (str(text).replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line):
+    """RFC 5545 줄 접기 (75 octet, UTF-8 문자 경계 유지)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts, current, size, limit = [], [], 0, 75
+    for ch in line:
+        n = len(ch.encode('utf-8'))
+        if size + n > limit:
+            parts.append(''.join(current))
+            current, size, limit = [], 0, 74  # 이어지는 줄은 앞 공백 1 octet
+        current.append(ch)
+        size += n
+    parts.append(''.join(current))
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _utc_stamp(local_iso):
+    """로컬(KST) ISO 일시 → UTC 'YYYYMMDDTHHMMSSZ'"""
+    dt = datetime.fromisoformat(local_iso) - Config.TIMEZONE_OFFSET
+    return dt.strftime('%Y%m%dT%H%M%SZ')
+
+
+def _dtstamp(course):
+    """DTSTAMP 는 과정 업로드 시각으로 고정 (같은 데이터 → 같은 본문)"""
+    try:
+        return _utc_stamp(course.uploaded_at[:19])
+    except (TypeError, ValueError):
+        return '19700101T000000Z'
+
+
+def _vevent(event, dtstamp):
+    props = event["extendedProps"]
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{event["id"]}@timetable-dashboard',
+        f'DTSTAMP:{dtstamp}',
+    ]
+    if event.get("allDay"):
+        day = date.fromisoformat(event["start"])
+        lines.append(f'DTSTART;VALUE=DATE:{day:%Y%m%d}')
+        lines.append(f'DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}')
+        lines.append('TRANSP:TRANSPARENT')
+    else:
+        lines.append(f'DTSTART:{_utc_stamp(event["start"])}')
+        lines.append(f'DTEND:{_utc_stamp(event["end"])}')
+    lines.append(f'SUMMARY:{_escape(event["title"])}')
+    description = props["course_name"]
+    if props["instructor"]:
+        description += f'\n강사: {props["instructor"]}'
+    if props["hours"]:
+        description += f'\n{props["hours"]}시간'
+    lines.append(f'DESCRIPTION:{_escape(description)}')
+    lines.append(f'CATEGORIES:{_escape(props["course_name"])}')
+    lines.append('END:VEVENT')
+    return ''.join(_fold(line) for line in lines)
+
+
+def _iter_calendar(cal_name, events, stamps):
+    """VCALENDAR 본문을 bytes 청크로 생성"""
+    yield (
+        'BEGIN:VCALENDAR\r\n'
+        'VERSION:2.0\r\n'
+        f'PRODID:{PRODID}\r\n'
+        'CALSCALE:GREGORIAN\r\n'
+        'METHOD:PUBLISH\r\n'
+        + _fold(f'X-WR-CALNAME:{_escape(cal_name)}')
+        + 'X-WR-TIMEZONE:Asia/Seoul\r\n'
+    ).encode('utf-8')
+    chunk = []
+    for event in events:
+        chunk.append(_vevent(event, stamps[event["extendedProps"]["course_id"]]))
+        if len(chunk) >= EVENTS_PER_CHUNK:
+            yield ''.join(chunk).encode('utf-8')
+            chunk = []
+    chunk.append('END:VCALENDAR\r\n')
+    yield ''.join(chunk).encode('utf-8')
+
+
+# ===== 피드 =====
+
+def course_feed(courses, course_id):
+    """과정 피드 렌더러 (과정이 없으면 None)"""
+    course = next((c for c in courses if c.id == course_id), None)
+    if course is None:
+        return None
+    return _iter_calendar(course.name, format_events([course]), {course.id: _dtstamp(course)})
+
+
+def instructor_feed(courses, name):
+    """강사 피드 렌더러 (복수 강사 일정 포함, 휴일 제외 / 강사 일정이 있는 과정이 없으면 None)"""
+    mine = [
+        c for c in courses
+        if any(e.instructor and name in _split_names(e.instructor) for e in c.entries)
+    ]
+    if not mine:
+        return None
+    events = (
+        ev for ev in format_events(mine)
+        if not ev["extendedProps"]["is_holiday"] and name in _split_names(ev["extendedProps"]["instructor"])
+    )
+    return _iter_calendar(f'{name} 강의 일정', events, {c.id: _dtstamp(c) for c in mine})
+
+
+def empty_instructor_feed(name):
+    """일정이 없는 강사의 빈 캘린더 (구독은 유지되도록 404 대신 사용)"""
+    return _iter_calendar(f'{name} 강의 일정', (), {})
+
+
+def _split_names(instructor):
+    return [n.strip() for n in instructor.split(',')]
+
+
+def _recording(feed, chunks):
+    """스트리밍하면서 본문을 모아, 끝까지 전송되면 캐시에 저장"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    feed.body = b''.join(parts)
+
+
+def get_feed(storage, feed_key, render, empty=None):
+    """피드 조회 → (etag, last_modified, 청크 iterable) / 대상이 없으면 None
+
+    render(courses) 는 청크 generator 를 반환하거나, 대상이 없으면 None 을 반환합니다.
+    대상이 없을 때 empty() 가 주어지면 그 본문을 캐시하지 않고 반환합니다.
+    캐시 항목은 대상이 있는 피드만 만들므로, 없는 키로 반복 조회해도 실제 피드가 LRU 에서 밀려나지 않습니다.
+    반환된 iterable 은 소비되기 전까지 렌더링하지 않으므로 304 응답이면 비용이 들지 않습니다.
+    """
+    version, courses = storage.get_snapshot()
+    if version is not None:
+        key = (feed_key, version)
+        feed = _cache.get(key)
+        if feed is not None and feed.body is not None:
+            return feed.etag, feed.last_modified, [feed.body]
+
+    chunks = render(courses)
+    if chunks is None:
+        if empty is None:
+            return None
+        chunks, version = empty(), None
+    if version is None:
+        body = b''.join(chunks)
+        return f'"{hashlib.sha1(body).hexdigest()}"', None, [body]
+
+    etag = '"' + hashlib.sha1(f'{feed_key}\0{version}'.encode('utf-8')).hexdigest() + '"'
+    feed = _cache.get_or_create(key, etag)
+    if feed.body is not None:
+        return feed.etag, feed.last_modified, [feed.body]
+    return feed.etag, feed.last_modified, _recording(feed, chunks)
@@ -0,0 +1,140 @@
+"""
+저장소 동시성 유틸리티
+
+- ReadWriteLock: 프로세스 내 다중 reader / 단일 writer 락
+- file_lock: 프로세스 간 advisory 파일 락 (gunicorn 워커 등)
+- atomic_write: 임시 파일 + fsync + os.replace 로 파일 원자적 교체
+"""
+import os
+import stat
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 새 파일 기본 권한 계산용 umask (os.umask 는 읽으려면 바꿔야 하므로 스레드가 없는 import 시점에 한 번만)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class ReadWriteLock:
+    """다중 reader / 단일 writer 락 (writer 우선)
+
+    reader 끼리는 서로 막지 않으며, 대기 중인 writer 가 있으면 새 reader 는
+    writer 가 끝날 때까지 기다립니다 (writer 기아 방지).
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_lock(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+@contextmanager
+def file_lock(path, shared=False):
+    """프로세스 간 advisory 락 (락 전용 파일 사용, 데이터 파일과 분리)"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            # msvcrt 는 공유 락이 없으므로 항상 배타 락
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.01)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path):
+    """교체될 파일의 권한 (없으면 umask 를 적용한 새 파일 기본값)"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write(path, data, replace_lock=None):
+    """bytes 를 같은 디렉토리의 임시 파일에 쓰고 fsync 후 원자적으로 교체
+
+    replace_lock 이 주어지면 교체(os.replace) 순간에만 잡습니다.
+    직렬화·쓰기·fsync 동안에는 reader 를 막지 않습니다.
+    반환값은 새 파일의 os.stat_result (교체 전에 fstat 으로 얻으므로 경쟁 없음)입니다.
+    mkstemp 는 0600 으로 만들므로 교체 전에 기존 파일의 권한(없으면 umask 기본값)으로 맞춥니다.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        os.chmod(tmp_path, _file_mode(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            stat = os.fstat(f.fileno())
+        if replace_lock is not None:
+            with replace_lock:
+                os.replace(tmp_path, path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # rename 자체의 내구성 확보 (POSIX 만 디렉토리 fsync 지원)
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return stat
@@ -0,0 +1,159 @@
+"""
+목록 API 페이지네이션 / 필드 선택 (/api/courses, /api/events)
+
+  limit  : 한 페이지 항목 수 (1 ~ MAX_LIMIT)
+  cursor : 이전 응답의 next_cursor (마지막 항목 ID 를 담은 불투명 문자열)
+  fields : 응답에 담을 필드 (쉼표 구분, 생략하면 전체). id / course_id 는 항상 포함
+
+페이지는 ID 오름차순 keyset 방식이라 페이지 사이에 항목이 추가/삭제되어도 앞 페이지가 밀리지 않습니다.
+저장소는 query_courses / query_entries 로 요청한 범위와 필드만 만듭니다.
+  - Cosmos     : SELECT c.id, c.<필드> ... WHERE c.id > @after ORDER BY c.id OFFSET 0 LIMIT n
+  - 로컬 / 캐시 : 메모리 모델에서 요청한 키만 dict 로 (일정은 데이터 버전별 ID 정렬 색인 + bisect)
+"""
+import json
+import heapq
+import base64
+import binascii
+from bisect import bisect_right
+from operator import attrgetter, itemgetter
+
+from models import ENTRY_FIELDS
+
+COURSE_LIST_FIELDS = ('name', 'color', 'file_name', 'uploaded_at', 'default_start_time', 'entry_count', 'etag')
+ENTRY_LIST_FIELDS = ENTRY_FIELDS + ('etag',)
+MAX_LIMIT = 1000
+
+_by_id = attrgetter('id')
+_entry_index_cache = (None, None)  # (과정 리스트, (ID 리스트, (course_id, 일정) 리스트))
+
+
+def requested(args):
+    """페이지/필드 파라미터가 하나라도 있으면 True (없으면 기존 전체 응답)"""
+    return any(key in args for key in ('limit', 'cursor', 'fields'))
+
+
+def parse_fields(raw, allowed):
+    """'date,class_name' → 필드 튜플 (생략하면 allowed 전체)"""
+    if not raw:
+        return allowed
+    fields = []
+    for name in raw.split(','):
+        name = name.strip()
+        if not name or name in ('id', 'course_id') or name in fields:
+            continue
+        if name not in allowed:
+            raise ValueError(f"알 수 없는 필드입니다: {name} (가능: {', '.join(allowed)})")
+        fields.append(name)
+    return tuple(fields)
+
+
+def parse_limit(raw):
+    if raw is None or raw == '':
+        return None
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValueError("limit 은 정수여야 합니다.")
+    return min(max(limit, 1), MAX_LIMIT)
+
+
+def encode_cursor(kind, last_id):
+    raw = json.dumps([kind, last_id], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(kind, cursor):
+    """next_cursor → 마지막 항목 ID (없으면 None)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_kind, last_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("cursor 가 올바르지 않습니다.")
+    if cursor_kind != kind or not isinstance(last_id, str):
+        raise ValueError("cursor 가 올바르지 않습니다.")
+    return last_id
+
+
+def paginate(kind, records, limit):
+    """limit + 1 개까지 조회한 레코드 → (이번 페이지, next_cursor)"""
+    if limit is None or len(records) <= limit:
+        return records, None
+    records = records[:limit]
+    return records, encode_cursor(kind, records[-1]["id"])
+
+
+def merge(pages, limit=None):
+    """ID 순으로 정렬된 여러 레코드 리스트 (저장소 + 보관소) → ID 순 리스트 하나 (limit 개까지)"""
+    merged = list(heapq.merge(*pages, key=itemgetter('id')))
+    return merged if limit is None else merged[:limit]
+
+
+# ---- 메모리 모델 → 레코드 (로컬 / 캐시 저장소) ----
+
+def course_record(course, fields):
+    record = {"id": course.id}
+    for name in fields:
+        record[name] = course.get_etag() if name == 'etag' else getattr(course, name)
+    return record
+
+
+def entry_record(course_id, entry, fields):
+    record = {"id": entry.id, "course_id": course_id}
+    for name in fields:
+        record[name] = entry.get_etag() if name == 'etag' else getattr(entry, name)
+    return record
+
+
+def doc_record(doc, fields, course_id=False):
+    """Cosmos 프로젝션 결과 문서 → 레코드 (_etag → etag)"""
+    record = {"id": doc['id']}
+    if course_id:
+        record["course_id"] = doc.get('course_id')
+    for name in fields:
+        record[name] = doc.get('_etag' if name == 'etag' else name)
+    return record
+
+
+def page_courses(courses, fields=COURSE_LIST_FIELDS, limit=None, after=None):
+    """Course 리스트 → ID 순 after 이후 limit 개 과정 레코드 (일정은 읽지 않음)"""
+    ordered = sorted(courses, key=_by_id)
+    start = bisect_right(ordered, after, key=_by_id) if after is not None else 0
+    stop = None if limit is None else start + limit
+    return [course_record(c, fields) for c in ordered[start:stop]]
+
+
+def _build_entry_index(courses):
+    items = sorted(((e.id, c.id, e) for c in courses for e in c.entries), key=lambda item: item[0])
+    return [item[0] for item in items], [(cid, e) for _, cid, e in items]
+
+
+def _entry_index(courses):
+    """과정 리스트 → 전체 일정 ID 정렬 색인 (같은 리스트 객체 = 같은 데이터 버전이면 재사용)"""
+    global _entry_index_cache
+    cached_courses, index = _entry_index_cache
+    if cached_courses is courses:
+        return index
+    index = _build_entry_index(courses)
+    _entry_index_cache = (courses, index)
+    return index
+
+
+def page_entries(courses, course_id=None, fields=ENTRY_LIST_FIELDS, limit=None, after=None, cache_index=True):
+    """Course 리스트 → ID 순 after 이후 limit 개 일정 레코드 (course_id 가 있으면 그 과정만)
+
+    cache_index=False 는 저장소 색인 캐시를 밀어내지 않도록 색인을 이번 호출에만 씁니다 (보관소 조회).
+    """
+    if course_id is not None:
+        entries = []
+        for course in courses:
+            if course.id == course_id:
+                entries = [(course_id, e) for e in sorted(course.entries, key=_by_id)]
+                break
+        ids = [e.id for _, e in entries]
+    else:
+        ids, entries = _entry_index(courses) if cache_index else _build_entry_index(courses)
+    start = bisect_right(ids, after) if after is not None else 0
+    stop = None if limit is None else start + limit
+    return [entry_record(cid, e, fields) for cid, e in entries[start:stop]]
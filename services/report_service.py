@@ -0,0 +1,313 @@
+"""
+과정 횡단 리포트 서비스 (NumPy 벡터 연산)
+
+저장소 데이터 버전마다 한 번만 컬럼 배열을 만들고, 리포트 요청은 그룹 집계만 수행합니다.
+  엔트리 컬럼  : day(날짜 ordinal), hours, course_idx, is_holiday
+  강사 링크 컬럼: entry_row, instructor_idx (복수 강사 엔트리는 강사 수만큼 행)
+
+리포트 종류:
+  instructor-hours : 강사별 수업시간/수업 수 (기본 group_by=month)
+  utilization      : 강의실-일 가동률 = 수업이 있는 과정-일 / 과정 기간 내 평일 수 (기본 month)
+  holiday-density  : 휴일 수 / 전체 일정 대비 비율 (기본 quarter)
+"""
+from datetime import date
+
+import numpy as np
+
+from models import date_to_ordinal, ordinal_to_date
+from services.derived_index import DerivedIndex, get_index
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+PERIODS = ('day', 'week', 'month', 'quarter', 'year')
+
+
+class ReportColumns:
+    """과정 리스트 → 리포트용 컬럼 배열"""
+
+    def __init__(self, courses):
+        days, hours, course_idx, holiday = [], [], [], []
+        link_entry, link_instructor = [], []
+        instructor_ids = {}
+        self.course_ids = []
+        self.course_names = []
+
+        row = 0
+        for ci, course in enumerate(courses):
+            self.course_ids.append(course.id)
+            self.course_names.append(course.name)
+            for e in course.entries:
+                days.append(e.day)
+                hours.append(e.hours)
+                course_idx.append(ci)
+                holiday.append(e.is_holiday)
+                if e.instructor and not e.is_holiday:
+                    for name in e.instructor.split(','):
+                        name = name.strip()
+                        if name:
+                            link_entry.append(row)
+                            link_instructor.append(instructor_ids.setdefault(name, len(instructor_ids)))
+                row += 1
+
+        self.day = np.array(days, dtype=np.int64)
+        self.hours = np.array(hours, dtype=np.float64)
+        self.course_idx = np.array(course_idx, dtype=np.int64)
+        self.is_holiday = np.array(holiday, dtype=bool)
+        self.link_entry = np.array(link_entry, dtype=np.int64)
+        self.link_instructor = np.array(link_instructor, dtype=np.int64)
+        self.instructors = list(instructor_ids)
+
+    def __len__(self):
+        return len(self.day)
+
+
+# ===== 기간 키 =====
+
+def _to_datetime64(days):
+    return (days - _EPOCH).astype('datetime64[D]')
+
+
+def _period_keys(days, period):
+    """날짜 ordinal 배열 → 기간 정수 키 배열"""
+    if period == 'day':
+        return days
+    if period == 'week':
+        return days - (days - 1) % 7  # 해당 주 월요일 ordinal
+    months = _to_datetime64(days).astype('datetime64[M]').astype(np.int64)
+    if period == 'month':
+        return months
+    if period == 'quarter':
+        return months // 3
+    return _to_datetime64(days).astype('datetime64[Y]').astype(np.int64)
+
+
+def _period_label(period, key):
+    key = int(key)
+    if period in ('day', 'week'):
+        return ordinal_to_date(key)
+    if period == 'month':
+        return f"{1970 + key // 12}-{key % 12 + 1:02d}"
+    if period == 'quarter':
+        return f"{1970 + key // 4}-Q{key % 4 + 1}"
+    return str(1970 + key)
+
+
+def _period_bounds(period, keys):
+    """기간 키 배열 → (시작 ordinal, 끝 ordinal(미포함)) 배열"""
+    keys = np.asarray(keys, dtype=np.int64)
+    if period == 'day':
+        return keys, keys + 1
+    if period == 'week':
+        return keys, keys + 7
+    if period == 'year':
+        starts = keys.astype('datetime64[Y]')
+        ends = (keys + 1).astype('datetime64[Y]')
+    else:
+        months = keys * 3 if period == 'quarter' else keys
+        step = 3 if period == 'quarter' else 1
+        starts = months.astype('datetime64[M]')
+        ends = (months + step).astype('datetime64[M]')
+    to_ord = lambda a: a.astype('datetime64[D]').astype(np.int64) + _EPOCH
+    return to_ord(starts), to_ord(ends)
+
+
+# ===== 그룹 집계 =====
+
+def _group(keys, weights=None):
+    """정수 키 배열들로 그룹핑 → (그룹별 키 배열 리스트, 개수, 가중합)"""
+    if not len(keys[0]):
+        empty = np.array([], dtype=np.int64)
+        return [empty for _ in keys], empty, np.array([], dtype=np.float64)
+    offsets = [int(k.min()) for k in keys]
+    sizes = [int(k.max()) - off + 1 for k, off in zip(keys, offsets)]
+
+    combined = np.zeros(len(keys[0]), dtype=np.int64)
+    for k, off, size in zip(keys, offsets, sizes):
+        combined = combined * size + (k - off)
+    uniq, inverse = np.unique(combined, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(uniq))
+    sums = np.bincount(inverse, weights=weights, minlength=len(uniq)) if weights is not None else None
+
+    decoded, rest = [], uniq
+    for off, size in reversed(list(zip(offsets, sizes))):
+        decoded.append(rest % size + off)
+        rest = rest // size
+    decoded.reverse()
+    return decoded, counts, sums
+
+
+def _group_keys(cols, rows, group_by):
+    """엔트리 행 인덱스 → group_by 키 배열"""
+    if group_by == 'course':
+        return cols.course_idx[rows]
+    if group_by == 'total':
+        return np.zeros(len(rows), dtype=np.int64)
+    return _period_keys(cols.day[rows], group_by)
+
+
+def _group_label(cols, group_by, key):
+    if group_by == 'course':
+        return cols.course_names[int(key)]
+    if group_by == 'total':
+        return 'total'
+    return _period_label(group_by, key)
+
+
+def _group_row(cols, group_by, key):
+    row = {group_by: _group_label(cols, group_by, key)}
+    if group_by == 'course':
+        row["course_id"] = cols.course_ids[int(key)]
+    return row
+
+
+# ===== 리포트 =====
+
+def instructor_hours(cols, in_range, group_by):
+    """강사별 수업시간 (휴일 제외, 복수 강사는 각 강사에게 시간 전체를 집계)"""
+    rows = cols.link_entry[in_range[cols.link_entry]]
+    instructors = cols.link_instructor[in_range[cols.link_entry]]
+    (inst_keys, group_keys), counts, hours = _group(
+        [instructors, _group_keys(cols, rows, group_by)], weights=cols.hours[rows]
+    )
+    result = []
+    for inst, key, n, h in zip(inst_keys, group_keys, counts, hours):
+        row = {"instructor": cols.instructors[int(inst)]}
+        row.update(_group_row(cols, group_by, key))
+        row.update({"hours": float(h), "classes": int(n)})
+        result.append(row)
+    result.sort(key=lambda r: (r["instructor"], str(r[group_by])))
+    return result
+
+
+def utilization(cols, in_range, group_by, start, end):
+    """강의실-일 가동률: 수업이 있는 (과정, 날짜) 수 / 과정 기간(첫~마지막 일정) 내 평일 수"""
+    n_courses = len(cols.course_ids)
+    if not len(cols) or not n_courses:
+        return []
+
+    # 과정별 기간 (전체 일정 기준) ∩ 조회 범위
+    span_start = np.full(n_courses, np.iinfo(np.int64).max)
+    span_end = np.full(n_courses, np.iinfo(np.int64).min)
+    np.minimum.at(span_start, cols.course_idx, cols.day)
+    np.maximum.at(span_end, cols.course_idx, cols.day)
+    active = span_start <= span_end
+    span_start = np.maximum(span_start, start)
+    span_end = np.minimum(span_end, end)
+    active &= span_start <= span_end
+
+    # 수업이 있는 과정-일 (같은 날 여러 일정은 1일)
+    class_rows = np.flatnonzero(in_range & ~cols.is_holiday)
+    (pair_course, pair_day), _, _ = _group([cols.course_idx[class_rows], cols.day[class_rows]])
+
+    if group_by in ('course', 'total'):
+        group_of_course = np.arange(n_courses) if group_by == 'course' else np.zeros(n_courses, np.int64)
+        capacity = np.where(active, np.busday_count(
+            _to_datetime64(np.where(active, span_start, 0)),
+            _to_datetime64(np.where(active, span_end + 1, 0)),
+        ), 0)
+        n_groups = n_courses if group_by == 'course' else 1
+        cap_by_group = np.bincount(group_of_course, weights=capacity, minlength=n_groups)
+        days_by_group = np.bincount(group_of_course[pair_course], minlength=n_groups)
+        active_by_group = np.bincount(group_of_course, weights=active, minlength=n_groups)
+        group_keys = np.arange(n_groups)
+    else:
+        if not active.any():
+            return []
+        first = _period_keys(np.array([span_start[active].min()]), group_by)[0]
+        last = _period_keys(np.array([span_end[active].max()]), group_by)[0]
+        step = 7 if group_by == 'week' else 1
+        group_keys = np.arange(first, last + 1, step, dtype=np.int64)
+        p_start, p_end = _period_bounds(group_by, group_keys)
+
+        # 과정 × 기간 행렬로 평일 수 계산
+        s = np.maximum(span_start[active][:, None], p_start[None, :])
+        e = np.minimum(span_end[active][:, None] + 1, p_end[None, :])
+        valid = s < e
+        capacity = np.where(valid, np.busday_count(
+            _to_datetime64(np.where(valid, s, 0)), _to_datetime64(np.where(valid, e, 0))
+        ), 0)
+        cap_by_group = capacity.sum(axis=0)
+        active_by_group = (capacity > 0).sum(axis=0)
+        idx = np.searchsorted(group_keys, _period_keys(pair_day, group_by))
+        days_by_group = np.bincount(idx, minlength=len(group_keys))
+
+    result = []
+    for key, cap, used, n_active in zip(group_keys, cap_by_group, days_by_group, active_by_group):
+        if not cap and not used:
+            continue
+        row = _group_row(cols, group_by, key)
+        row.update({
+            "class_days": int(used),
+            "capacity_days": int(cap),
+            "utilization": round(float(used) / float(cap), 4) if cap else None,
+            "active_courses": int(n_active),
+        })
+        result.append(row)
+    return result
+
+
+def holiday_density(cols, in_range, group_by):
+    """기간별 휴일 일정 수, 휴일 날짜 수, 전체 일정 대비 비율"""
+    rows = np.flatnonzero(in_range)
+    (group_keys,), totals, holidays = _group(
+        [_group_keys(cols, rows, group_by)], weights=cols.is_holiday[rows].astype(np.float64)
+    )
+    holiday_rows = rows[cols.is_holiday[rows]]
+    (h_keys, _), _, _ = _group([_group_keys(cols, holiday_rows, group_by), cols.day[holiday_rows]])
+    distinct_days = dict(zip(*np.unique(h_keys, return_counts=True)))
+
+    result = []
+    for key, total, n_holiday in zip(group_keys, totals, holidays):
+        row = _group_row(cols, group_by, key)
+        row.update({
+            "holiday_entries": int(n_holiday),
+            "holiday_dates": int(distinct_days.get(key, 0)),
+            "total_entries": int(total),
+            "density": round(float(n_holiday) / float(total), 4) if total else 0.0,
+        })
+        result.append(row)
+    return result
+
+
+# kind → (함수, 기본 group_by, 허용 group_by)
+REPORTS = {
+    'instructor-hours': (instructor_hours, 'month', PERIODS + ('course', 'total')),
+    'utilization': (utilization, 'month', PERIODS + ('course', 'total')),
+    'holiday-density': (holiday_density, 'quarter', PERIODS + ('course', 'total')),
+}
+
+
+class ReportIndex(DerivedIndex):
+    """데이터 버전별 컬럼 배열 (변경 시 다음 조회에서 재구성)"""
+
+    columns = None
+
+    def _rebuild(self, courses):
+        self.columns = ReportColumns(courses)
+
+
+def run_report(storage, kind, start=None, end=None, group_by=None):
+    """리포트 실행"""
+    if kind not in REPORTS:
+        raise ValueError(f"알 수 없는 리포트 종류입니다: {kind}")
+    fn, default_group, allowed = REPORTS[kind]
+    group_by = group_by or default_group
+    if group_by not in allowed:
+        raise ValueError(f"group_by 는 {', '.join(allowed)} 중 하나여야 합니다.")
+    try:
+        start_ord = date_to_ordinal(start) if start else date.min.toordinal()
+        end_ord = date_to_ordinal(end) if end else date.max.toordinal()
+    except ValueError:
+        raise ValueError("날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+    if start_ord > end_ord:
+        raise ValueError("시작일이 종료일보다 늦습니다.")
+
+    index = get_index(ReportIndex, storage)
+    index.ensure_current()
+    cols = index.columns
+    in_range = (cols.day >= start_ord) & (cols.day <= end_ord)
+    if kind == 'utilization':
+        rows = fn(cols, in_range, group_by, start_ord, end_ord)
+    else:
+        rows = fn(cols, in_range, group_by)
+    return {"kind": kind, "group_by": group_by, "start": start, "end": end, "rows": rows}
@@ -0,0 +1,183 @@
+"""
+휴일 반영 일정 자동 조정 (/api/reschedule)
+
+새 휴일(예: 대체휴일)이 지정되면 그 날짜(범위)에 있는 수업을 과정별로 옮깁니다.
+
+정책:
+  next_free : 막힌 날의 수업만 그 과정의 다음 빈 평일로 이동
+  shift     : 막힌 날 이후의 수업 순서를 유지한 채 한 칸씩 뒤로 밀기
+              (과정의 기존 수업일을 그대로 쓰고, 모자라는 날만 마지막 수업 뒤 빈 평일로 추가)
+
+빈 평일 찾기는 과정마다 FreeDayIndex (점유일 → 다음 후보, 경로 압축) 로 합니다.
+같은 날의 일정(오전/오후 등)은 함께 옮기고, 휴일 일정은 옮기지 않습니다.
+
+plan() 은 변경 목록(미리보기)을 만들고, apply() 는 과정마다 bulk_update_entries 한 번으로 씁니다.
+미리보기의 plan_id 를 apply 에 넘기면 그 사이 데이터가 바뀐 경우 적용하지 않습니다.
+"""
+import logging
+
+from models import content_etag, date_to_ordinal, ordinal_to_date
+from services.cosmos_service import PreconditionFailedError
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ('next_free', 'shift')
+MAX_RANGE_DAYS = 31
+
+
+def _weekday(day):
+    """ordinal → 요일 (월=0, date.fromordinal(day).weekday() 와 같음)"""
+    return (day - 1) % 7
+
+
+class FreeDayIndex:
+    """과정 하나의 수업 가능한 평일 찾기
+
+    점유된 날(수업·휴일·막힌 날)만 {날: 다음 후보} 로 기록하고, find() 가 지나간 경로를
+    찾은 날로 압축하므로 같은 구간을 여러 번 찾아도 거의 상수 시간입니다.
+    """
+
+    def __init__(self, taken=()):
+        self._next = {day: day + 1 for day in taken}
+
+    def find(self, day):
+        """day 이후(포함) 첫 빈 평일"""
+        path = []
+        while True:
+            weekday = _weekday(day)
+            if weekday >= 5:
+                day += 7 - weekday  # 주말 → 다음 월요일
+                continue
+            nxt = self._next.get(day)
+            if nxt is None:
+                break
+            path.append(day)
+            day = nxt
+        for taken in path:
+            self._next[taken] = day
+        return day
+
+    def take(self, day):
+        self._next[day] = day + 1
+
+
+def parse_range(start, end=None):
+    """'YYYY-MM-DD' (~ 'YYYY-MM-DD') → (시작 ordinal, 끝 ordinal)"""
+    try:
+        first = date_to_ordinal(start)
+        last = date_to_ordinal(end) if end else first
+    except (TypeError, ValueError):
+        raise ValueError("날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+    if last < first:
+        raise ValueError("종료일은 시작일 이후여야 합니다.")
+    if last - first >= MAX_RANGE_DAYS:
+        raise ValueError(f"한 번에 최대 {MAX_RANGE_DAYS}일까지 조정할 수 있습니다.")
+    return first, last
+
+
+def _class_days(course):
+    """수업(휴일 제외) 날짜 → 그날의 일정 리스트"""
+    by_day = {}
+    for entry in course.entries:
+        if not entry.is_holiday:
+            by_day.setdefault(entry.day, []).append(entry)
+    return by_day
+
+
+def _plan_course(course, first, last, policy):
+    """과정 하나 → {기존 날: 새 날} (옮길 것이 없으면 빈 dict)"""
+    by_day = _class_days(course)
+    blocked = [day for day in by_day if first <= day <= last]
+    if not blocked:
+        return {}
+
+    index = FreeDayIndex({e.day for e in course.entries})
+    for day in range(first, last + 1):
+        index.take(day)
+
+    if policy == 'next_free':
+        moves = {}
+        for day in sorted(blocked):
+            new_day = index.find(day)
+            index.take(new_day)
+            moves[day] = new_day
+        return moves
+
+    # shift: 시작일 이후 수업일을 순서대로, 막히지 않은 기존 수업일 + 마지막 이후 빈 평일에 배치
+    remaining = sorted(day for day in by_day if day >= first)
+    slots = [day for day in remaining if not first <= day <= last]
+    cursor = remaining[-1] + 1
+    while len(slots) < len(remaining):
+        day = index.find(cursor)
+        index.take(day)
+        slots.append(day)
+        cursor = day + 1
+    return {old: new for old, new in zip(remaining, slots) if old != new}
+
+
+def plan(courses, start, end=None, course_ids=None, policy='next_free'):
+    """일정 조정 미리보기 → {"start", "end", "policy", "plan_id", "courses": [...], "total_moves"}
+
+    courses 의 일정은 바꾸지 않습니다. course_ids 가 None 이면 전체 과정.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"policy 는 {', '.join(POLICIES)} 중 하나여야 합니다.")
+    first, last = parse_range(start, end)
+    if course_ids is not None:
+        wanted = set(course_ids)
+        courses = [c for c in courses if c.id in wanted]
+
+    result, fingerprint = [], []
+    for course in courses:
+        day_moves = _plan_course(course, first, last, policy)
+        if not day_moves:
+            continue
+        moves = []
+        for entry in sorted(course.entries, key=lambda e: (e.day, e.id)):
+            new_day = day_moves.get(entry.day)
+            if new_day is None or entry.is_holiday:
+                continue
+            moves.append({
+                "entry_id": entry.id,
+                "class_name": entry.class_name,
+                "from": entry.date,
+                "to": ordinal_to_date(new_day),
+                "etag": entry.get_etag(),
+            })
+            fingerprint.extend((course.id, entry.id, entry.get_etag(), new_day))
+        result.append({"course_id": course.id, "course_name": course.name, "moves": moves})
+
+    return {
+        "start": ordinal_to_date(first),
+        "end": ordinal_to_date(last),
+        "policy": policy,
+        "plan_id": content_etag(fingerprint).strip('"'),
+        "courses": result,
+        "total_moves": sum(len(c["moves"]) for c in result),
+    }
+
+
+def apply(storage, preview):
+    """미리보기를 저장소에 반영 (과정마다 한 번의 일괄 쓰기) → 과정별 status 가 채워진 preview
+
+    각 일정은 미리보기 시점의 ETag 로 조건부 수정하므로, 그 사이 바뀐 과정은 conflict 로 남습니다.
+    """
+    for course in preview["courses"]:
+        updates = {m["entry_id"]: {"date": m["to"]} for m in course["moves"]}
+        if_match = {m["entry_id"]: m["etag"] for m in course["moves"]}
+        try:
+            etags = storage.bulk_update_entries(course["course_id"], updates, if_match)
+        except PreconditionFailedError:
+            course["status"] = "conflict"
+            continue
+        if etags is False:
+            course["status"] = "not_found"
+            continue
+        course["status"] = "applied"
+        for move in course["moves"]:
+            if move["entry_id"] in etags:
+                move["etag"] = etags[move["entry_id"]]
+    applied = sum(1 for c in preview["courses"] if c["status"] == "applied")
+    logger.info("일정 자동 조정: %s ~ %s (%s), 과정 %s/%s개 반영",
+                preview["start"], preview["end"], preview["policy"], applied, len(preview["courses"]))
+    return preview
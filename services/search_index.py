@@ -0,0 +1,314 @@
+"""
+수업 일정 전문 검색 (문자 bigram 역색인)
+
+한국어는 띄어쓰기·조사 때문에 단어 단위 색인이 잘 맞지 않아 문자 n-gram 을 씁니다.
+  - 색인 대상: 수업명, 강사 (일정 단위) / 과정명 (과정 단위)
+  - 단어마다 1-gram + 2-gram 을 색인 → 한 글자 검색어도 지원
+  - 후보는 검색어 n-gram 포스팅 교집합, 최종 일치는 부분 문자열로 확인
+
+저장소 변경 알림으로 증분 갱신됩니다 (DerivedIndex).
+"""
+import re
+from collections import Counter, OrderedDict, defaultdict
+
+from services.derived_index import DerivedIndex, get_index
+
+MAX_QUERY_LENGTH = 100
+MAX_TERMS = 8
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 200
+RESULT_CACHE_SIZE = 128
+MAX_SCORE = 3 * MAX_TERMS + 2
+
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text):
+    return _SPACE_RE.sub(' ', text or '').strip().lower()
+
+
+def _grams(text):
+    """정규화된 텍스트 → 단어별 1/2-gram 집합"""
+    grams = set()
+    for word in text.split(' '):
+        grams.update(word)
+        grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _term_grams(term):
+    if len(term) == 1:
+        return {term}
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+class _Doc:
+    __slots__ = ('entry', 'class_name', 'instructor', 'text', 'order')
+
+    def __init__(self, course_id, entry):
+        self.entry = entry
+        self.class_name = normalize(entry.class_name)
+        self.instructor = normalize(entry.instructor.replace(',', ' '))
+        self.text = (entry.class_name, entry.instructor, entry.is_holiday)  # 점수 memo 키
+        self.order = 0                                                       # 동점 정렬 순서 (_order_of)
+
+
+class _CourseDoc:
+    __slots__ = ('course', 'name', 'keys', 'seq')
+
+    def __init__(self, course, seq):
+        self.course = course
+        self.name = normalize(course.name)
+        self.keys = set()  # 과정에 속한 일정 key
+        self.seq = seq     # 과정 순번 (정렬 키용)
+
+
+def _order_of(entry, course_seq):
+    """(날짜, 시작 시각, 과정 순번) → 단일 정수 정렬 키 (튜플 비교보다 빠름)"""
+    try:
+        h, m = entry.start_time.split(':')
+        minutes = int(h) * 60 + int(m)
+    except ValueError:
+        minutes = 0
+    return ((entry.day * 1440 + minutes) << 24) | (course_seq & 0xFFFFFF)
+
+
+class SearchIndex(DerivedIndex):
+    """수업명/강사/과정명 n-gram 역색인"""
+
+    def __init__(self, storage):
+        self._docs = {}                      # (course_id, entry_id) → _Doc
+        self._postings = defaultdict(set)    # gram → 일정 key 집합
+        self._courses = {}                   # course_id → _CourseDoc
+        self._course_postings = defaultdict(set)  # gram → course_id 집합
+        self._results = OrderedDict()        # (검색어, course_id) → 순위 (데이터 변경 시 비움)
+        self._course_seq = 0
+        super().__init__(storage)
+
+    # ---- 색인 유지 ----
+
+    @staticmethod
+    def _key(course_id, entry):
+        return (course_id, entry.id or f"@{entry.day}:{entry.class_name}")
+
+    def _add_entry(self, course_id, entry):
+        key = self._key(course_id, entry)
+        doc = self._docs[key] = _Doc(course_id, entry)
+        for gram in _grams(doc.class_name) | _grams(doc.instructor):
+            self._postings[gram].add(key)
+        course_doc = self._courses.get(course_id)
+        if course_doc is not None:
+            course_doc.keys.add(key)
+            doc.order = _order_of(entry, course_doc.seq)
+
+    def _remove_entry(self, course_id, entry):
+        key = self._key(course_id, entry)
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for gram in _grams(doc.class_name) | _grams(doc.instructor):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+        course_doc = self._courses.get(course_id)
+        if course_doc is not None:
+            course_doc.keys.discard(key)
+
+    def _set_course(self, course):
+        old = self._courses.get(course.id)
+        if old is not None:
+            for gram in _grams(old.name):
+                ids = self._course_postings.get(gram)
+                if ids is not None:
+                    ids.discard(course.id)
+                    if not ids:
+                        del self._course_postings[gram]
+        if old is None:
+            self._course_seq += 1
+        doc = self._courses[course.id] = _CourseDoc(course, old.seq if old else self._course_seq)
+        if old is not None:
+            doc.keys = old.keys
+        for gram in _grams(doc.name):
+            self._course_postings[gram].add(course.id)
+
+    def _drop_course(self, course_id):
+        doc = self._courses.pop(course_id, None)
+        if doc is None:
+            return
+        for gram in _grams(doc.name):
+            ids = self._course_postings.get(gram)
+            if ids is not None:
+                ids.discard(course_id)
+                if not ids:
+                    del self._course_postings[gram]
+
+    def _rebuild(self, courses):
+        self._results.clear()
+        self._course_seq = 0
+        self._docs = {}
+        self._postings = defaultdict(set)
+        self._courses = {}
+        self._course_postings = defaultdict(set)
+        for course in courses:
+            self._set_course(course)
+            for entry in course.entries:
+                self._add_entry(course.id, entry)
+
+    def _apply(self, change):
+        self._results.clear()
+        if change.course is not None:
+            self._set_course(change.course)
+        for entry in change.removed:
+            self._remove_entry(change.course_id, entry)
+        if change.course is None:
+            self._drop_course(change.course_id)
+        for entry in change.added:
+            self._add_entry(change.course_id, entry)
+
+    # ---- 검색 ----
+
+    def _candidates(self, term):
+        """검색어 하나에 대한 후보 일정 key 집합 (n-gram 교집합)"""
+        grams = sorted(_term_grams(term), key=lambda g: len(self._postings.get(g, ())))
+        entry_keys = None
+        for gram in grams:
+            keys = self._postings.get(gram)
+            if not keys:
+                entry_keys = set()
+                break
+            entry_keys = keys if entry_keys is None else entry_keys & keys
+            if not entry_keys:
+                break
+
+        course_ids = None
+        for gram in grams:
+            ids = self._course_postings.get(gram, set())
+            course_ids = set(ids) if course_ids is None else course_ids & ids
+            if not course_ids:
+                break
+
+        if not course_ids:
+            return entry_keys or set()
+        result = set(entry_keys) if entry_keys else set()
+        for course_id in course_ids:
+            result.update(self._courses[course_id].keys)
+        return result
+
+    @staticmethod
+    def _text_score(doc, terms, phrase):
+        """수업명/강사 일치 점수 (수업명 > 강사) → (점수, 일치하지 않은 검색어 튜플)"""
+        score, missing = 0, []
+        for term in terms:
+            if term in doc.class_name:
+                score += 3 if doc.class_name.startswith(term) else 2
+            elif term in doc.instructor.split(' '):
+                score += 3
+            elif term in doc.instructor:
+                score += 2
+            else:
+                missing.append(term)
+        if len(terms) > 1 and phrase in doc.class_name:
+            score += 2
+        if doc.entry.is_holiday:
+            score -= 1
+        return score, tuple(missing)
+
+    def _rank(self, candidates, terms, phrase, course_id):
+        """후보 → (정렬된 (정렬 키, key) 리스트, 과정별 건수)
+
+        정렬 키 = 점수 내림차순 → 날짜 → 시작 시각 → 과정 순번을 정수 하나로 합친 값
+        나머지 검색어는 과정명 일치(+1)로 채워야 하며, 하나라도 없으면 제외합니다.
+        """
+        hits = []
+        docs, courses = self._docs, self._courses
+        text_scores = {}    # 같은 (수업명, 강사, 휴일) 조합은 점수도 같음
+        course_scores = {}  # (남은 검색어, 과정) → 과정명 점수 (불일치 None)
+        for key in candidates:
+            cid = key[0]
+            if course_id and cid != course_id:
+                continue
+            doc = docs[key]
+            scored = text_scores.get(doc.text)
+            if scored is None:
+                scored = text_scores[doc.text] = self._text_score(doc, terms, phrase)
+            score, missing = scored
+            if missing:
+                extra = course_scores.get((missing, cid), 0)
+                if extra == 0:
+                    name = courses[cid].name
+                    extra = course_scores[(missing, cid)] = (
+                        len(missing) if all(term in name for term in missing) else None
+                    )
+                if extra is None:
+                    continue
+                score += extra
+            hits.append(((MAX_SCORE - max(score, 1)) << 64 | doc.order, key))
+        hits.sort()
+
+        per_course = Counter(hit[1][0] for hit in hits)
+        facets = [
+            {"course_id": cid, "course_name": courses[cid].course.name,
+             "color": courses[cid].course.color, "count": count}
+            for cid, count in per_course.most_common()
+        ]
+        return hits, facets
+
+    def search(self, q, page=1, per_page=DEFAULT_PER_PAGE, course_id=None):
+        """검색 → {"total", "page", "per_page", "results", "courses"}"""
+        phrase = normalize(q)
+        if not phrase:
+            raise ValueError("검색어를 입력해주세요.")
+        if len(phrase) > MAX_QUERY_LENGTH:
+            raise ValueError(f"검색어는 최대 {MAX_QUERY_LENGTH}자입니다.")
+        terms = list(dict.fromkeys(phrase.split(' ')))[:MAX_TERMS]
+        page = max(int(page or 1), 1)
+        per_page = min(max(int(per_page or DEFAULT_PER_PAGE), 1), MAX_PER_PAGE)
+
+        self.ensure_current()
+        with self._lock:
+            cache_key = (phrase, course_id or None)
+            candidates = None
+            if cache_key not in self._results:
+                for term in sorted(terms, key=len, reverse=True):  # 긴 검색어가 보통 더 선택적
+                    keys = self._candidates(term)
+                    candidates = keys if candidates is None else candidates & keys
+                    if not candidates:
+                        break
+
+            ranked = self._results.get(cache_key)
+            if ranked is None:
+                ranked = self._rank(candidates or (), terms, phrase, course_id)
+                self._results[cache_key] = ranked
+                if len(self._results) > RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+            else:
+                self._results.move_to_end(cache_key)
+            hits, courses = ranked
+            page_hits = [
+                (MAX_SCORE - (sort_key >> 64), self._docs[key], self._courses[key[0]].course)
+                for sort_key, key in hits[(page - 1) * per_page: page * per_page]
+            ]
+
+        results = []
+        for score, doc, course in page_hits:
+            result = doc.entry.to_dict()
+            result.update({
+                "course_id": course.id,
+                "course_name": course.name,
+                "color": course.color,
+                "score": score,
+            })
+            results.append(result)
+        return {
+            "total": len(hits),
+            "page": page,
+            "per_page": per_page,
+            "results": results,
+            "courses": courses,
+        }
+
+
+def get_search_index(storage):
+    return get_index(SearchIndex, storage)
@@ -0,0 +1,194 @@
+"""
+과정별 파일로 나눈 로컬 저장소 (LOCAL_STORAGE_FORMAT=sharded)
+
+courses.json 하나에 모든 과정을 두면 일정 하나를 고쳐도 파일 전체를 다시 쓰고,
+읽을 때도 모든 과정을 읽어야 합니다. 샤드 형식은
+  data/courses/index.json        : 과정 메타데이터 + 과정별 샤드 revision (작은 파일)
+  data/courses/<course_id>.json  : 과정 하나의 일정
+으로 나누어
+  - 색인만 읽어 과정 목록을 만들고, 일정은 과정별로 처음 접근할 때 그 샤드만 읽으며 (LazyCourse)
+  - 쓰기는 바뀐 과정의 샤드와 색인만 다시 씁니다 (과정 정보만 수정하면 색인만).
+
+데이터 버전과 다른 프로세스의 쓰기 감지는 색인 파일 시그니처를 사용합니다 (모든 쓰기가 색인을 교체).
+색인을 다시 읽을 때 revision 이 같은 과정은 이미 읽은 일정을 재사용합니다.
+
+쓰기 순서는 샤드 → 색인 → (삭제된 과정의) 샤드 제거이므로 색인이 가리키는 샤드는 항상 존재합니다.
+일정은 처음 접근할 때 읽으므로, 오래된 색인으로 만든 과정은 그 사이 바뀐 최신 일정을 볼 수 있습니다.
+
+색인이 없으면 courses.json (없으면 courses.snap) 을 처음 한 번 변환합니다 (원본 파일은 그대로 둠).
+"""
+import os
+import re
+import json
+import uuid
+import hashlib
+import logging
+from contextlib import contextmanager
+
+from config import Config
+from models import LazyCourse, parse_entries
+from services.cosmos_service import LocalJsonStorage, StorageCorruptedError
+from services.locking import atomic_write
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = 'index.json'
+INDEX_VERSION = 1
+_SAFE_ID = re.compile(r'[A-Za-z0-9_\-]{1,100}')
+
+
+def _new_rev():
+    return uuid.uuid4().hex[:12]
+
+
+class ShardedJsonStorage(LocalJsonStorage):
+    """과정별 샤드 파일 + 메타데이터 색인 기반 로컬 저장소
+
+    동시성/캐시/변경 알림은 LocalJsonStorage 와 같고 (색인 파일이 그 역할의 '저장 파일'),
+    _load_courses / _commit 만 샤드 단위로 바꿉니다.
+    """
+
+    FORMATS = ('sharded',)
+
+    def __init__(self, filepath=None):
+        self.shard_dir = os.path.dirname(filepath or self._default_path())
+        # course_id → (샤드 revision, 그 revision 의 일정을 가진 Course 객체)
+        # 객체 identity 로 '이 과정의 일정이 샤드 파일과 같은지' 판단합니다.
+        self._shards = {}
+        self._invalid_entries = {}  # course_id → 샤드에서 날짜를 읽을 수 없었던 원본 일정 (다시 기록할 때 보존)
+        self._txn_courses = {}
+        super().__init__(filepath, fmt='sharded')
+        self._remove_unreferenced_shards()
+
+    def _default_path(self):
+        return os.path.join(Config.COURSES_SHARD_DIR, INDEX_NAME)
+
+    def _migrate(self):
+        """courses.json / courses.snap → Course 리스트 (모든 일정에 ID 부여)"""
+        from services.course_snapshot import json_to_courses, load
+        if os.path.exists(Config.COURSES_FILE):
+            source, courses = Config.COURSES_FILE, json_to_courses(self._load_json(Config.COURSES_FILE))
+        elif os.path.exists(Config.COURSES_SNAPSHOT_FILE):
+            source, courses = Config.COURSES_SNAPSHOT_FILE, load(Config.COURSES_SNAPSHOT_FILE)
+        else:
+            return []
+        logger.info("%s → 과정별 샤드 변환: 과정 %s개", os.path.basename(source), len(courses))
+        return courses
+
+    def _shard_path(self, course_id):
+        if course_id == 'index' or not _SAFE_ID.fullmatch(course_id):
+            course_id = 'h_' + hashlib.blake2b(course_id.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.shard_dir, f"{course_id}.json")
+
+    def _remove_unreferenced_shards(self):
+        """색인에 없는 샤드 파일 정리 (샤드 기록 후 색인 교체 전에 중단된 쓰기의 잔여물)"""
+        with self._write_transaction() as courses:
+            referenced = {os.path.basename(self._shard_path(c.id)) for c in courses}
+            for name in os.listdir(self.shard_dir):
+                if name.endswith('.json') and name != INDEX_NAME and name not in referenced:
+                    os.remove(os.path.join(self.shard_dir, name))
+                    logger.info("색인에 없는 샤드 삭제: %s", name)
+
+    # ---- 읽기 ----
+
+    def _load_courses(self):
+        """색인 → LazyCourse 리스트 (일정은 과정별로 처음 접근할 때 샤드에서 읽음)"""
+        try:
+            data = self._load_json(self.filepath)
+            if data.get('version') != INDEX_VERSION:
+                raise ValueError(f"지원하지 않는 색인 버전입니다: {data.get('version')}")
+        except FileNotFoundError:
+            return []
+        except ValueError as e:
+            logger.error("저장소 색인 손상: %s (%s)", self.filepath, e)
+            raise StorageCorruptedError(self.filepath) from e
+
+        known = self._shards
+        shards, courses = {}, []
+        for raw in data.get('courses', []):
+            course_id, rev = raw['id'], raw.get('shard')
+            previous = known.get(course_id)
+            if previous is not None and previous[0] == rev:
+                loader = lambda previous=previous[1]: previous.entries
+            else:
+                loader = lambda course_id=course_id, rev=rev: self._read_shard(course_id, rev)
+            course = LazyCourse(
+                id=course_id,
+                name=raw.get('name', ''),
+                color=raw.get('color') or '#4A90D9',
+                file_name=raw.get('file_name', ''),
+                uploaded_at=raw.get('uploaded_at', ''),
+                default_start_time=raw.get('default_start_time') or '09:00',
+                entry_count=raw.get('entry_count', 0),
+                loader=loader,
+            )
+            shards[course_id] = (rev, course)
+            courses.append(course)
+        self._shards = shards
+        return courses
+
+    def _read_shard(self, course_id, rev):
+        path = self._shard_path(course_id)
+        try:
+            data = self._load_json(path)
+        except FileNotFoundError:
+            # 오래된 색인으로 만든 과정이 그 사이 다른 요청/프로세스에서 삭제됨
+            logger.warning("샤드 파일 없음 (삭제된 과정): %s", course_id)
+            return []
+        except ValueError as e:
+            logger.error("샤드 파일 손상: %s (%s)", path, e)
+            raise StorageCorruptedError(path) from e
+        if data.get('rev') != rev:
+            logger.debug("샤드가 색인 이후 변경됨: %s (%s → %s)", course_id, rev, data.get('rev'))
+        entries, invalid = parse_entries(data.get('entries', []), course_id)
+        if invalid:
+            self._invalid_entries[course_id] = invalid
+        return entries
+
+    # ---- 쓰기 ----
+
+    @contextmanager
+    def _write_transaction(self):
+        with super()._write_transaction() as courses:
+            self._txn_courses = {c.id: c for c in courses}
+            yield courses
+
+    def _commit(self, courses, course_id=None, removed=None, added=None, course=None):
+        """바뀐 과정의 샤드 기록 → 색인 교체 (+ 캐시/알림) → 삭제된 과정의 샤드 제거"""
+        known, before = self._shards, self._txn_courses
+        metadata_only = course_id is not None and course is not None and not removed and not added
+        shards = {}
+        for c in courses:
+            # 트랜잭션 시작 시점의 객체 그대로이거나 (과정 정보만 수정) 이전 객체의 샤드를 그대로 씀
+            base = before.get(c.id)
+            if not (c is base or (metadata_only and c.id == course_id)):
+                base = None
+            previous = known.get(c.id)
+            if base is not None and previous is not None and previous[1] is base:
+                shards[c.id] = (previous[0], c)
+                continue
+            rev = _new_rev()
+            invalid = c.invalid_entries or self._invalid_entries.get(c.id, ())
+            payload = {"course_id": c.id, "rev": rev, "entries": [e.to_dict() for e in c.entries] + list(invalid)}
+            atomic_write(self._shard_path(c.id), json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8'))
+            shards[c.id] = (rev, c)
+
+        self._shards = shards
+        super()._commit(courses, course_id, removed, added, course)
+
+        for old_id in before.keys() - shards.keys():
+            self._invalid_entries.pop(old_id, None)
+            try:
+                os.remove(self._shard_path(old_id))
+            except FileNotFoundError:
+                pass
+        self._txn_courses = {c.id: c for c in courses}
+
+    def _encode(self, courses):
+        """Course 리스트 → 색인 bytes (과정 메타데이터 + 샤드 revision)"""
+        shards = self._shards
+        data = {
+            "version": INDEX_VERSION,
+            "courses": [{**c.to_dict(), "shard": shards[c.id][0]} for c in courses],
+        }
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
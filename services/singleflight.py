@@ -0,0 +1,70 @@
+"""
+동시 요청 합치기 (single-flight)
+
+같은 키(엔드포인트, 파라미터, 데이터 버전)의 계산이 진행 중이면 새 요청은 계산을
+다시 하지 않고 진행 중인 계산의 결과(또는 예외)를 함께 받습니다.
+계산이 끝나면 키는 바로 제거되므로 결과를 캐시하지는 않습니다.
+키에 데이터 버전이 들어가므로 쓰기 이후의 요청은 새 계산을 시작합니다.
+"""
+import threading
+
+from utils import metrics
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, name='default'):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """fn() 결과 반환 → (결과, 합쳐졌는지 여부)"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        endpoint = key[0] if isinstance(key, tuple) and key else self.name
+        if not leader:
+            metrics.incr('singleflight.coalesced', endpoint=endpoint)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        metrics.incr('singleflight.executed', endpoint=endpoint)
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+_default = SingleFlight()
+
+
+def do(key, fn):
+    return _default.do(key, fn)
+
+
+def in_flight():
+    return _default.in_flight()
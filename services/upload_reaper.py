@@ -0,0 +1,145 @@
+"""
+업로드 임시 파일 정리 (data/uploads)
+
+/api/sheets 는 업로드한 워크북을 UPLOAD_FOLDER 에 저장하고, /api/upload 가 성공해야 삭제합니다.
+업로드 창을 닫거나 파싱에 실패하면 파일이 그대로 남으므로, 백그라운드 스레드가 주기적으로
+  1. TTL   : UPLOAD_TTL 초보다 오래된 파일/디렉토리 삭제
+  2. quota : 남은 전체 크기가 UPLOAD_QUOTA_BYTES 를 넘으면 오래된 것부터 삭제
+            (방금 쓰인 항목과 IN_USE_MARKER 가 있는 작업 디렉토리는 진행 중인 요청이 쓰고 있으므로 제외)
+하고, 회수한 크기를 로그와 메트릭(uploads.reaped / uploads.reclaimed_bytes)으로 남깁니다.
+
+여러 워커가 동시에 정리해도 이미 지워진 항목은 건너뜁니다.
+"""
+import os
+import time
+import shutil
+import logging
+import threading
+
+from config import Config
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+IN_USE_GRACE = 60  # quota 초과 시에도 이 시간(초) 안에 수정된 항목은 삭제하지 않음
+# 작업 디렉토리(ZIP 일괄 등록)에 이 파일이 있으면 사용 중 → quota 로 삭제하지 않음
+# (추출이 끝난 뒤 파싱이 오래 걸리면 디렉토리 mtime 은 그대로라 IN_USE_GRACE 로는 보호되지 않음.
+#  비정상 종료로 남은 디렉토리는 TTL 로 정리)
+IN_USE_MARKER = '.in_use'
+
+_start_lock = threading.Lock()
+_started_pid = None
+
+
+def _entry_size(path):
+    """파일 크기 또는 디렉토리(ZIP 일괄 등록 작업 디렉토리) 전체 크기"""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _scan(folder):
+    """UPLOAD_FOLDER 항목 → [(mtime, 크기, 경로)] (오래된 순)"""
+    entries = []
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return entries
+    for name in names:
+        path = os.path.join(folder, name)
+        try:
+            entries.append((os.path.getmtime(path), _entry_size(path), path))
+        except OSError:  # 스캔 중 다른 요청/워커가 삭제
+            continue
+    entries.sort()
+    return entries
+
+
+def _in_use(path, mtime, now):
+    return now - mtime <= IN_USE_GRACE or os.path.exists(os.path.join(path, IN_USE_MARKER))
+
+
+def _remove(path):
+    try:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.warning("업로드 파일 삭제 실패: %s (%s)", path, e)
+        return False
+
+
+def sweep(now=None, folder=None, ttl=None, quota=None):
+    """한 번 정리 → {"removed", "reclaimed_bytes", "remaining_bytes"}"""
+    now = time.time() if now is None else now
+    folder = folder or Config.UPLOAD_FOLDER
+    ttl = Config.UPLOAD_TTL if ttl is None else ttl
+    quota = Config.UPLOAD_QUOTA_BYTES if quota is None else quota
+
+    started = time.perf_counter()
+    entries = _scan(folder)
+    remaining = sum(size for _, size, _ in entries)
+    reclaimed = {"ttl": [0, 0], "quota": [0, 0]}  # 이유 → [개수, 바이트]
+
+    for mtime, size, path in entries:
+        if ttl and now - mtime > ttl:
+            reason = "ttl"
+        elif quota and remaining > quota and not _in_use(path, mtime, now):
+            reason = "quota"
+        else:
+            continue
+        if _remove(path):
+            remaining -= size
+            reclaimed[reason][0] += 1
+            reclaimed[reason][1] += size
+
+    removed = sum(count for count, _ in reclaimed.values())
+    reclaimed_bytes = sum(size for _, size in reclaimed.values())
+    for reason, (count, size) in reclaimed.items():
+        if count:
+            metrics.incr('uploads.reaped', count, reason=reason)
+            metrics.incr('uploads.reclaimed_bytes', size, reason=reason)
+    metrics.observe('uploads.sweep', time.perf_counter() - started)
+
+    if removed:
+        logger.info(
+            "업로드 임시 파일 정리: %s개, %.1fMB 회수 (TTL %s개, quota %s개), 남은 크기 %.1fMB",
+            removed, reclaimed_bytes / 1024 / 1024, reclaimed['ttl'][0], reclaimed['quota'][0],
+            remaining / 1024 / 1024,
+        )
+    if quota and remaining > quota:
+        logger.warning("업로드 폴더가 quota 를 초과했습니다 (사용 중인 파일 제외): %.1fMB", remaining / 1024 / 1024)
+    return {"removed": removed, "reclaimed_bytes": reclaimed_bytes, "remaining_bytes": remaining}
+
+
+def _run(interval):
+    while True:
+        try:
+            sweep()
+        except Exception:
+            logger.exception("업로드 임시 파일 정리 실패")
+        time.sleep(interval)
+
+
+def start():
+    """백그라운드 정리 스레드 시작 (UPLOAD_REAPER_INTERVAL 이 0 이면 사용 안 함, 프로세스당 하나)"""
+    global _started_pid
+    interval = Config.UPLOAD_REAPER_INTERVAL
+    if not interval:
+        return
+    with _start_lock:
+        if _started_pid == os.getpid():
+            return
+        _started_pid = os.getpid()
+    threading.Thread(target=_run, args=(interval,), name='upload-reaper', daemon=True).start()
@@ -0,0 +1,91 @@
+"""
+시작 준비 (저장소 연결 + 과정 캐시 예열) 와 readiness 상태
+
+create_app() 이 start() 를 호출하면 백그라운드 스레드에서
+  1. storage : get_storage() - Cosmos 는 데이터베이스/컨테이너 확인 왕복, 로컬은 파일 확인
+  2. courses : get_snapshot() - 과정 목록을 읽어 캐시를 채움 (CachedStorage 스냅샷 / 로컬 파일 캐시)
+를 실행하고, /api/ready 는 끝났는지(200) 아닌지(503) 보고합니다.
+첫 요청이 이 비용을 치르지 않도록 하기 위한 것이며, 예열 중에 들어온 요청도 정상 처리됩니다.
+
+STARTUP_WARMUP 을 끄면 백그라운드 예열 없이 /api/ready 첫 호출이 같은 단계를 실행합니다.
+"""
+import os
+import time
+import logging
+import threading
+
+from config import Config
+from services.cosmos_service import get_storage
+from services.singleflight import SingleFlight
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+_flight = SingleFlight('warmup')
+_state = {"status": "pending", "pid": os.getpid()}
+
+
+def status():
+    """현재 준비 상태 dict (status: pending | warming | ready | failed)"""
+    state = _state
+    if state["pid"] != os.getpid() and state["status"] != "ready":
+        # fork 이전(gunicorn --preload)에 시작된 예열은 워커에 이어지지 않음 → 워커에서 다시 시작
+        _reset()
+        start()
+        state = _state
+    return {k: v for k, v in state.items() if k != "pid"}
+
+
+def is_ready():
+    return _state["status"] == "ready"
+
+
+def _reset():
+    global _state
+    _state = {"status": "pending", "pid": os.getpid()}
+
+
+def run():
+    """예열 실행 → 상태 dict (진행 중이면 그 결과를 기다리고, 이미 끝났으면 바로 반환)"""
+    if _state["status"] != "ready":
+        _flight.do('warmup', _warm)
+    return status()
+
+
+def start():
+    """백그라운드 예열 시작 (STARTUP_WARMUP 이 꺼져 있으면 아무것도 하지 않음)"""
+    if not Config.STARTUP_WARMUP or _state["status"] in ("warming", "ready"):
+        return
+    threading.Thread(target=run, name='startup-warmup', daemon=True).start()
+
+
+def _warm():
+    global _state
+    pid = os.getpid()
+    steps = {}
+    _state = {"status": "warming", "pid": pid, "steps": steps}
+    started = time.perf_counter()
+    try:
+        t = time.perf_counter()
+        storage = get_storage()
+        steps["storage_ms"] = round((time.perf_counter() - t) * 1000, 1)
+
+        t = time.perf_counter()
+        _, courses = storage.get_snapshot()
+        steps["courses_ms"] = round((time.perf_counter() - t) * 1000, 1)
+
+        duration = time.perf_counter() - started
+        _state = {
+            "status": "ready", "pid": pid, "steps": steps,
+            "duration_ms": round(duration * 1000, 1), "courses": len(courses),
+        }
+        logger.info("시작 준비 완료: %.0fms (과정 %s개)", duration * 1000, len(courses))
+    except Exception:
+        # 예외 내용(연결 문자열, 경로 등)은 /api/ready 응답에 싣지 않고 로그에만 남김
+        duration = time.perf_counter() - started
+        logger.exception("시작 준비 실패 (다음 /api/ready 호출 때 다시 시도)")
+        _state = {
+            "status": "failed", "pid": pid, "steps": steps,
+            "duration_ms": round(duration * 1000, 1),
+        }
+    metrics.observe('startup.warmup', duration, status=_state["status"])
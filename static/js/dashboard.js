@@ -474,6 +474,7 @@ function showEventModal(event) {
     // 삭제/수정용 ID 저장
     modal.dataset.courseId = props.course_id || '';
     modal.dataset.entryId = props.entry_id || '';
+    modal.dataset.etag = props.etag || '';
 
     // 삭제 버튼 표시/숨김 (entry_id가 있을 때만 삭제 가능)
     if (deleteBtn) {
@@ -810,9 +811,11 @@ async function submitEditEntry() {
     if (!className) { showToast('수업명을 입력해주세요.', 'error'); return; }
 
     try {
+        const headers = { 'Content-Type': 'application/json' };
+        if (modal.dataset.etag) headers['If-Match'] = modal.dataset.etag;
         const res = await fetch(`/api/courses/${courseId}/entries/${entryId}`, {
             method: 'PUT',
-            headers: { 'Content-Type': 'application/json' },
+            headers,
             body: JSON.stringify({
                 date,
                 class_name: className,
@@ -829,6 +832,10 @@ async function submitEditEntry() {
             calendar.refetchEvents();
         } else {
             showToast(data.error || '수정에 실패했습니다.', 'error');
+            if (res.status === 412) {
+                closeEditModal();
+                calendar.refetchEvents();
+            }
         }
     } catch (err) {
         showToast('수업 수정 중 오류가 발생했습니다.', 'error');
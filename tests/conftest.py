@@ -0,0 +1,59 @@
+"""
+pytest 공통 설정
+
+Config 는 import 시점에 환경변수를 읽으므로 앱을 import 하기 전에 데이터/로그 디렉토리를 임시 경로로 돌리고
+Cosmos 설정을 지워 로컬 JSON 저장소로 실행합니다.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+_TMP_ROOT = tempfile.mkdtemp(prefix='timetable-test-')
+os.environ['DATA_DIR'] = _TMP_ROOT
+os.environ['LOG_DIR'] = os.path.join(_TMP_ROOT, 'logs')
+for _name in ('COSMOS_DB_ENDPOINT', 'COSMOS_DB_KEY', 'LOCAL_STORAGE_FORMAT', 'ARCHIVE_AFTER_DAYS'):
+    os.environ.pop(_name, None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import create_app
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture
+def storage_file(tmp_path, monkeypatch):
+    """테스트마다 새 courses.json 을 쓰는 로컬 저장소 → 파일 경로"""
+    from services import cosmos_service
+    path = str(tmp_path / 'courses.json')
+    monkeypatch.setattr(cosmos_service, '_storage_instance', cosmos_service.LocalJsonStorage(filepath=path))
+    return path
+
+
+@pytest.fixture
+def client(app, storage_file):
+    return app.test_client()
+
+
+@pytest.fixture
+def storage(storage_file):
+    from services.cosmos_service import get_storage
+    return get_storage()
+
+
+@pytest.fixture
+def make_course(storage):
+    """make_course(course_id, entries, **fields) → 저장소에 과정 저장 (entries: dict 리스트)"""
+    def make(course_id, entries, **fields):
+        course = {"id": course_id, "type": "course", "name": fields.pop('name', course_id),
+                  "color": "#4A90D9", "file_name": "", "uploaded_at": "2025-01-01T00:00:00",
+                  "default_start_time": "09:00", "entry_count": len(entries), **fields}
+        storage.save_course(course, [dict(e) for e in entries])
+        return course
+    return make
@@ -0,0 +1,111 @@
+"""종료된 과정 보관 / 복원 왕복 테스트"""
+import pytest
+
+from benchmarks.fake_cosmos import FakeContainer
+from services import archive_service
+from services.archive_service import CosmosArchive, LocalArchive
+from services.cosmos_service import CosmosStorage
+
+
+def _entry(eid, day, is_holiday=False):
+    return {"id": eid, "date": day, "class_name": "휴강" if is_holiday else f"수업 {eid}",
+            "instructor": "" if is_holiday else "김민수", "hours": 8,
+            "start_time": "09:00", "end_time": "18:00", "is_holiday": is_holiday}
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    archive = LocalArchive(str(tmp_path / 'archive'))
+    monkeypatch.setattr(archive_service, '_archive_instance', archive)
+    return archive
+
+
+@pytest.fixture
+def courses(make_course):
+    make_course('old', [_entry('o1', '2020-03-02'), _entry('o2', '2020-03-03', is_holiday=True),
+                        _entry('o3', '2020-03-04')], name='지난 과정', color='#FF5733')
+    make_course('future', [_entry('f1', '2099-03-02')], name='진행 과정')
+    make_course('empty', [], name='빈 과정')
+
+
+def _snapshot(storage, course_id):
+    course = next(c for c in storage.get_all_courses() if c.id == course_id)
+    return course.to_dict(), sorted((e.to_dict() for e in course.entries), key=lambda e: e["id"])
+
+
+def _ids(client, path='/api/courses', **params):
+    return sorted(c["id"] for c in client.get(path, query_string=params).get_json()["courses"])
+
+
+def test_archive_and_restore_round_trip(client, storage, archive, courses):
+    before = _snapshot(storage, 'old')
+    resp = client.post('/api/courses/old/archive')
+    assert resp.status_code == 200
+    assert resp.get_json()["last_date"] == '2020-03-04'
+
+    # 평소 목록에서는 빠지고, 보관 목록 / include_archived 로만 보임
+    assert _ids(client) == ['empty', 'future']
+    listed = client.get('/api/archive').get_json()["courses"]
+    assert [(c["id"], c["name"], c["entry_count"], c["last_date"]) for c in listed] == [('old', '지난 과정', 3, '2020-03-04')]
+    assert _ids(client, include_archived=1) == ['empty', 'future', 'old']
+    events = client.get('/api/events', query_string={"include_archived": 1, "course_id": "old"}).get_json()
+    assert len(events) == 3
+    paged = client.get('/api/events', query_string={"include_archived": 1, "limit": 10}).get_json()["events"]
+    assert [(r["id"], r.get("archived", False)) for r in paged] == [
+        ('f1', False), ('o1', True), ('o2', True), ('o3', True)]
+
+    resp = client.post('/api/courses/old/restore')
+    assert resp.status_code == 200
+    assert resp.get_json()["course"]["entry_count"] == 3
+    assert _snapshot(storage, 'old') == before
+    assert client.get('/api/archive').get_json()["courses"] == []
+    assert client.post('/api/courses/old/restore').status_code == 404
+
+
+def test_sweep_moves_only_finished_courses(client, storage, archive, courses):
+    resp = client.post('/api/archive/sweep', json={"after_days": 30})
+    assert resp.get_json()["archived"] == ['old']  # 일정이 없는 과정, 진행 중인 과정은 그대로
+    assert _ids(client) == ['empty', 'future']
+
+    # 복원한 과정은 다시 자동 이동하지 않음
+    client.post('/api/courses/old/restore')
+    assert client.post('/api/archive/sweep', json={"after_days": 30}).get_json()["archived"] == []
+    assert _ids(client) == ['empty', 'future', 'old']
+
+    # 수동 보관 후 복원하면 다시 자동 이동 대상
+    client.post('/api/courses/old/archive')
+    assert archive.restored_ids() == set()
+
+
+def test_archive_conflicts_and_validation(client, storage, archive, courses):
+    assert client.post('/api/courses/missing/archive').status_code == 404
+    assert client.post('/api/courses/missing/restore').status_code == 404
+
+    # 이전 이동이 일부만 진행되어 양쪽에 있으면 보관본을 덮어쓰지 않음
+    archive.put(next(c for c in storage.get_all_courses() if c.id == 'future'))
+    assert client.post('/api/courses/future/archive').status_code == 409
+    # 복원은 저장소의 사본을 보관본으로 대체
+    assert client.post('/api/courses/future/restore').status_code == 200
+    assert _ids(client) == ['empty', 'future', 'old']
+    assert len([c for c in storage.get_all_courses() if c.id == 'future'][0].entries) == 1
+
+    assert client.post('/api/archive/sweep', json={}).status_code == 400  # ARCHIVE_AFTER_DAYS=0
+    assert client.post('/api/archive/sweep', json={"after_days": 0}).status_code == 400
+    assert client.post('/api/archive/sweep', json={"after_days": True}).status_code == 400
+
+
+def test_cosmos_archive_round_trip():
+    storage = CosmosStorage(container=FakeContainer())
+    archive = CosmosArchive(container=FakeContainer())
+    storage.save_course({"id": "old", "type": "course", "name": "지난 과정", "entry_count": 2},
+                        [_entry('o1', '2020-03-02'), _entry('o2', '2020-03-03', is_holiday=True)])
+    before = _snapshot(storage, 'old')
+
+    assert archive_service.sweep(storage, archive, after_days=30) == ['old']
+    assert storage.get_all_courses() == []
+    assert [(r.course.id, r.last_date) for r in archive.list()] == [('old', '2020-03-03')]
+    assert sorted(r["id"] for r in archive.query_entries()) == ['o1', 'o2']
+
+    assert archive_service.restore(storage, archive, 'old') is not None
+    assert _snapshot(storage, 'old') == before
+    assert archive.list() == [] and archive.restored_ids() == {'old'}
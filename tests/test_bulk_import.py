@@ -0,0 +1,107 @@
+"""ZIP 일괄 등록 테스트 (정상 등록, 경로 조작 / zip bomb 차단)"""
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from benchmarks.synthetic import generate_entries, write_vertex42_workbook
+from config import Config
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    folder = tmp_path / 'uploads'
+    folder.mkdir()
+    monkeypatch.setattr(Config, 'UPLOAD_FOLDER', str(folder))
+    return folder
+
+
+@pytest.fixture
+def workbook_bytes(tmp_path):
+    def make(n_entries, name='w.xlsx'):
+        path = tmp_path / name
+        write_vertex42_workbook(str(path), generate_entries(n_entries, holiday_rate=0))
+        return path.read_bytes()
+    return make
+
+
+def _zip(members, compression=zipfile.ZIP_DEFLATED):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _post(client, data, manifest=None):
+    form = {"file": (io.BytesIO(data), 'courses.zip')}
+    if manifest is not None:
+        form["manifest"] = json.dumps(manifest)
+    return client.post('/api/upload/bulk', data=form, content_type='multipart/form-data')
+
+
+def test_bulk_import_registers_each_workbook(client, upload_dir, workbook_bytes):
+    data = _zip({
+        'spring/a.xlsx': workbook_bytes(20, 'a.xlsx'),
+        'web/backend.xlsx': workbook_bytes(10, 'b.xlsx'),
+        'notes.txt': b'ignored',
+    })
+    resp = _post(client, data, manifest=[{"file": "a.xlsx", "course_name": "봄 과정", "color": "#FF5733"}])
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert (body["imported"], body["failed"], body["entry_count"]) == (2, 0, 30)
+    by_file = {f["file"]: f for f in body["files"]}
+    assert by_file['spring/a.xlsx']["course_name"] == '봄 과정'
+    assert by_file['web/backend.xlsx']["course_name"] == 'backend'
+
+    courses = {c["name"]: c for c in client.get('/api/courses').get_json()["courses"]}
+    assert courses['봄 과정']["entry_count"] == 20 and courses['봄 과정']["color"] == '#FF5733'
+    assert courses['backend']["entry_count"] == 10
+    assert os.listdir(upload_dir) == []  # ZIP 과 작업 디렉토리 정리
+
+
+@pytest.mark.parametrize('member', ['../evil.xlsx', 'a/../../evil.xlsx', '/abs/evil.xlsx', 'C:/evil.xlsx'])
+def test_path_traversal_is_rejected(client, upload_dir, workbook_bytes, member):
+    data = _zip({'python.xlsx': workbook_bytes(5), member: workbook_bytes(5)})
+    resp = _post(client, data)
+    assert resp.status_code == 400
+    assert '잘못된 파일 경로' in resp.get_json()["error"]
+    assert os.listdir(upload_dir) == []
+    assert not os.path.exists(upload_dir.parent / 'evil.xlsx')
+    assert client.get('/api/courses').get_json()["courses"] == []
+
+
+def test_zip_bomb_ratio_is_rejected(client, upload_dir):
+    data = _zip({'bomb.xlsx': b'\0' * (5 * 1024 * 1024)})
+    assert len(data) < 50 * 1024
+    resp = _post(client, data)
+    assert resp.status_code == 400
+    assert '압축률' in resp.get_json()["error"]
+    assert os.listdir(upload_dir) == []
+
+
+def test_uncompressed_size_limits(client, upload_dir, workbook_bytes, monkeypatch):
+    book = workbook_bytes(5)
+    monkeypatch.setattr(Config, 'BULK_MAX_MEMBER_SIZE', len(book) - 1)
+    assert '너무 큽니다' in _post(client, _zip({'a.xlsx': book}, zipfile.ZIP_STORED)).get_json()["error"]
+
+    monkeypatch.setattr(Config, 'BULK_MAX_MEMBER_SIZE', len(book) + 1)
+    monkeypatch.setattr(Config, 'BULK_MAX_TOTAL_SIZE', len(book) * 2)
+    resp = _post(client, _zip({'a.xlsx': book, 'b.xlsx': book, 'c.xlsx': book}, zipfile.ZIP_STORED))
+    assert resp.status_code == 400
+    assert '압축 해제 크기' in resp.get_json()["error"]
+
+
+def test_invalid_archive_and_files(client, upload_dir, workbook_bytes):
+    assert _post(client, b'not a zip').status_code == 400
+    assert _post(client, _zip({'readme.txt': b'x'})).status_code == 400
+
+    resp = _post(client, _zip({'python.xlsx': workbook_bytes(5), 'broken.xlsx': b'garbage', 'x.xlsx': workbook_bytes(5)}))
+    assert resp.status_code == 200
+    report = {f["file"]: f for f in resp.get_json()["files"]}
+    assert report['python.xlsx']["status"] == 'ok'
+    assert report['broken.xlsx']["status"] == 'error'
+    assert report['x.xlsx']["error"] == '과정명은 2자 이상 입력해주세요.'
+    assert resp.get_json()["imported"] == 1
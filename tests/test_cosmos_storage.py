@@ -0,0 +1,48 @@
+"""CosmosStorage 부분 수정(patch) 대체 / 일정 수정 조건 테스트 (인메모리 컨테이너)"""
+import pytest
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+from benchmarks.fake_cosmos import FakeContainer
+from services.cosmos_service import CosmosStorage, PreconditionFailedError
+
+COURSE = {"id": "c1", "type": "course", "name": "과정 1", "entry_count": 1}
+ENTRY = {"id": "e1", "date": "2025-03-03", "class_name": "수업", "hours": 8}
+
+
+@pytest.fixture
+def storage():
+    storage = CosmosStorage(container=FakeContainer())
+    storage.save_course(dict(COURSE), [dict(ENTRY)])
+    storage.save_course(dict(COURSE, id="c2", entry_count=0), [])
+    return storage
+
+
+def _raise(status):
+    def patch_item(*args, **kwargs):
+        raise CosmosHttpResponseError(status_code=status, message=f"status {status}")
+    return patch_item
+
+
+def test_patch_400_is_raised_and_keeps_patch_enabled(storage, monkeypatch):
+    monkeypatch.setattr(storage.container, 'patch_item', _raise(400))
+    with pytest.raises(CosmosHttpResponseError):
+        storage._adjust_entry_count('c1', 1)
+    assert storage._patch_supported is not False
+
+
+@pytest.mark.parametrize('status', [405, 501])
+def test_patch_unsupported_falls_back_to_replace(storage, monkeypatch, status):
+    monkeypatch.setattr(storage.container, 'patch_item', _raise(status))
+    storage._adjust_entry_count('c1', 1)
+    assert storage._patch_supported is False
+    assert storage.container.read_item(item='c1', partition_key='course')['entry_count'] == 2
+
+
+def test_update_entry_in_other_course_is_not_found_before_etag_check(storage):
+    assert storage.update_entry('c2', 'e1', {"class_name": "변경"}, if_match='"stale"') is False
+
+
+def test_update_entry_stale_etag(storage):
+    with pytest.raises(PreconditionFailedError):
+        storage.update_entry('c1', 'e1', {"class_name": "변경"}, if_match='"stale"')
+    assert storage.update_entry('c1', 'e1', {"class_name": "변경"})
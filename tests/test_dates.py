@@ -0,0 +1,60 @@
+"""날짜 검증 회귀 테스트 - 이전 버전이 저장한 잘못된 날짜, 존재하지 않는 날짜 입력"""
+import json
+
+import pytest
+
+LEGACY_COURSES = {
+    "courses": [{
+        "id": "legacy01",
+        "name": "레거시 과정",
+        "color": "#4A90D9",
+        "entries": [
+            {"id": "e1", "date": "2025-03-03", "class_name": "정상 수업", "instructor": "김강사",
+             "hours": 8, "start_time": "09:00", "end_time": "18:00"},
+            {"id": "e2", "date": "2025-02-30", "class_name": "없는 날짜", "hours": 8},
+            {"id": "e3", "date": "", "class_name": "빈 날짜", "hours": 8},
+        ],
+    }],
+}
+
+VALID_ENTRY = {"date": "2025-03-04", "class_name": "추가 수업", "hours": 4, "start_time": "09:00"}
+
+
+@pytest.fixture
+def legacy_client(client, storage_file):
+    with open(storage_file, 'w', encoding='utf-8') as f:
+        json.dump(LEGACY_COURSES, f, ensure_ascii=False)
+    return client
+
+
+def test_legacy_invalid_dates_do_not_break_lists(legacy_client):
+    resp = legacy_client.get('/api/courses')
+    assert resp.status_code == 200
+
+    resp = legacy_client.get('/api/events')
+    assert resp.status_code == 200
+    assert [e['id'] for e in resp.get_json()] == ['e1']
+
+
+def test_legacy_invalid_dates_survive_rewrite(legacy_client, storage_file):
+    resp = legacy_client.post('/api/courses/legacy01/entries', json=VALID_ENTRY)
+    assert resp.status_code == 200
+
+    with open(storage_file, encoding='utf-8') as f:
+        dates = sorted(e['date'] for e in json.load(f)['courses'][0]['entries'])
+    assert dates == ['', '2025-02-30', '2025-03-03', '2025-03-04']
+
+
+@pytest.mark.parametrize('bad_date', ['2025-02-30', '2025-13-01', '', '2025/03/04'])
+def test_add_entry_rejects_invalid_date(legacy_client, bad_date):
+    resp = legacy_client.post('/api/courses/legacy01/entries', json=dict(VALID_ENTRY, date=bad_date))
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize('bad_date', ['2025-02-30', '2025-04-31'])
+def test_update_entry_rejects_invalid_date(legacy_client, bad_date):
+    resp = legacy_client.put('/api/courses/legacy01/entries/e1', json=dict(VALID_ENTRY, date=bad_date))
+    assert resp.status_code == 400
+
+    resp = legacy_client.put('/api/courses/legacy01/entries/e1', json=VALID_ENTRY)
+    assert resp.status_code == 200
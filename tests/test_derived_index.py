@@ -0,0 +1,34 @@
+"""DerivedIndex 재구성 / 변경 알림 락 순서 테스트"""
+import json
+import threading
+
+from services.cosmos_service import LocalJsonStorage
+from services.derived_index import DerivedIndex, get_index
+
+
+class _CourseIds(DerivedIndex):
+    def _rebuild(self, courses):
+        self.ids = sorted(c.id for c in courses)
+
+
+def test_snapshot_is_read_outside_index_lock(tmp_path):
+    """get_snapshot 안의 쓰기(일정 ID 보정)가 알린 변경을 다른 스레드가 처리할 때 인덱스 락을 잡고 있지 않음"""
+    path = tmp_path / 'courses.json'
+    path.write_text(json.dumps({"courses": [
+        {"id": "c1", "name": "ID 없는 일정", "entries": [{"date": "2025-03-03", "class_name": "수업"}]},
+    ]}), encoding='utf-8')
+    storage = LocalJsonStorage(filepath=str(path))
+    storage._current_snapshot()  # 캐시만 채움 → get_data_version 은 그대로, get_snapshot 에서 ID 보정 쓰기
+    index = get_index(_CourseIds, storage)
+    acquired = []
+
+    def other_writer_listener(change):
+        # 같은 스레드면 RLock 재진입이 되므로 다른 스레드에서 인덱스 락을 잡아봄
+        t = threading.Thread(target=lambda: acquired.append(index._lock.acquire(timeout=1) and index._lock.release() is None))
+        t.start()
+        t.join()
+
+    storage.add_listener(other_writer_listener)
+    index.ensure_current()
+    assert acquired == [True]
+    assert index.ids == ['c1']
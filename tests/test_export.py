@@ -0,0 +1,65 @@
+"""엑셀 내보내기 테스트 (list 순서, vertex42 → 다시 파싱 round trip)"""
+import io
+
+import openpyxl
+import pytest
+
+from services.excel_parser import get_sheet_names, parse_timetable
+
+
+def _entry(eid, day, class_name, start_time='09:00', hours=8, instructor='김강사', is_holiday=False):
+    return {"id": eid, "date": day, "class_name": class_name, "instructor": instructor, "hours": hours,
+            "start_time": start_time, "end_time": "18:00", "is_holiday": is_holiday}
+
+
+def _list_rows(resp):
+    ws = openpyxl.load_workbook(io.BytesIO(resp.get_data()), read_only=True)['일정']
+    return [row for row in ws.iter_rows(min_row=2, values_only=True)]
+
+
+def test_list_export_merges_courses_in_date_order(client, make_course):
+    # 저장 순서가 날짜 순이 아닌 과정 포함
+    make_course('b', [_entry('b2', '2025-03-05', 'B2'), _entry('b1', '2025-03-03', 'B1', start_time='14:00')])
+    make_course('a', [_entry('a1', '2025-03-03', 'A1'), _entry('a2', '2025-03-04', 'A2'),
+                      _entry('a9', '2025-04-01', 'A9')])
+
+    resp = client.get('/api/export.xlsx?course_ids=a,b&end=2025-03-31')
+    assert resp.status_code == 200
+    rows = _list_rows(resp)
+    # (날짜, 요청한 과정 순서, 시작 시각) 순, 기간 밖(A9) 제외
+    assert [r[10] for r in rows] == ['a1', 'b1', 'a2', 'b2']
+    assert rows[0][1] == '월' and rows[0][2] == 'a'
+
+
+def test_export_rejects_bad_range(client, make_course):
+    make_course('a', [_entry('a1', '2025-03-03', 'A1')])
+    assert client.get('/api/export.xlsx?start=2025-03-10&end=2025-03-01').status_code == 400
+    assert client.get('/api/export.xlsx?layout=pdf').status_code == 400
+    assert client.get('/api/export.xlsx?course_ids=missing').status_code == 400
+
+
+def test_vertex42_export_round_trips_through_parser(client, make_course, tmp_path):
+    entries = [
+        _entry('e1', '2025-03-03', '파이썬 기초', hours=8, instructor='김민수'),
+        _entry('e2', '2025-03-04', '데이터 분석', instructor='이영희, 박철수', hours=4),
+        _entry('e3', '2025-03-05', '삼일절 대체공휴일', is_holiday=True, instructor=''),
+        _entry('e4', '2025-04-01', '머신러닝', hours=6),
+    ]
+    make_course('c1', entries, name='AI 과정')
+
+    resp = client.get('/api/export.xlsx?course_ids=c1&layout=vertex42')
+    assert resp.status_code == 200
+    path = tmp_path / 'export.xlsx'
+    path.write_bytes(resp.get_data())
+
+    sheets = get_sheet_names(str(path))
+    assert len(sheets) == 2  # 3월, 4월
+    parsed = sorted(parse_timetable(str(path), sheets), key=lambda e: e['date'])
+    assert [(e['date'], e['class_name'], e['is_holiday']) for e in parsed] == [
+        ('2025-03-03', '파이썬 기초', False),
+        ('2025-03-04', '데이터 분석', False),
+        ('2025-03-05', '삼일절 대체공휴일', True),
+        ('2025-04-01', '머신러닝', False),
+    ]
+    assert [e['hours'] for e in parsed if not e['is_holiday']] == [8, 4, 6]
+    assert [e['instructor'] for e in parsed[:2]] == ['김민수', '이영희,박철수']
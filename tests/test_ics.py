@@ -0,0 +1,69 @@
+"""iCalendar 구독 피드 테스트"""
+import pytest
+
+from services import ics_service
+
+
+def _entry(eid, day, class_name='파이썬 기초', instructor='김강사', **fields):
+    return {"id": eid, "date": day, "class_name": class_name, "instructor": instructor,
+            "hours": 8, "start_time": "09:00", "end_time": "18:00", "is_holiday": False, **fields}
+
+
+@pytest.fixture(autouse=True)
+def _clear_feed_cache():
+    ics_service._cache.clear()
+    yield
+    ics_service._cache.clear()
+
+
+def test_course_feed_lines_are_folded(client, make_course):
+    long_name = ' '.join(['아주 긴 수업명'] * 10)
+    make_course('c1', [_entry('e1', '2025-03-03', class_name=long_name)], name='파이썬 과정')
+
+    resp = client.get('/feeds/course/c1.ics')
+    assert resp.status_code == 200
+    assert resp.content_type.startswith('text/calendar')
+    body = resp.get_data()
+    lines = body.split(b'\r\n')
+    assert lines[0] == b'BEGIN:VCALENDAR' and lines[-2] == b'END:VCALENDAR'
+    assert all(len(line) <= 75 for line in lines)
+    # 접힌 줄(공백으로 시작)을 이으면 원래 SUMMARY 가 복원됨
+    unfolded = body.replace(b'\r\n ', b'').decode('utf-8')
+    assert f'SUMMARY:(김강사) {long_name}' in unfolded.split('\r\n')
+    assert 'DTSTART:20250303T000000Z' in unfolded  # 09:00 KST
+
+
+def test_course_feed_not_modified_on_matching_etag(client, make_course):
+    make_course('c1', [_entry('e1', '2025-03-03')])
+    first = client.get('/feeds/course/c1.ics')
+    etag = first.headers['ETag']
+    first.get_data()
+
+    resp = client.get('/feeds/course/c1.ics', headers={'If-None-Match': etag})
+    assert resp.status_code == 304
+    assert resp.headers['ETag'] == etag
+
+    client.put('/api/courses/c1/entries/e1', json={"date": "2025-03-04", "class_name": "변경"})
+    resp = client.get('/feeds/course/c1.ics', headers={'If-None-Match': etag})
+    assert resp.status_code == 200
+    assert resp.headers['ETag'] != etag
+
+
+def test_unknown_course_feed_is_404_and_not_cached(client, make_course):
+    make_course('c1', [_entry('e1', '2025-03-03')])
+    for i in range(5):
+        assert client.get(f'/feeds/course/missing{i}.ics').status_code == 404
+    assert len(ics_service._cache._items) == 0
+
+
+def test_unknown_instructor_gets_uncached_empty_calendar(client, make_course):
+    make_course('c1', [_entry('e1', '2025-03-03', instructor='김강사, 이강사')])
+
+    resp = client.get('/feeds/instructor/박강사.ics')
+    assert resp.status_code == 200
+    assert b'BEGIN:VEVENT' not in resp.get_data()
+    assert len(ics_service._cache._items) == 0
+
+    resp = client.get('/feeds/instructor/이강사.ics')
+    assert resp.get_data().count(b'BEGIN:VEVENT') == 1
+    assert len(ics_service._cache._items) == 1
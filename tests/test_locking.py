@@ -0,0 +1,30 @@
+"""atomic_write 권한 유지 테스트"""
+import os
+import stat
+import sys
+
+import pytest
+
+from services.locking import atomic_write
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='POSIX 권한 비트')
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path):
+    path = str(tmp_path / 'courses.json')
+    atomic_write(path, b'{}')
+    os.chmod(path, 0o640)
+    atomic_write(path, b'{"courses": []}')
+    assert _mode(path) == 0o640
+
+
+def test_atomic_write_new_file_uses_umask_default(tmp_path):
+    path = str(tmp_path / 'courses.json')
+    umask = os.umask(0)
+    os.umask(umask)
+    atomic_write(path, b'{}')
+    assert _mode(path) == 0o666 & ~umask
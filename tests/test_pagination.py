@@ -0,0 +1,85 @@
+"""목록 API keyset 페이지네이션 테스트 (cursor 이어 받기, fields, 잘못된 파라미터)"""
+import pytest
+
+from benchmarks.fake_cosmos import FakeContainer
+from services import cosmos_service, pagination
+from services.cosmos_service import CosmosStorage
+
+
+def _entry(eid, day):
+    return {"id": eid, "date": day, "class_name": f"수업 {eid}", "instructor": "김민수", "hours": 8,
+            "start_time": "09:00", "end_time": "18:00", "is_holiday": False}
+
+
+@pytest.fixture(params=['local', 'cosmos'])
+def api(request, client, monkeypatch):
+    """로컬 JSON / Cosmos(인메모리 컨테이너) 저장소 양쪽에서 같은 결과인지 확인"""
+    if request.param == 'cosmos':
+        monkeypatch.setattr(cosmos_service, '_storage_instance', CosmosStorage(container=FakeContainer()))
+    storage = cosmos_service.get_storage()
+    # 저장 순서와 ID 순서가 다르도록
+    for cid, eids in (('c3', ['e05', 'e01']), ('c1', ['e03']), ('c5', []), ('c2', ['e04', 'e02']), ('c4', [])):
+        course = {"id": cid, "type": "course", "name": f"과정 {cid}", "color": "#4A90D9", "file_name": "",
+                  "uploaded_at": "2025-01-01T00:00:00", "default_start_time": "09:00", "entry_count": len(eids)}
+        storage.save_course(course, [_entry(eid, '2025-03-03') for eid in eids])
+    return client
+
+
+def _walk(client, path, key, **params):
+    """next_cursor 를 따라 끝까지 → (페이지별 ID 리스트)"""
+    pages, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        body = client.get(path, query_string=query).get_json()
+        pages.append([r["id"] for r in body[key]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_course_pages_follow_id_order(api):
+    assert _walk(api, '/api/courses', 'courses', limit=2) == [['c1', 'c2'], ['c3', 'c4'], ['c5']]
+    # 정확히 나누어떨어지면 빈 마지막 페이지 없이 끝
+    assert _walk(api, '/api/courses', 'courses', limit=5) == [['c1', 'c2', 'c3', 'c4', 'c5']]
+
+
+def test_event_pages_and_course_filter(api):
+    assert _walk(api, '/api/events', 'events', limit=2) == [['e01', 'e02'], ['e03', 'e04'], ['e05']]
+    assert _walk(api, '/api/events', 'events', limit=1, course_id='c3') == [['e01'], ['e05']]
+
+
+def test_cursor_is_stable_across_inserts_and_deletes(api):
+    first = api.get('/api/courses', query_string={"limit": 2}).get_json()
+    storage = cosmos_service.get_storage()
+    storage.save_course({"id": "c0", "type": "course", "name": "앞에 추가", "entry_count": 0}, [])
+    storage.delete_course('c3')
+    second = api.get('/api/courses', query_string={"limit": 2, "cursor": first["next_cursor"]}).get_json()
+    # 앞 페이지 변경과 무관하게 c2 다음부터 이어짐
+    assert [r["id"] for r in second["courses"]] == ['c4', 'c5']
+    assert second["next_cursor"] is None
+
+
+def test_fields_projection(api):
+    body = api.get('/api/events', query_string={"limit": 1, "fields": "date,class_name"}).get_json()
+    assert body["events"] == [{"id": "e01", "course_id": "c3", "date": "2025-03-03", "class_name": "수업 e01"}]
+    body = api.get('/api/courses', query_string={"fields": "name,etag"}).get_json()
+    assert body["next_cursor"] is None and len(body["courses"]) == 5
+    assert set(body["courses"][0]) == {"id", "name", "etag"} and body["courses"][0]["etag"]
+
+
+@pytest.mark.parametrize('path, params', [
+    ('/api/courses', {"cursor": "not-a-cursor"}),
+    ('/api/courses', {"cursor": pagination.encode_cursor('events', 'e01')}),  # 다른 목록의 cursor
+    ('/api/events', {"cursor": pagination.encode_cursor('courses', 'c1')}),
+    ('/api/courses', {"limit": "ten"}),
+    ('/api/events', {"fields": "date,secret"}),
+])
+def test_invalid_parameters(api, path, params):
+    resp = api.get(path, query_string=params)
+    assert resp.status_code == 400
+    assert resp.get_json()["success"] is False
+
+
+def test_limit_is_clamped(api):
+    assert _walk(api, '/api/courses', 'courses', limit=0) == [['c1'], ['c2'], ['c3'], ['c4'], ['c5']]
+    assert len(api.get('/api/courses', query_string={"limit": 10**6}).get_json()["courses"]) == 5
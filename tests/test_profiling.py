@@ -0,0 +1,47 @@
+"""프로파일링 시크릿 검사 테스트"""
+import pytest
+from flask import Flask, jsonify
+
+from config import Config
+from utils import profiling
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setattr(Config, 'PROFILING_SECRET', 'abc')
+    monkeypatch.setattr(Config, 'PROFILING_SAMPLE_RATE', 0)
+    return 'abc'
+
+
+@pytest.fixture
+def profiled_client(secret, tmp_path, monkeypatch):
+    """init_profiling 훅을 등록한 작은 앱 (before_request 가 모든 요청에서 시크릿 검사)"""
+    monkeypatch.setattr(Config, 'PROFILE_DIR', str(tmp_path))
+    app = Flask(__name__)
+    profiling.init_profiling(app)
+
+    @app.route('/ping')
+    def ping():
+        return jsonify({"success": True})
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize('query', ['_profile=%ED%95%9C', '_profile=%C3%A9'])
+def test_non_ascii_query_token_is_not_authorized(profiled_client, query):
+    assert profiled_client.get(f'/ping?{query}').status_code == 200
+
+
+def test_non_ascii_header_token_is_not_authorized(profiled_client):
+    assert profiled_client.get('/ping', headers={'X-Profile': 'é'}).status_code == 200
+
+
+def test_valid_token_is_profiled(profiled_client, tmp_path):
+    assert profiled_client.get('/ping', headers={'X-Profile': 'abc'}).status_code == 200
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == '.prof']
+
+
+def test_metrics_rejects_non_ascii_token(client, secret):
+    assert client.get('/api/_metrics?_profile=%ED%95%9C').status_code == 404
+    assert client.get('/api/_metrics', headers={'X-Profile': 'é'}).status_code == 404
+    assert client.get('/api/_metrics', headers={'X-Profile': secret}).status_code == 200
@@ -0,0 +1,74 @@
+"""과정 횡단 리포트 수치 테스트 (손으로 계산한 값과 비교)"""
+import pytest
+
+
+def _entry(eid, day, instructor, hours, is_holiday=False):
+    return {"id": eid, "date": day, "class_name": "수업", "instructor": instructor, "hours": hours,
+            "start_time": "09:00", "end_time": "18:00", "is_holiday": is_holiday}
+
+
+@pytest.fixture
+def courses(make_course):
+    make_course('a', [
+        _entry('a1', '2025-03-03', '김민수', 8),
+        _entry('a2', '2025-03-04', '김민수, 이영희', 4),
+        _entry('a3', '2025-03-04', '이영희', 2),          # 같은 날 두 번째 수업
+        _entry('a4', '2025-03-05', '', 8, is_holiday=True),
+        _entry('a5', '2025-04-01', '이영희', 6),
+    ], name='A 과정')
+    make_course('b', [
+        _entry('b1', '2025-03-10', '김민수', 8),
+        _entry('b2', '2025-03-12', '김민수', 8),
+    ], name='B 과정')
+
+
+def _rows(client, kind, **params):
+    resp = client.get(f'/api/reports/{kind}', query_string=params)
+    assert resp.status_code == 200, resp.get_json()
+    return resp.get_json()["rows"]
+
+
+def test_instructor_hours(client, courses):
+    assert _rows(client, 'instructor-hours', group_by='total') == [
+        {"instructor": "김민수", "total": "total", "hours": 28.0, "classes": 4},
+        {"instructor": "이영희", "total": "total", "hours": 12.0, "classes": 3},
+    ]
+    assert _rows(client, 'instructor-hours') == [
+        {"instructor": "김민수", "month": "2025-03", "hours": 28.0, "classes": 4},
+        {"instructor": "이영희", "month": "2025-03", "hours": 6.0, "classes": 2},
+        {"instructor": "이영희", "month": "2025-04", "hours": 6.0, "classes": 1},
+    ]
+
+
+def test_utilization(client, courses):
+    # A: 3/3~4/1 평일 22일 중 수업일 3일 (3/4 두 수업은 1일, 휴일 제외) / B: 3/10~3/12 평일 3일 중 2일
+    assert _rows(client, 'utilization', group_by='course') == [
+        {"course": "A 과정", "course_id": "a", "class_days": 3, "capacity_days": 22,
+         "utilization": 0.1364, "active_courses": 1},
+        {"course": "B 과정", "course_id": "b", "class_days": 2, "capacity_days": 3,
+         "utilization": 0.6667, "active_courses": 1},
+    ]
+    assert _rows(client, 'utilization') == [
+        {"month": "2025-03", "class_days": 4, "capacity_days": 24, "utilization": 0.1667, "active_courses": 2},
+        {"month": "2025-04", "class_days": 1, "capacity_days": 1, "utilization": 1.0, "active_courses": 1},
+    ]
+    # 조회 범위로 과정 기간을 자름: A 3/10~4/1 평일 17일
+    assert _rows(client, 'utilization', group_by='total', start='2025-03-10') == [
+        {"total": "total", "class_days": 3, "capacity_days": 20, "utilization": 0.15, "active_courses": 2},
+    ]
+
+
+def test_holiday_density(client, courses):
+    assert _rows(client, 'holiday-density') == [
+        {"quarter": "2025-Q1", "holiday_entries": 1, "holiday_dates": 1, "total_entries": 6, "density": 0.1667},
+        {"quarter": "2025-Q2", "holiday_entries": 0, "holiday_dates": 0, "total_entries": 1, "density": 0.0},
+    ]
+
+
+def test_report_reflects_writes_and_validates(client, courses):
+    client.delete('/api/courses/b')
+    assert _rows(client, 'instructor-hours', group_by='total')[0]["hours"] == 12.0
+
+    assert client.get('/api/reports/unknown').status_code == 404
+    assert client.get('/api/reports/utilization?group_by=instructor').status_code == 400
+    assert client.get('/api/reports/utilization?start=2025-04-01&end=2025-03-01').status_code == 400
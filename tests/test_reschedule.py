@@ -0,0 +1,105 @@
+"""휴일 반영 일정 자동 조정 테스트 (next_free / shift 정책, plan_id 충돌)"""
+import pytest
+
+
+def _entry(eid, day, is_holiday=False):
+    return {"id": eid, "date": day, "class_name": "휴강" if is_holiday else f"수업 {eid}",
+            "instructor": "김민수", "hours": 8, "start_time": "09:00", "end_time": "18:00",
+            "is_holiday": is_holiday}
+
+
+@pytest.fixture
+def courses(make_course):
+    make_course('a', [
+        _entry('a1', '2025-03-03'),                  # 월
+        _entry('a2', '2025-03-04'),                  # 화 (막힌 날, 오전)
+        _entry('a3', '2025-03-04'),                  # 화 (막힌 날, 오후)
+        _entry('a4', '2025-03-05', is_holiday=True),  # 수 (기존 휴일)
+        _entry('a5', '2025-03-06'),                  # 목
+        _entry('a6', '2025-03-10'),                  # 다음 주 월
+    ], name='A 과정')
+    make_course('b', [_entry('b1', '2025-03-10')], name='B 과정')  # 막힌 날에 수업 없음
+
+
+def _dates(storage, course_id):
+    course = next(c for c in storage.get_all_courses() if c.id == course_id)
+    return {e.id: e.date for e in course.entries}
+
+
+def _moves(body):
+    return {m["entry_id"]: (m["from"], m["to"]) for c in body["courses"] for m in c["moves"]}
+
+
+def test_next_free_preview_does_not_write(client, storage, courses):
+    resp = client.post('/api/reschedule', json={"start": "2025-03-04"})
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["applied"] is False
+    assert [c["course_id"] for c in body["courses"]] == ['a']
+    # 수(휴일)·목(수업) 은 점유 → 같은 날 두 수업이 함께 금요일로
+    assert _moves(body) == {'a2': ('2025-03-04', '2025-03-07'), 'a3': ('2025-03-04', '2025-03-07')}
+    assert _dates(storage, 'a')['a2'] == '2025-03-04'
+
+
+def test_next_free_apply(client, storage, courses):
+    body = client.post('/api/reschedule', json={"start": "2025-03-04", "apply": True}).get_json()
+    assert body["success"] is True and body["courses"][0]["status"] == 'applied'
+    assert _dates(storage, 'a') == {'a1': '2025-03-03', 'a2': '2025-03-07', 'a3': '2025-03-07',
+                                    'a4': '2025-03-05', 'a5': '2025-03-06', 'a6': '2025-03-10'}
+    assert _dates(storage, 'b') == {'b1': '2025-03-10'}
+
+
+def test_shift_keeps_order_and_appends_after_last_class(client, storage, courses):
+    body = client.post('/api/reschedule', json={"start": "2025-03-04", "policy": "shift", "apply": True}).get_json()
+    assert body["success"] is True
+    assert _moves(body) == {
+        'a2': ('2025-03-04', '2025-03-06'), 'a3': ('2025-03-04', '2025-03-06'),
+        'a5': ('2025-03-06', '2025-03-10'),
+        'a6': ('2025-03-10', '2025-03-11'),
+    }
+    # 막힌 날 이전 수업과 휴일은 그대로
+    assert _dates(storage, 'a') == {'a1': '2025-03-03', 'a2': '2025-03-06', 'a3': '2025-03-06',
+                                    'a4': '2025-03-05', 'a5': '2025-03-10', 'a6': '2025-03-11'}
+
+
+def test_range_and_course_filter(client, courses):
+    body = client.post('/api/reschedule', json={
+        "start": "2025-03-06", "end": "2025-03-10", "course_ids": ['a', 'b']}).get_json()
+    # a: 목·월 수업 → 막힌 구간(주말 포함) 뒤 첫 빈 평일 화·수
+    assert _moves(body) == {'a5': ('2025-03-06', '2025-03-11'), 'a6': ('2025-03-10', '2025-03-12'),
+                            'b1': ('2025-03-10', '2025-03-11')}
+    only_b = client.post('/api/reschedule', json={"start": "2025-03-06", "end": "2025-03-10",
+                                                  "course_ids": ['b']}).get_json()
+    assert [c["course_id"] for c in only_b["courses"]] == ['b']
+
+
+def test_stale_plan_id_is_rejected(client, storage, courses):
+    preview = client.post('/api/reschedule', json={"start": "2025-03-04"}).get_json()
+    # 같은 요청이면 plan_id 도 같음
+    again = client.post('/api/reschedule', json={"start": "2025-03-04"}).get_json()
+    assert again["plan_id"] == preview["plan_id"]
+
+    resp = client.put('/api/courses/a/entries/a2', json={"date": "2025-03-04", "class_name": "변경된 수업"})
+    assert resp.status_code == 200
+    resp = client.post('/api/reschedule', json={"start": "2025-03-04", "apply": True,
+                                                "plan_id": preview["plan_id"]})
+    assert resp.status_code == 409
+    body = resp.get_json()
+    assert body["applied"] is False and body["plan_id"] != preview["plan_id"]
+    assert _dates(storage, 'a')['a2'] == '2025-03-04'
+
+    resp = client.post('/api/reschedule', json={"start": "2025-03-04", "apply": True, "plan_id": body["plan_id"]})
+    assert resp.status_code == 200 and resp.get_json()["success"] is True
+    assert _dates(storage, 'a')['a2'] == '2025-03-07'
+
+
+@pytest.mark.parametrize('payload', [
+    {},
+    {"start": "2025-13-01"},
+    {"start": "2025-03-10", "end": "2025-03-04"},
+    {"start": "2025-03-01", "end": "2025-04-30"},
+    {"start": "2025-03-04", "policy": "random"},
+    {"start": "2025-03-04", "course_ids": "a"},
+])
+def test_invalid_request(client, courses, payload):
+    assert client.post('/api/reschedule', json=payload).status_code == 400
@@ -0,0 +1,90 @@
+"""수업 검색 테스트 (순위, 쓰기 후 증분 갱신)"""
+import pytest
+
+from services.search_index import SearchIndex
+
+
+def _entry(eid, day, class_name, instructor='김민수', is_holiday=False):
+    return {"id": eid, "date": day, "class_name": class_name, "instructor": instructor, "hours": 8,
+            "start_time": "09:00", "end_time": "18:00", "is_holiday": is_holiday}
+
+
+@pytest.fixture
+def courses(make_course):
+    make_course('py', [
+        _entry('p1', '2025-03-04', '심화 파이썬'),
+        _entry('p2', '2025-03-03', '파이썬 기초'),
+        _entry('p3', '2025-03-05', '데이터 분석', instructor='이영희, 박철수'),
+    ], name='파이썬 과정')
+    make_course('web', [
+        _entry('w1', '2025-03-03', '웹 개발', instructor='박철수'),
+        _entry('w2', '2025-03-06', '파이썬 휴강', is_holiday=True),
+    ], name='웹 과정')
+
+
+@pytest.fixture
+def rebuilds(monkeypatch):
+    calls = []
+    original = SearchIndex._rebuild
+
+    def counting(self, courses):
+        calls.append(len(courses))
+        return original(self, courses)
+
+    monkeypatch.setattr(SearchIndex, '_rebuild', counting)
+    return calls
+
+
+def _search(client, q, **params):
+    resp = client.get('/api/search', query_string={"q": q, **params})
+    assert resp.status_code == 200
+    return resp.get_json()
+
+
+def test_ranking_prefers_class_name_prefix_then_substring_then_course_name(client, courses):
+    result = _search(client, '파이썬')
+    ids = [r["id"] for r in result["results"]]
+    # 수업명 접두(3) → 수업명 포함(2) = 휴일인 접두(3-1, 동점은 날짜 순) → 과정명만 일치(1)
+    assert ids == ['p2', 'p1', 'w2', 'p3']
+    assert [r["score"] for r in result["results"]] == [3, 2, 2, 1]
+    assert result["total"] == 4
+    assert {c["course_id"]: c["count"] for c in result["courses"]} == {"py": 3, "web": 1}
+
+
+def test_instructor_and_multi_term_queries(client, courses):
+    assert [r["id"] for r in _search(client, '박철수')["results"]] == ['w1', 'p3']
+    # 두 검색어: 수업명(분석) + 강사(이영희)
+    assert [r["id"] for r in _search(client, '분석 이영희')["results"]] == ['p3']
+    assert _search(client, '없는수업')["total"] == 0
+    assert [r["id"] for r in _search(client, '파이썬', course_id='web')["results"]] == ['w2']
+    assert client.get('/api/search?q=%20').status_code == 400
+
+
+def test_paging(client, courses):
+    first = _search(client, '파이썬', per_page=2)
+    second = _search(client, '파이썬', per_page=2, page=2)
+    assert [r["id"] for r in first["results"] + second["results"]] == ['p2', 'p1', 'w2', 'p3']
+
+
+def test_index_updates_incrementally_after_writes(client, courses, rebuilds):
+    assert _search(client, '머신러닝')["total"] == 0
+    assert rebuilds == [2]
+
+    resp = client.post('/api/courses/web/entries', json={"date": "2025-03-07", "class_name": "머신러닝 입문"})
+    new_id = resp.get_json()["entry_id"]
+    assert [r["id"] for r in _search(client, '머신러닝')["results"]] == [new_id]
+
+    client.put(f'/api/courses/web/entries/{new_id}', json={"date": "2025-03-07", "class_name": "딥러닝 입문"})
+    assert _search(client, '머신러닝')["total"] == 0
+    assert [r["id"] for r in _search(client, '딥러닝')["results"]] == [new_id]
+
+    client.delete(f'/api/courses/web/entries/{new_id}')
+    assert _search(client, '딥러닝')["total"] == 0
+
+    client.put('/api/courses/web', json={"name": "머신러닝 과정"})
+    assert {r["id"] for r in _search(client, '머신러닝')["results"]} == {'w1', 'w2'}
+
+    client.delete('/api/courses/py')
+    assert _search(client, '심화')["total"] == 0
+
+    assert rebuilds == [2]  # 모두 변경 알림으로 반영 (전체 재구성 없음)
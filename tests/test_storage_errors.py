@@ -0,0 +1,35 @@
+"""손상된 로컬 저장 파일 → 500 (파서 메시지 비노출) 테스트"""
+import json
+import os
+
+import pytest
+
+from services.cosmos_service import StorageCorruptedError
+from services.sharded_storage import ShardedJsonStorage
+
+
+def test_corrupt_courses_json_is_500_without_parser_message(client, storage_file):
+    with open(storage_file, 'w', encoding='utf-8') as f:
+        f.write('{"courses": [')
+
+    for url in ('/api/courses', '/api/export.xlsx'):
+        resp = client.get(url)
+        assert resp.status_code == 500
+        body = resp.get_data(as_text=True)
+        assert 'Expecting' not in body and 'courses.json' not in body
+
+
+def test_corrupt_shard_index_and_shard_raise_storage_error(tmp_path):
+    index = tmp_path / 'courses' / 'index.json'
+    storage = ShardedJsonStorage(filepath=str(index))
+    storage.save_course({"id": "c1", "name": "과정"}, [{"id": "e1", "date": "2025-03-03", "class_name": "수업"}])
+
+    shard = next(p for p in index.parent.iterdir() if not p.name.startswith('index.json'))
+    shard.write_text('not json', encoding='utf-8')
+    with pytest.raises(StorageCorruptedError):
+        ShardedJsonStorage(filepath=str(index)).get_all_courses()[0].entries
+
+    index.write_text(json.dumps({"version": -1, "courses": []}), encoding='utf-8')
+    os.utime(index, ns=(1, 1))
+    with pytest.raises(StorageCorruptedError):
+        ShardedJsonStorage(filepath=str(index)).get_all_courses()
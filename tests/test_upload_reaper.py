@@ -0,0 +1,40 @@
+"""업로드 임시 파일 정리 테스트"""
+import os
+
+from services import upload_reaper
+
+
+def _make(path, size, mtime):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_ttl_and_quota(tmp_path):
+    now = 1_000_000
+    _make(tmp_path / 'expired.xlsx', 10, now - 7200)
+    _make(tmp_path / 'old.xlsx', 100, now - 600)
+    _make(tmp_path / 'fresh.xlsx', 100, now - 5)
+
+    result = upload_reaper.sweep(now=now, folder=str(tmp_path), ttl=3600, quota=150)
+    assert sorted(os.listdir(tmp_path)) == ['fresh.xlsx']
+    assert result == {"removed": 2, "reclaimed_bytes": 110, "remaining_bytes": 100}
+
+
+def test_quota_skips_work_dir_in_use(tmp_path):
+    now = 1_000_000
+    busy = tmp_path / 'bulk_busy'
+    idle = tmp_path / 'bulk_idle'
+    for work_dir in (busy, idle):
+        work_dir.mkdir()
+        _make(work_dir / '000.xlsx', 100, now - 600)
+    (busy / upload_reaper.IN_USE_MARKER).touch()
+    for work_dir in (busy, idle):
+        os.utime(work_dir, (now - 600, now - 600))  # 추출이 끝난 뒤 오래 파싱 중
+
+    upload_reaper.sweep(now=now, folder=str(tmp_path), ttl=3600, quota=50)
+    assert os.listdir(tmp_path) == ['bulk_busy']
+
+    # 비정상 종료로 남은 표시는 TTL 로 정리
+    upload_reaper.sweep(now=now + 3600, folder=str(tmp_path), ttl=3600, quota=50)
+    assert os.listdir(tmp_path) == []
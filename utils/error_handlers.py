@@ -1,6 +1,7 @@
 import logging
 from functools import wraps
 from flask import jsonify
+from services.cosmos_service import StorageCorruptedError
 
 logger = logging.getLogger(__name__)
 
@@ -11,13 +12,16 @@ def handle_errors(f):
     def decorated(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except StorageCorruptedError:
+            # 파일 경로·파서 메시지는 로그에만 (저장소에서 이미 기록)
+            return jsonify({"success": False, "error": "서버 내부 오류가 발생했습니다."}), 500
         except FileNotFoundError as e:
-            logger.warning(f"파일을 찾을 수 없음: {e}")
+            logger.warning("파일을 찾을 수 없음: %s", e)
             return jsonify({"success": False, "error": "파일을 찾을 수 없습니다."}), 404
         except ValueError as e:
-            logger.warning(f"잘못된 값: {e}")
+            logger.warning("잘못된 값: %s", e)
             return jsonify({"success": False, "error": str(e)}), 400
         except Exception as e:
-            logger.error(f"서버 오류: {e}", exc_info=True)
+            logger.error("서버 오류: %s", e, exc_info=True)
             return jsonify({"success": False, "error": "서버 내부 오류가 발생했습니다."}), 500
     return decorated
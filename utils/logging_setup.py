@@ -0,0 +1,156 @@
+"""
+로깅 설정 (QueueHandler → 백그라운드 QueueListener)
+
+요청 스레드는 로그 레코드를 큐에 넣기만 하고, 파일/콘솔 쓰기는 리스너 스레드가 합니다.
+  - LOG_DIR/app.jsonl : JSON Lines (RotatingFileHandler, LOG_MAX_BYTES × LOG_BACKUP_COUNT)
+      {"ts", "level", "logger", "message", "request_id", "method", "path", "status", "duration_ms", "exc"}
+  - 콘솔 : 사람이 읽는 한 줄 형식 (App Service 로그 스트림)
+
+요청마다 request_id (X-Request-ID 헤더를 받거나 새로 생성, 응답 헤더로 반환)를 붙이고,
+요청이 끝나면 소요시간을 담은 access 로그를 하나 남깁니다.
+
+로그 호출은 logger.info("... %s", value) 처럼 인자를 넘겨, 꺼진 레벨에서는 포맷 비용이 들지 않게 합니다.
+여러 워커가 같은 파일에 이어 쓰며, 회전은 워커별로 일어나므로 회전 직후 잠시 이전 파일에 쓰일 수 있습니다.
+"""
+import os
+import re
+import json
+import time
+import uuid
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from flask import g, has_request_context, request
+from config import Config
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+_REQUEST_ID_RE = re.compile(r'^[\w.\-]{1,64}$')
+_EXTRA_FIELDS = ('method', 'path', 'status', 'duration_ms')
+
+access_logger = logging.getLogger('access')
+
+_setup_lock = threading.Lock()
+_listener = None
+
+
+class JsonLineFormatter(logging.Formatter):
+    """LogRecord → JSON 한 줄"""
+
+    def format(self, record):
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            data["request_id"] = request_id
+        for key in _EXTRA_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _RequestQueueHandler(QueueHandler):
+    """요청 스레드에서 request_id 를 붙이고 큐에 넣음 (fork 된 워커에서는 리스너를 다시 시작)"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._pid = os.getpid()
+
+    def prepare(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id') if has_request_context() else None
+        # 메시지 포맷은 여기서 (인자 객체가 다른 스레드에서 바뀌기 전에), 파일 형식 변환은 리스너에서
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            # gunicorn --preload: fork 이전에 시작된 리스너 스레드는 워커에 없음
+            self._pid = os.getpid()
+            _restart_listener()
+        super().emit(record)
+
+
+def _build_handlers():
+    os.makedirs(Config.LOG_DIR, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        os.path.join(Config.LOG_DIR, 'app.jsonl'),
+        maxBytes=Config.LOG_MAX_BYTES, backupCount=Config.LOG_BACKUP_COUNT, encoding='utf-8',
+    )
+    file_handler.setFormatter(JsonLineFormatter())
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+    return file_handler, console
+
+
+def _restart_listener():
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener = QueueListener(_listener.queue, *_listener.handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def _stop_listener():
+    with _setup_lock:
+        if _listener is not None and _listener._thread is not None:
+            _listener.stop()  # 큐에 남은 레코드까지 기록
+
+
+def configure():
+    """루트 로거를 큐 핸들러로 설정하고 리스너 시작 (프로세스당 한 번)"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+        _listener.start()
+
+        root = logging.getLogger()
+        root.setLevel(Config.LOG_LEVEL)
+        root.addHandler(_RequestQueueHandler(log_queue))
+        atexit.register(_stop_listener)
+
+
+def init_logging(app):
+    """로깅 설정 + 요청 ID / access 로그 훅 등록"""
+    configure()
+
+    @app.before_request
+    def _start_request():
+        incoming = request.headers.get(REQUEST_ID_HEADER, '')
+        g.request_id = incoming if _REQUEST_ID_RE.match(incoming) else uuid.uuid4().hex[:16]
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _log_request(response):
+        request_id = g.get('request_id')
+        if request_id:
+            response.headers[REQUEST_ID_HEADER] = request_id
+        started = g.get('request_started')
+        if started is not None and not request.path.startswith('/static/') and access_logger.isEnabledFor(logging.INFO):
+            duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            access_logger.info(
+                "%s %s %s %.1fms", request.method, request.path, response.status_code, duration_ms,
+                extra={"method": request.method, "path": request.path,
+                       "status": response.status_code, "duration_ms": duration_ms},
+            )
+        return response
@@ -0,0 +1,47 @@
+"""
+프로세스 내 경량 메트릭 (카운터 / 소요시간 합계)
+
+이름과 라벨로 구분되는 카운터를 스레드 안전하게 누적하며, /api/_metrics 로 조회합니다.
+값은 프로세스(워커)별이며 재시작 시 초기화됩니다.
+"""
+import threading
+import time
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(float)   # (이름, 라벨) → 값
+_started = time.time()
+
+
+def _label_key(labels):
+    return ','.join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
+def incr(name, value=1, **labels):
+    """카운터 증가 (예: incr('singleflight.coalesced', endpoint='events'))"""
+    key = (name, _label_key(labels))
+    with _lock:
+        _counters[key] += value
+
+
+def observe(name, seconds, **labels):
+    """소요시간 누적 → <name>.count / <name>.seconds"""
+    label = _label_key(labels)
+    with _lock:
+        _counters[(f"{name}.count", label)] += 1
+        _counters[(f"{name}.seconds", label)] += seconds
+
+
+def snapshot():
+    """{이름: {라벨: 값}} (라벨이 없으면 키는 '')"""
+    result = defaultdict(dict)
+    with _lock:
+        items = list(_counters.items())
+    for (name, label), value in sorted(items):
+        result[name][label] = int(value) if float(value).is_integer() else round(value, 6)
+    return {"uptime_seconds": round(time.time() - _started, 1), "metrics": dict(result)}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
@@ -0,0 +1,132 @@
+"""
+요청 단위 프로파일링 훅 (cProfile)
+
+Config.PROFILING_ENABLED 일 때만 동작하며, 다음 두 경우에 요청을 프로파일링합니다.
+  - 시크릿 토큰 전달: 헤더 `X-Profile: <PROFILING_SECRET>` 또는 쿼리 `?_profile=<PROFILING_SECRET>`
+  - 샘플링: Config.PROFILING_SAMPLE_RATE 확률 (예: 0.01 = 요청의 1%)
+
+결과는 Config.PROFILE_DIR 에 `<시각>_<메서드>_<라우트>_<소요ms>ms.prof` 형식으로 저장됩니다.
+"""
+import io
+import os
+import re
+import hmac
+import time
+import random
+import pstats
+import cProfile
+import logging
+from datetime import datetime
+from flask import g, request
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_QUERY_PARAM = '_profile'
+PROFILE_NAME_RE = re.compile(r'^[\w.\-]+\.prof$')
+
+# 프로파일링 대상에서 제외할 경로
+_EXCLUDED_PREFIXES = ('/static/', '/api/_profiles')
+
+
+def is_authorized():
+    """요청에 올바른 프로파일링 시크릿이 포함되어 있는지 확인"""
+    secret = Config.PROFILING_SECRET
+    if not secret:
+        return False
+    token = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_PARAM)
+    # str 끼리는 ASCII 만 비교 가능 (비 ASCII 토큰이면 TypeError) → bytes 로 비교
+    return bool(token) and hmac.compare_digest(token.encode('utf-8'), secret.encode('utf-8'))
+
+
+def _should_profile():
+    if request.path.startswith(_EXCLUDED_PREFIXES):
+        return False
+    if is_authorized():
+        return True
+    rate = Config.PROFILING_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+def _route_label():
+    rule = request.url_rule.rule if request.url_rule else request.path
+    return re.sub(r'[^\w]+', '_', rule).strip('_') or 'root'
+
+
+def _prune_profiles():
+    """오래된 프로파일 파일 정리 (최근 PROFILE_KEEP 개만 유지)"""
+    names = sorted(n for n in os.listdir(Config.PROFILE_DIR) if PROFILE_NAME_RE.match(n))
+    for name in names[:max(0, len(names) - Config.PROFILE_KEEP)]:
+        try:
+            os.remove(os.path.join(Config.PROFILE_DIR, name))
+        except OSError:
+            pass
+
+
+def _save_profile(profiler, elapsed_ms):
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    name = f"{timestamp}_{request.method}_{_route_label()}_{int(elapsed_ms)}ms.prof"
+    path = os.path.join(Config.PROFILE_DIR, name)
+    try:
+        profiler.dump_stats(path)
+        _prune_profiles()
+        logger.info("프로파일 저장: %s (%.1fms)", name, elapsed_ms)
+    except OSError as e:
+        logger.warning("프로파일 저장 실패: %s", e)
+
+
+def init_profiling(app):
+    """Flask 앱에 프로파일링 훅 등록"""
+    os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+
+    @app.before_request
+    def _start_profiler():
+        if not _should_profile():
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 스레드에서 프로파일러가 이미 동작 중 (Python 3.12+ 는 동시에 하나만 허용)
+            return
+        g._profiler = profiler
+        g._profile_started = time.perf_counter()
+
+    @app.teardown_request
+    def _stop_profiler(exc):
+        profiler = g.pop('_profiler', None)
+        if profiler is None:
+            return
+        profiler.disable()
+        elapsed_ms = (time.perf_counter() - g.pop('_profile_started')) * 1000
+        _save_profile(profiler, elapsed_ms)
+
+    logger.info("요청 프로파일링 활성화 (샘플링 비율: %s)", Config.PROFILING_SAMPLE_RATE)
+
+
+def list_profiles(limit=50):
+    """최근 프로파일 목록 (최신순)"""
+    if not os.path.isdir(Config.PROFILE_DIR):
+        return []
+    names = sorted(
+        (n for n in os.listdir(Config.PROFILE_DIR) if PROFILE_NAME_RE.match(n)),
+        reverse=True,
+    )[:limit]
+    profiles = []
+    for name in names:
+        stat = os.stat(os.path.join(Config.PROFILE_DIR, name))
+        profiles.append({
+            "name": name,
+            "size": stat.st_size,
+            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        })
+    return profiles
+
+
+def render_profile_text(name, sort_by='cumulative', limit=50):
+    """프로파일 파일을 pstats 텍스트 요약으로 변환"""
+    buf = io.StringIO()
+    stats = pstats.Stats(os.path.join(Config.PROFILE_DIR, name), stream=buf)
+    stats.sort_stats(sort_by).print_stats(limit)
+    return buf.getvalue()